@@ -1,3 +1,4 @@
+import hashlib
 import os
 import pathlib
 
@@ -15,14 +16,31 @@ LINT_DEPENDENCIES = [
 SRC_DIR = "src/tuicubserver"
 REPO_ROOT = pathlib.Path(os.path.dirname(__file__)).resolve()
 REPORTS_OUTPUT_DIR = REPO_ROOT / "reports"
+COLLECT_COVERAGE = bool(os.environ.get("CI_COVERAGE"))
 
 nox.options.sessions = ["test"]
+nox.options.reuse_existing_virtualenvs = True
+
+
+def install(session: nox.Session, *packages: str) -> None:
+    """Install all packages, unless the same set was installed into the venv before.
+
+    The set is keyed by the requirements and the contents of pyproject.toml.
+    """
+    digest = hashlib.sha256((REPO_ROOT / "pyproject.toml").read_bytes())
+    digest.update("\0".join(packages).encode())
+    marker = pathlib.Path(session.virtualenv.location) / ".install_cache"
+    if marker.exists() and marker.read_text() == digest.hexdigest():
+        session.log("Dependencies unchanged, skipping install.")
+        return
+
+    session.install("-e", ".", *packages)
+    marker.write_text(digest.hexdigest())
 
 
 @nox.session(python=PYTHON_DEFAULT_VERSION)
 def test(session: nox.Session) -> None:
-    session.install("-e", ".")
-    session.install("pytest", "pytest-asyncio")
+    install(session, "pytest", "pytest-asyncio")
     session.run("pytest", "tests/")
 
 
@@ -30,23 +48,29 @@ def test(session: nox.Session) -> None:
 def ci(session: nox.Session) -> None:
     REPORTS_OUTPUT_DIR.mkdir(exist_ok=True)
 
-    session.install("-e", ".")
-    session.install("pytest", "pytest-asyncio", "pytest-cov", "coverage[toml]")
-    session.install(*LINT_DEPENDENCIES)
+    coverage_dependencies = ["pytest-cov", "coverage[toml]"] if COLLECT_COVERAGE else []
+    install(
+        session, "pytest", "pytest-asyncio", *coverage_dependencies, *LINT_DEPENDENCIES
+    )
 
     # Tests
+    coverage_args = (
+        ["--cov=src.tuicubserver", "--cov-report=term-missing"]
+        if COLLECT_COVERAGE
+        else []
+    )
     session.run(
         "pytest",
         "--junit-xml",
         str(REPORTS_OUTPUT_DIR / "test.xml"),
-        "--cov=src.tuicubserver",
-        "--cov-report=term-missing",
-        "tests/"
+        *coverage_args,
+        "tests/",
     )
 
     # Coverage
-    session.run("coverage", "xml", "-o", str(REPORTS_OUTPUT_DIR / "coverage.xml"))
-    session.run("coverage", "erase")
+    if COLLECT_COVERAGE:
+        session.run("coverage", "xml", "-o", str(REPORTS_OUTPUT_DIR / "coverage.xml"))
+        session.run("coverage", "erase")
 
     # Linting
     session.run(
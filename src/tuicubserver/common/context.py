@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from functools import wraps
 from typing import TYPE_CHECKING, Concatenate, ParamSpec, TypeVar
 from uuid import uuid4
 
@@ -45,7 +46,7 @@ class BaseContext:
         """Create a new decorator for api endpoints.
 
         The decorator injects a request context to the endpoint function.
-        The context contains a database session, which is commited and flushed
+        The context contains a database session, which is commited
         after calling the endpoint function.
 
         Args:
@@ -59,9 +60,10 @@ class BaseContext:
         def with_context(
             func: Callable[Concatenate[BaseContext, _P], _T]
         ) -> Callable[_P, _T]:
+            @wraps(func)
             def wrapped(*args: _P.args, **kwds: _P.kwargs) -> _T:
                 logger.bind_contextvars(
-                    request_id=str(uuid4()), path=request.path, method=request.method
+                    request_id=uuid4().hex, path=request.path, method=request.method
                 )
 
                 with session_factory() as session:
@@ -70,11 +72,9 @@ class BaseContext:
                     result = func(context, *args, **kwds)
 
                     session.commit()
-                    session.flush()
 
                     return result
 
-            wrapped.__name__ = func.__name__
             return wrapped
 
         return with_context
@@ -102,7 +102,11 @@ class Context(BaseContext):
 
     @classmethod
     def decorator(
-        cls, services: Services, session_factory: sessionmaker, logger: Logger
+        cls,
+        services: Services,
+        session_factory: sessionmaker,
+        logger: Logger,
+        read_only: bool = False,
     ) -> Callable[
         [Callable[[Context, _P.args, _P.kwargs], _T]], Callable[[_P.args, _P.kwargs], _T]
     ]:
@@ -111,12 +115,14 @@ class Context(BaseContext):
         The decorator injects a request context to the endpoint function.
         The user is authenticated, and if successful, added to the context as
         the requesting user. The context contains a database session, which is commited
-        and flushed after calling the endpoint function.
+        after calling the endpoint function, or rolled back for read-only endpoints.
 
         Args:
             services (Services): The services container.
             session_factory (sessionmaker): The session factory to use.
             logger (Logger): The logger.
+            read_only (bool): Whether the endpoints only read from the database.
+                Defaults to False.
 
         Returns:
             The decorator to use for api endpoints.
@@ -125,6 +131,7 @@ class Context(BaseContext):
         def with_context(
             func: Callable[Concatenate[Context, _P], _T]
         ) -> Callable[_P, _T]:
+            @wraps(func)
             def wrapped(*args: _P.args, **kwds: _P.kwargs) -> _T:
                 with session_factory() as session:
                     user = services.auth.authorize(
@@ -132,7 +139,7 @@ class Context(BaseContext):
                     )
 
                     logger.bind_contextvars(
-                        request_id=str(uuid4()),
+                        request_id=uuid4().hex,
                         path=request.path,
                         method=request.method,
                         user_id=str(user.id),
@@ -142,12 +149,13 @@ class Context(BaseContext):
 
                     result = func(context, *args, **kwds)
 
-                    session.commit()
-                    session.flush()
+                    if read_only:
+                        session.rollback()
+                    else:
+                        session.commit()
 
                     return result
 
-            wrapped.__name__ = func.__name__
             return wrapped
 
         return with_context
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from functools import cached_property
+
 import sqlalchemy as sa
 
 from ..models.db import DbBase
@@ -8,15 +10,13 @@ from ..models.db import DbBase
 class Database:
     """The database connection."""
 
-    @property
+    @cached_property
     def session_factory(self) -> sa.orm.sessionmaker:
-        """The factory creating database sessions for requests."""
-        if not self._sessionmaker:
-            _sessionmaker = self._connect()
-            self._sessionmaker: sa.orm.sessionmaker | None = _sessionmaker
-            return _sessionmaker
-        else:
-            return self._sessionmaker
+        """The factory creating database sessions for requests.
+
+        Connects to the database on first access.
+        """
+        return self._connect()
 
     def __init__(self, connstr: str):
         """Initialize new database connection.
@@ -25,11 +25,15 @@ class Database:
             connstr (str): The database connection string.
         """
         self._connstr: str = connstr
-        self._sessionmaker = None
 
     def _connect(self) -> sa.orm.sessionmaker:
         engine: sa.Engine = sa.create_engine(
-            self._connstr, echo=False, isolation_level="REPEATABLE READ"
+            self._connstr,
+            echo=False,
+            isolation_level="REPEATABLE READ",
+            pool_size=20,
+            max_overflow=0,
+            pool_recycle=1800,
         )
         DbBase.metadata.create_all(engine)
-        return sa.orm.sessionmaker(engine, expire_on_commit=True, autoflush=True)
+        return sa.orm.sessionmaker(engine, expire_on_commit=False, autoflush=True)
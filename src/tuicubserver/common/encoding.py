@@ -0,0 +1,24 @@
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # no cov
+    orjson = None  # type: ignore[assignment]
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Serialize an object to compact JSON bytes.
+
+    Uses `orjson` when it is installed, and the standard library otherwise.
+
+    Args:
+        obj (Any): The object to serialize.
+
+    Returns:
+        The encoded JSON.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+
+    return json.dumps(obj, separators=(",", ":"), default=str).encode()  # no cov
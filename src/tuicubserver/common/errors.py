@@ -1,5 +1,5 @@
 import json
-from abc import ABC, abstractmethod
+from typing import Any
 
 from flask import Response
 from sqlalchemy.exc import OperationalError
@@ -7,23 +7,33 @@ from sqlalchemy.exc import OperationalError
 from .logger import Logger
 
 
-class TuicubError(Exception, ABC):
-    """Base class for all application errors."""
+class TuicubError(Exception):
+    """Base class for all application errors.
 
-    @property
-    @abstractmethod
-    def code(self) -> int:
-        """The HTTP status code of the error."""
+    Concrete subclasses define `code`, `message` and `error_name` as class attributes.
+    Intermediate base classes are declared with `abstract=True` to skip that check.
+    """
 
-    @property
-    @abstractmethod
-    def message(self) -> str:
-        """The error message for the user."""
+    code: int
+    """The HTTP status code of the error."""
 
-    @property
-    @abstractmethod
-    def error_name(self) -> str:
-        """The name of the error used for logging."""
+    message: str
+    """The error message for the user."""
+
+    error_name: str
+    """The name of the error used for logging."""
+
+    def __init_subclass__(cls, abstract: bool = False, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if not abstract:
+            missing = [
+                name
+                for name in ("code", "message", "error_name")
+                if not hasattr(cls, name)
+            ]
+            if missing:
+                msg = f"{cls.__name__} must define: {', '.join(missing)}."
+                raise TypeError(msg)
 
     @property
     def info(self) -> dict | None:
@@ -40,76 +50,40 @@ class TuicubError(Exception, ABC):
         super().__init__(self.message)
 
 
-class BadRequestError(TuicubError):
-    @property
-    def code(self) -> int:
-        return 400
+class BadRequestError(TuicubError, abstract=True):
+    code = 400
 
 
 class UnauthorizedError(TuicubError):
-    @property
-    def code(self) -> int:
-        return 401
-
-    @property
-    def message(self) -> str:
-        return "The authentication token is either missing or is invalid."
-
-    @property
-    def error_name(self) -> str:
-        return "unauthorized"
+    code = 401
+    message = "The authentication token is either missing or is invalid."
+    error_name = "unauthorized"
 
 
 class ForbiddenError(TuicubError):
-    @property
-    def code(self) -> int:
-        return 403
-
-    @property
-    def message(self) -> str:
-        return "Forbidden."
-
-    @property
-    def error_name(self) -> str:
-        return "forbidden"
+    code = 403
+    message = "Forbidden."
+    error_name = "forbidden"
 
 
 class NotFoundError(TuicubError):
-    @property
-    def code(self) -> int:
-        return 404
-
-    @property
-    def message(self) -> str:
-        return "Resource not found."
-
-    @property
-    def error_name(self) -> str:
-        return "not_found"
+    code = 404
+    message = "Resource not found."
+    error_name = "not_found"
 
 
 class ValidationError(BadRequestError):
-    @property
-    def message(self) -> str:
-        return f"Invalid input: {self._reason}"
-
-    @property
-    def error_name(self) -> str:
-        return "validation"
+    message = "Invalid input."
+    error_name = "validation"
 
     def __init__(self, reason: str):
-        self._reason: str = reason
+        self.message = f"Invalid input: {reason}"
         super().__init__()
 
 
 class InvalidIdentifierError(BadRequestError):
-    @property
-    def message(self) -> str:
-        return "The identifier is not a valid UUID."
-
-    @property
-    def error_name(self) -> str:
-        return "invalid_identifier"
+    message = "The identifier is not a valid UUID."
+    error_name = "invalid_identifier"
 
 
 class ErrorHandler:
@@ -147,13 +121,31 @@ class ErrorHandler:
             An instance of `flask.Response` containing details of the error.
         """
         self._logger.log("error", error_name="sqlalchemy", error_info={})
-        return ErrorResponse(message="Another operation is pending. Try again.", code=400)
+        return ErrorResponse(message=_OPERATIONAL_ERROR_MESSAGE, code=400)
 
 
 class ErrorResponse(Response):
-    """An HTTP response for an application error."""
+    """An HTTP response for an application error.
+
+    Bodies for the constant-message errors are encoded once at import time.
+    """
 
     def __init__(self, message: str, code: int):
-        super().__init__(
-            json.dumps({"message": message}), status=code, content_type="application/json"
-        )
+        body = _ENCODED_MESSAGES.get(message)
+        if body is None:
+            body = json.dumps({"message": message}).encode()
+        super().__init__(body, status=code, content_type="application/json")
+
+
+_OPERATIONAL_ERROR_MESSAGE = "Another operation is pending. Try again."
+
+_ENCODED_MESSAGES: dict[str, bytes] = {
+    message: json.dumps({"message": message}).encode()
+    for message in (
+        UnauthorizedError.message,
+        ForbiddenError.message,
+        NotFoundError.message,
+        InvalidIdentifierError.message,
+        _OPERATIONAL_ERROR_MESSAGE,
+    )
+}
@@ -0,0 +1,60 @@
+from typing import Any
+
+from flask import Flask, Response
+from flask.json.provider import DefaultJSONProvider, JSONProvider
+
+try:
+    import orjson
+except ImportError:  # no cov
+    orjson = None  # type: ignore[assignment]
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """A JSON provider that encodes and decodes using `orjson`.
+
+    Responses are encoded straight to bytes, skipping the intermediate string.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize data as JSON string."""
+        return orjson.dumps(obj, default=self.default, option=self._options()).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        """Deserialize data as JSON."""
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """Serialize the given arguments as a JSON response."""
+        obj = self._prepare_response_obj(args, kwargs)
+        option = self._options() | orjson.OPT_APPEND_NEWLINE
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            option |= orjson.OPT_INDENT_2
+
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=option),
+            mimetype=self.mimetype,
+        )
+
+    def _options(self) -> int:
+        option: int = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return option
+
+
+def create_json_provider(app: Flask) -> JSONProvider:
+    """Create the JSON provider for the app.
+
+    Returns an `OrjsonProvider` when `orjson` is installed, and Flask's default
+    provider otherwise.
+
+    Args:
+        app (Flask): The application to create the provider for.
+
+    Returns:
+        The JSON provider.
+    """
+    if orjson is None:  # no cov
+        return DefaultJSONProvider(app)
+
+    return OrjsonProvider(app)
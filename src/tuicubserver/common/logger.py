@@ -10,7 +10,7 @@ from flask import Flask, Response
 class Logger:
     """A logging interface wrapping the `structlog`."""
 
-    __slots__ = ("_logfile_path", "_logfile", "__weakref__")
+    __slots__ = ("_logfile_path", "_logfile", "_log", "__weakref__")
 
     def __init__(self, logfile_path: Path):
         """Initialize new logger.
@@ -20,6 +20,7 @@ class Logger:
         """
         self._logfile_path: Path = logfile_path
         self._logfile: TextIOWrapper | None = None
+        self._log: Any = structlog.get_logger()
 
     def configure(self) -> None:
         """Configure the logger."""
@@ -37,17 +38,17 @@ class Logger:
                 structlog.processors.JSONRenderer(),
             ],
             logger_factory=structlog.WriteLoggerFactory(file=logfile),
+            cache_logger_on_first_use=True,
         )
+        self._log = structlog.get_logger()
 
     def log(self, event: str, *args: Any, **kwargs: Any) -> None:
         """Log an event with additional keyword parameters."""
-        log = structlog.get_logger()
-        log.info(event, **kwargs)
+        self._log.info(event, **kwargs)
 
     def log_error(self, event: str, err: Exception, *args: Any, **kwargs: Any) -> None:
         """Log an error with additional keyword parameters."""
-        log = structlog.get_logger()
-        log.exception(event, exc_info=err, **kwargs)
+        self._log.exception(event, exc_info=err, **kwargs)
 
     def log_response(self, sender: Flask, response: Response, **extra: Any) -> None:
         """Log an HTTP response."""
@@ -10,6 +10,13 @@ from werkzeug.datastructures import Headers
 
 from .errors import InvalidIdentifierError
 
+_BEARER_PREFIX = "bearer"
+_TOKEN_ALLOWED_CHARS = string.ascii_letters + string.digits + "-_.="
+_TOKEN_DELETE_TABLE = str.maketrans("", "", _TOKEN_ALLOWED_CHARS)
+_NUMERIC_LABEL_RE = re.compile(rb"[0-9]+$")
+_LABEL_RE = re.compile(rb"(?!-)[a-z0-9-]{1,63}(?<!-)$", re.IGNORECASE)
+_UUID_STR_LENGTHS = frozenset((32, 36))
+
 
 def parse_token(headers: Headers) -> str:
     """Retrieve the authentication token from the "Authorization" header.
@@ -22,27 +29,27 @@ def parse_token(headers: Headers) -> str:
     Returns:
         The authentication token.
     """
-    value: str = next(
-        (value for key, value in headers.items(lower=True) if key == "authorization"), ""
-    )
+    value: str = headers.get("Authorization", default="", type=str)
 
     auth_header_parts_count = 2
-    parts = value.strip().split(" ", auth_header_parts_count)
+    parts = value.split(None, 1)
     if len(parts) == auth_header_parts_count:
-        prefix = parts[0].lower()
-        token: str = parts[1]
-
-        allowed_chars = string.ascii_letters + string.digits + "-_.="
-        if prefix == "bearer" and all(c in allowed_chars for c in token):
+        prefix = parts[0]
+        token: str = parts[1].rstrip()
+
+        if (
+            len(prefix) == len(_BEARER_PREFIX)
+            and prefix.lower() == _BEARER_PREFIX
+            and not token.translate(_TOKEN_DELETE_TABLE)
+        ):
             return token
 
     return ""
 
 
 def generate_token() -> str:
-    """Returns a sha256 hash of a random string of hex numbers."""
-    token = secrets.token_hex(16)
-    return sha256(token)
+    """Returns a random string of 64 hex numbers."""
+    return secrets.token_hex(32)
 
 
 def sha256(data: str) -> str:
@@ -69,25 +76,38 @@ def as_uuid(id: str | uuid.UUID) -> uuid.UUID:
     """
     if isinstance(id, uuid.UUID):
         return id
+    elif len(id) not in _UUID_STR_LENGTHS:
+        raise InvalidIdentifierError()
     else:
         try:
-            return uuid.UUID(id)
+            return uuid.UUID(hex=id)
         except ValueError as e:
             raise InvalidIdentifierError() from e
 
 
 def is_host_valid(host: str) -> bool:
     """Returns true if the host is a valid IPv4, IPv6 or a FQDN."""
-    try:
-        ipaddress.ip_address(host)
-    except Exception:
-        return _is_valid_hostname(host)
-    else:
-        return True
+    if _looks_like_ip_address(host):
+        try:
+            ipaddress.ip_address(host)
+        except ValueError:
+            pass
+        else:
+            return True
+
+    return _is_valid_hostname(host)
+
+
+def _looks_like_ip_address(host: str) -> bool:
+    ipv4_dots_count = 3
+    return ":" in host or (
+        host.count(".") == ipv4_dots_count
+        and all(part.isdigit() for part in host.split("."))
+    )
 
 
 def _is_valid_hostname(hostname: str) -> bool:
-    if hostname[-1] == ".":
+    if hostname.endswith("."):
         # strip exactly one dot from the right, if present
         hostname = hostname[:-1]
 
@@ -95,10 +115,12 @@ def _is_valid_hostname(hostname: str) -> bool:
     if len(hostname) > max_hostname_len:
         return False
 
-    labels = hostname.split(".")
+    try:
+        labels = hostname.encode("ascii").split(b".")
+    except UnicodeEncodeError:
+        return False
 
-    if re.match(r"[0-9]+$", labels[-1]):
+    if _NUMERIC_LABEL_RE.match(labels[-1]):
         return False
 
-    allowed = re.compile(r"(?!-)[a-z0-9-]{1,63}(?<!-)$", re.IGNORECASE)
-    return all(allowed.match(label) for label in labels)
+    return all(_LABEL_RE.match(label) for label in labels)
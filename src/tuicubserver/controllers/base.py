@@ -3,11 +3,15 @@ from typing import Any
 from flask import request
 from marshmallow import EXCLUDE, Schema
 from marshmallow import ValidationError as MarshmallowError
-from more_itertools import flatten
 
 from ..common.errors import ValidationError
 from ..messages.service import MessagesService
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # no cov
+    from json import loads as _json_loads
+
 SUCCESS_RESPONSE = {"success": True}
 
 
@@ -26,14 +30,25 @@ class BaseController:
         self._messages_service: MessagesService = messages_service
 
     def _deserialize_json(self, schema: Schema) -> dict:
-        """Deserialize request body into a json dictionary using a schema."""
-        body: Any = request.get_json(force=True, silent=True, cache=False) or {}
-        return schema.load(body, unknown=EXCLUDE)
+        """Deserialize request body into a json dictionary using a schema.
+
+        The schema is expected to be a shared instance created once per module.
+        """
+        body: Any = None
+        if raw := request.get_data(cache=False):
+            try:
+                body = _json_loads(raw)
+            except ValueError:
+                body = None
+        return schema.load(body or {})
 
 
 class BaseBodySchema(Schema):
     """Base schema for request body schemas."""
 
+    class Meta:
+        unknown = EXCLUDE
+
     def handle_error(
         self, error: MarshmallowError, data: Any, *args: Any, many: bool, **kwargs: Any
     ) -> Any:
@@ -46,7 +61,15 @@ class BaseBodySchema(Schema):
         raise ValidationError(reason=reason)
 
 
-def _unwrap_messages(value: dict[str, list[str]] | list[str]) -> list[str]:
-    if isinstance(value, dict):
-        return list(flatten([_unwrap_messages(val) for key, val in value.items()]))
-    return value
+def _unwrap_messages(root: dict[str, Any] | list[Any]) -> list[str]:
+    messages: list[str] = []
+    stack: list[Any] = [root]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            stack.extend(reversed(value.values()))
+        elif isinstance(value, list):
+            stack.extend(reversed(value))
+        else:
+            messages.append(value)
+    return messages
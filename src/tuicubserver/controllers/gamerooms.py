@@ -4,7 +4,8 @@ from flask import request
 from marshmallow import fields
 
 from ..common.context import BaseContext, Context
-from ..models.dto import GameDto, GameroomDto
+from ..models.dto import GameDto, GameroomDto, serialize_gamerooms
+from ..models.user import User
 from ..services.auth import AuthService
 from ..services.gamerooms import GameroomsService
 from ..services.games import GamesService
@@ -59,7 +60,7 @@ class GameroomsController(BaseController):
             The list of active gamerooms.
         """
         gamerooms = self._gamerooms_service.get_gamerooms(context=context)
-        return [GameroomDto.create(gameroom).serialize() for gameroom in gamerooms]
+        return serialize_gamerooms(gamerooms)
 
     def create_gameroom(self, context: Context) -> dict:
         """Create a new gameroom.
@@ -188,7 +189,8 @@ class GameroomsController(BaseController):
         """User disconnected callback.
 
         Called by the events server whenever a user disconnects.
-        The disconnected user id is passed in the request body.
+        The disconnected user id is passed in the request body. When the user is not
+        in any gameroom, nothing else is loaded.
 
         Args:
             context (BaseContext): The request context.
@@ -218,10 +220,47 @@ class GameroomsController(BaseController):
         """
         self._auth_service.authorize_events_server(headers=request.headers)
 
-        body: dict = self._deserialize_json(DisconnectUserBodySchema())
+        body: dict = self._deserialize_json(_DISCONNECT_USER_BODY_SCHEMA)
         user = self._users_service.get_user_by_id(
             session=context.session, user_id=body["user_id"]
         )
+        return self._disconnect_user(context=context, user=user)
+
+    def disconnect_batch(self, context: BaseContext) -> dict:
+        """Users disconnected callback.
+
+        Called by the events server with the ids of all users that disconnected
+        within a short interval. The users are loaded in a single query, and each
+        one is disconnected the same way as in `disconnect`. Unknown ids are skipped.
+
+        Args:
+            context (BaseContext): The request context.
+
+        Sends:
+            The same events as `disconnect`, for every disconnected user.
+
+        Returns:
+            The success response.
+
+        Raises:
+            ValidationError: Raised when the user ids are missing form the request body
+                or are not valid UUIDs.
+        """
+        self._auth_service.authorize_events_server(headers=request.headers)
+
+        body: dict = self._deserialize_json(_DISCONNECT_USERS_BODY_SCHEMA)
+        users = self._users_service.get_users_by_ids(
+            session=context.session, user_ids=body["user_ids"]
+        )
+        for user in users:
+            self._disconnect_user(context=context, user=user)
+
+        return SUCCESS_RESPONSE
+
+    def _disconnect_user(self, context: BaseContext, user: User) -> dict:
+        if user.current_gameroom_id is None:
+            return SUCCESS_RESPONSE
+
         _context = Context(user=user, session=context.session)
 
         gameroom_result = self._gamerooms_service.disconnect(context=_context)
@@ -255,3 +294,17 @@ class DisconnectUserBodySchema(BaseBodySchema):
         required=True,
         error_messages={"required": "A valid 'user_id' is required."},
     )
+
+
+class DisconnectUsersBodySchema(BaseBodySchema):
+    """The schema of the batch disconnect request body."""
+
+    user_ids = fields.List(
+        fields.UUID(),
+        required=True,
+        error_messages={"required": "A valid list of 'user_ids' is required."},
+    )
+
+
+_DISCONNECT_USER_BODY_SCHEMA = DisconnectUserBodySchema()
+_DISCONNECT_USERS_BODY_SCHEMA = DisconnectUsersBodySchema()
@@ -8,6 +8,8 @@ from ..services.gamerooms import GameroomsService
 from ..services.games import GamesService
 from .base import BaseBodySchema, BaseController
 
+_MAX_TILE_ID = 105
+
 
 class GamesController(BaseController):
     """The controller for the games resource."""
@@ -65,7 +67,7 @@ class GamesController(BaseController):
             NewTilesNotFromRackError: Raised when there are new tiles that did not
                 come from the user's rack.
         """
-        body: dict = self._deserialize_json(MoveTilesBodySchema())
+        body: dict = self._deserialize_json(_MOVE_TILES_BODY_SCHEMA)
         game = self._games_service.move(context=context, game_id=id, board=body["board"])
         self._messages_service.tiles_moved(sender=context.user, game=game)
         return GameStateDto.create(game, context.user).serialize()
@@ -203,10 +205,31 @@ class GamesController(BaseController):
 
 
 class MoveTilesBodySchema(BaseBodySchema):
-    """The schema of the move tiles request body."""
+    """The schema of the move tiles request body.
+
+    A board made only of lists of in-range integers is accepted as is, without
+    going through the field validators. Any other input is loaded by the schema.
+    """
 
     board = fields.List(
-        fields.List(fields.Integer(validate=validate.Range(min=0, max=105))),
+        fields.List(fields.Integer(validate=validate.Range(min=0, max=_MAX_TILE_ID))),
         required=True,
         error_messages={"required": "A valid 'board' is required."},
     )
+
+    def load(self, data: Any, *args: Any, **kwargs: Any) -> Any:
+        """Deserialize the request body."""
+        if isinstance(data, dict) and _is_valid_board(board := data.get("board")):
+            return {"board": board}
+        return super().load(data, *args, **kwargs)
+
+
+def _is_valid_board(board: Any) -> bool:
+    return type(board) is list and all(
+        type(row) is list
+        and all(type(tile) is int and 0 <= tile <= _MAX_TILE_ID for tile in row)
+        for row in board
+    )
+
+
+_MOVE_TILES_BODY_SCHEMA = MoveTilesBodySchema()
@@ -39,13 +39,17 @@ class UsersController(BaseController):
             ValidationError: Raised when the name is missing form the request body
                 or is empty.
         """
-        body: dict = self._deserialize_json(CreateUserBodySchema())
+        body: dict = self._deserialize_json(_CREATE_USER_BODY_SCHEMA)
         user, token = self._users_service.create_user(context, name=body["name"])
         return {"user": UserDto.create(user).serialize(), "token": token.token}
 
 
 class CreateUserBodySchema(BaseBodySchema):
-    """The schema of the create user request body."""
+    """The schema of the create user request body.
+
+    A body with a non-empty string name is accepted without running the field
+    validators. Any other input is loaded by the schema to report the error.
+    """
 
     name = fields.Str(
         validate=validate.Length(min=1, error="Name cannot be empty."),
@@ -55,3 +59,12 @@ class CreateUserBodySchema(BaseBodySchema):
             "null": "Name cannot be null.",
         },
     )
+
+    def load(self, data: Any, *args: Any, **kwargs: Any) -> Any:
+        """Deserialize the request body."""
+        if isinstance(data, dict) and type(name := data.get("name")) is str and name:
+            return {"name": name}
+        return super().load(data, *args, **kwargs)
+
+
+_CREATE_USER_BODY_SCHEMA = CreateUserBodySchema()
@@ -1,10 +1,19 @@
+import json
 from uuid import UUID
 
 import requests
+from requests.adapters import HTTPAdapter
+
+REQUEST_TIMEOUT = 5.0
 
 
 class EventsApiClient:
-    """The client for notifying the api server about user disconnects."""
+    """The client for notifying the api server about user disconnects.
+
+    Requests are sent through a `requests.Session` shared by all clients in the
+    process, so connections to the api server are kept alive and reused between
+    notifications. Every request gives up after `REQUEST_TIMEOUT` seconds.
+    """
 
     def __init__(self, api_url: str, token: str):
         """Initialize new client.
@@ -13,20 +22,37 @@ class EventsApiClient:
             api_url (str): The base url of the api server.
             token (str): The authentication token to include in every request.
         """
-        self._api_url: str = api_url
-        self._token: str = token
+        self._disconnect_batch_url: str = f"{api_url}/gamerooms/disconnect_batch"
+        self._headers: dict[str, str] = {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json",
+        }
 
-    def notify_user_disconnected(self, user_id: UUID) -> None:
-        """Notify the api server about a disconnecting user.
+    def notify_users_disconnected(self, user_ids: list[UUID]) -> None:
+        """Notify the api server about multiple disconnected users at once.
 
-        Sends a POST request to the `/gamerooms/disconnect` endpoint
-        with the disconnected user id in the body.
+        Sends a POST request to the `/gamerooms/disconnect_batch` endpoint
+        with the disconnected user ids in the body.
 
         Args:
-            user_id (UUID): The id of the disconnected user.
+            user_ids (list[UUID]): The ids of the disconnected users.
         """
-        requests.post(
-            f"{self._api_url}/gamerooms/disconnect",
-            json={"user_id": str(user_id)},
-            headers={"Authorization": f"Bearer {self._token}"},
+        _SESSION.post(
+            self._disconnect_batch_url,
+            data=json.dumps(
+                {"user_ids": [str(user_id) for user_id in user_ids]}
+            ).encode(),
+            headers=self._headers,
+            timeout=REQUEST_TIMEOUT,
         )
+
+
+def _create_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_SESSION = _create_session()
@@ -1,59 +1,99 @@
 from __future__ import annotations
 
 import asyncio
-import uuid
+import itertools
 from collections.abc import Callable
 from typing import Protocol
-from weakref import ReferenceType, WeakMethod, ref
 
-from attrs import frozen
+MAX_LINE_LENGTH = 2**16
 
 
-@frozen
 class TuicubProtocol(asyncio.Protocol):
     """The stream protocol for users connections.
 
+    Incoming data is buffered as bytes and split on newlines, so a message split
+    across multiple TCP segments is delivered once it is complete.
+
+    A pending line is limited to `MAX_LINE_LENGTH` bytes. When a client exceeds
+    the limit without sending a newline, the connection is closed.
+
+    The protocol holds a strong reference to its connection, which is released
+    when the connection is lost to break the reference cycle.
+
     Attributes:
-        on_connection_made (WeakMethod[Callable[[asyncio.Transport], None]]): A weak
-            reference to a method called when a connection has been estabilished.
-        on_data (WeakMethod[Callable[[str], None]]): A weak reference to a method called
-            when new data is sent over the connection.
-        on_connection_lost (WeakMethod[Callable[[], None]]): A weak reference to a method
-            called when a connection has been lost.
+        connection (Connection | None): The connection owning this protocol,
+            or None after the connection has been lost.
     """
 
-    on_connection_made: WeakMethod[Callable[[asyncio.Transport], None]]
-    on_data: WeakMethod[Callable[[str], None]]
-    on_connection_lost: WeakMethod[Callable[[], None]]
+    __slots__ = ("connection", "_buffer")
+
+    def __init__(self, connection: Connection):
+        """Initialize new protocol.
+
+        Args:
+            connection (Connection): The connection owning this protocol.
+        """
+        self.connection: Connection | None = connection
+        self._buffer: bytearray = bytearray()
 
     def connection_made(self, transport: asyncio.BaseTransport) -> None:
         """Called when a connection is made."""
-        if isinstance(transport, asyncio.Transport) and (
-            on_connection_made := self.on_connection_made()
-        ):
-            on_connection_made(transport)
+        if isinstance(transport, asyncio.Transport) and self.connection:
+            self.connection.on_connection_made(transport)
 
     def data_received(self, data: bytes) -> None:
-        """Called when some data is received."""
-        if on_data := self.on_data():
-            for message in data.decode().splitlines():
-                if message:
-                    on_data(message)
+        """Called when some data is received.
+
+        Every complete, non-empty line is decoded, and all of them are passed to the
+        connection at once. The trailing incomplete line is kept until the rest of it
+        arrives. Only the newly received data is searched for a newline.
+        """
+        buffer = self._buffer
+        start = len(buffer)
+        buffer += data
+        end = buffer.rfind(b"\n", start)
+        if end >= 0:
+            lines = buffer[:end].split(b"\n")
+            del buffer[: end + 1]
+            if (connection := self.connection) and (
+                messages := [
+                    message for line in lines if (message := line.decode().rstrip("\r"))
+                ]
+            ):
+                connection.on_data(messages)
+
+        if len(buffer) > MAX_LINE_LENGTH:
+            buffer.clear()
+            if connection := self.connection:
+                connection.on_line_too_long()
 
     def connection_lost(self, exc: Exception | None) -> None:
         """Called when the connection is lost or closed."""
-        if on_connection_lost := self.on_connection_lost():
-            on_connection_lost()
+        if connection := self.connection:
+            self.connection = None
+            connection.on_connection_lost()
+
+
+_next_connection_id = itertools.count(1).__next__
 
 
 class Connection:
     """A connection between a user and the events server."""
 
-    __slots__ = ("_id", "_delegate", "_protocol", "_transport", "__weakref__")
+    __slots__ = (
+        "_id",
+        "_on_data_cb",
+        "_on_connected_cb",
+        "_on_disconnected_cb",
+        "_on_line_too_long_cb",
+        "_protocol",
+        "_transport",
+        "__weakref__",
+    )
 
     @property
-    def id(self) -> uuid.UUID:
-        """The id of the connection."""
+    def id(self) -> int:
+        """The id of the connection, unique within the process."""
         return self._id
 
     @property
@@ -63,58 +103,83 @@ class Connection:
 
     def __init__(self) -> None:
         """Initialize new connection with a `TuicubProtocol`."""
-        self._id: uuid.UUID = uuid.uuid4()
-        self._delegate: ReferenceType[ConnectionDelegate] | None = None
-        self._protocol = TuicubProtocol(
-            on_connection_made=WeakMethod(self._connection_made),
-            on_data=WeakMethod(self._read),
-            on_connection_lost=WeakMethod(self._connection_lost),
-        )
+        self._id: int = _next_connection_id()
+        self._on_data_cb: Callable[[Connection, list[str]], None] | None = None
+        self._on_connected_cb: Callable[[Connection], None] | None = None
+        self._on_disconnected_cb: Callable[[Connection], None] | None = None
+        self._on_line_too_long_cb: Callable[[Connection], None] | None = None
+        self._protocol: TuicubProtocol = TuicubProtocol(connection=self)
         self._transport: asyncio.Transport | None = None
 
-    async def write(self, data: str) -> None:
+    def write(self, data: bytes) -> None:
         """Write data over the connection.
 
-        The data is sent with an appended newline character.
+        The data is sent with an appended newline character. Writing only buffers
+        the data in the transport, so it never blocks.
 
         Args:
-            data (str): The data to send.
+            data (bytes): The encoded data to send.
 
         Raises:
             TransportClosedError: Raised when the underlying transport is None,
             or has been closed.
         """
         if self._transport and not self._transport.is_closing():
-            self._transport.write(f"{data}\n".encode())
+            self._transport.writelines((data, b"\n"))
         else:
             raise TransportClosedError()
 
     def set_delegate(self, delegate: ConnectionDelegate) -> None:
-        """Sets a weak reference to the delegate."""
-        self._delegate = ref(delegate)
+        """Sets the delegate by caching its bound callback methods.
+
+        The callbacks are released when the connection is lost, which breaks
+        the reference cycle between the connection and its delegate.
+        """
+        self._on_data_cb = delegate.connection_on_data_batch
+        self._on_connected_cb = delegate.connection_connected
+        self._on_disconnected_cb = delegate.connection_disconnected
+        self._on_line_too_long_cb = delegate.connection_line_too_long
+
+    def on_data(self, messages: list[str]) -> None:
+        """Called by the protocol with all messages received in a single chunk."""
+        if on_data := self._on_data_cb:
+            on_data(self, messages)
 
-    def _read(self, data: str) -> None:
-        if self._delegate and (delegate := self._delegate()):
-            delegate.connection_on_data(connection=self, data=data)
+    def on_line_too_long(self) -> None:
+        """Called by the protocol when a line exceeds `MAX_LINE_LENGTH`.
 
-    def _connection_made(self, transport: asyncio.Transport) -> None:
+        The delegate is notified, and the transport is closed.
+        """
+        if on_line_too_long := self._on_line_too_long_cb:
+            on_line_too_long(self)
+        if self._transport:
+            self._transport.close()
+
+    def on_connection_made(self, transport: asyncio.Transport) -> None:
+        """Called by the protocol when the connection has been estabilished."""
         self._transport = transport
-        if self._delegate and (delegate := self._delegate()):
-            delegate.connection_connected(connection=self)
+        if on_connected := self._on_connected_cb:
+            on_connected(self)
 
-    def _connection_lost(self) -> None:
-        if self._delegate and (delegate := self._delegate()):
-            delegate.connection_disconnected(connection=self)
+    def on_connection_lost(self) -> None:
+        """Called by the protocol when the connection has been lost."""
+        on_disconnected = self._on_disconnected_cb
+        self._on_data_cb = self._on_connected_cb = self._on_disconnected_cb = None
+        self._on_line_too_long_cb = None
+        if on_disconnected:
+            on_disconnected(self)
 
     def __hash__(self) -> int:
-        return hash((self.id,))
+        return self._id
 
 
 class ConnectionDelegate(Protocol):
     """The delegate of the connection."""
 
-    def connection_on_data(self, connection: Connection, data: str) -> None:
-        """Called whenever the connection receives new data."""
+    def connection_on_data_batch(
+        self, connection: Connection, messages: list[str]
+    ) -> None:
+        """Called with all messages the connection received in a single chunk."""
 
     def connection_connected(self, connection: Connection) -> None:
         """Called when the connection has been estabilished."""
@@ -122,6 +187,9 @@ class ConnectionDelegate(Protocol):
     def connection_disconnected(self, connection: Connection) -> None:
         """Called when the connection has been lost."""
 
+    def connection_line_too_long(self, connection: Connection) -> None:
+        """Called when the connection sent a line exceeding `MAX_LINE_LENGTH`."""
+
 
 class TransportClosedError(Exception):
     def __init__(self) -> None:
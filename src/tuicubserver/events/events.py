@@ -2,12 +2,22 @@ from __future__ import annotations
 
 __pdoc__ = {}
 
-from abc import ABC, abstractmethod
-from typing import NamedTuple
-
-from ..messages.recipents import AllPlayers, AllUsersButSender, Recipents, SingleRecipent
-from ..models.dto import GameDto, GameroomDto, PlayerDto, UserDto, create_players
-from ..models.game import Game, Player
+from typing import Any, ClassVar
+
+from ..messages.recipents import (
+    Recipents,
+    all_players,
+    all_users_but_sender,
+    single_recipent,
+)
+from ..models.dto import (
+    PlayerDto,
+    UserDto,
+    serialize_game_for_player,
+    serialize_gamerooms,
+    serialize_players,
+)
+from ..models.game import JOKERS, Game, Player
 from ..models.gameroom import Gameroom
 from ..models.user import User
 
@@ -28,15 +38,23 @@ __all__ = [
 ]
 
 
-class Event(ABC):
-    """Base class for all events."""
+class Event:
+    """Base class for all events.
+
+    Concrete subclasses define `event_name` as a class attribute. Intermediate base
+    classes are declared with `abstract=True` to skip that check.
+    """
 
-    __slots__ = "_recipents"
+    __slots__ = ("_recipents", "_payload")
 
-    @property
-    @abstractmethod
-    def event_name(self) -> str:
-        """@private The name of the event."""
+    event_name: ClassVar[str]
+    """@private The name of the event."""
+
+    def __init_subclass__(cls, abstract: bool = False, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if not abstract and not hasattr(cls, "event_name"):
+            msg = f"{cls.__name__} must define: event_name."
+            raise TypeError(msg)
 
     @property
     def recipents(self) -> Recipents:
@@ -50,23 +68,33 @@ class Event(ABC):
             recipents (Recipents): The recipents of the event.
         """
         self._recipents: Recipents = recipents
+        self._payload: dict | None = None
+
+    def payload(self) -> dict:
+        """@private The event's name and serialized data.
+
+        The payload is built on first access and reused afterwards.
+        """
+        if self._payload is None:
+            self._payload = {"name": self.event_name, "data": self.serialize()}
+        return self._payload
 
     def serialize(self) -> dict:
         """@private Serializes the event as a dictionary."""
         return {}
 
 
-class UserEvent(Event):
+class UserEvent(Event, abstract=True):
     """Base class for user events."""
 
-    __slots__ = "_user"
+    __slots__ = "_data"
 
     def __init__(self, user: User, gameroom: Gameroom):
-        self._user: UserDto = UserDto.create(user=user)
-        super().__init__(recipents=AllUsersButSender(sender=user, gameroom=gameroom))
+        self._data: dict = {"user": UserDto.create(user=user).serialize()}
+        super().__init__(recipents=all_users_but_sender(sender=user, gameroom=gameroom))
 
     def serialize(self) -> dict:
-        return {"user": self._user.serialize()}
+        return self._data
 
 
 class UserJoinedEvent(UserEvent):
@@ -93,9 +121,7 @@ class UserJoinedEvent(UserEvent):
 
     __slots__ = ()
 
-    @property
-    def event_name(self) -> str:
-        return "user_joined"
+    event_name = "user_joined"
 
 
 class UserLeftEvent(UserEvent):
@@ -122,9 +148,7 @@ class UserLeftEvent(UserEvent):
 
     __slots__ = ()
 
-    @property
-    def event_name(self) -> str:
-        return "user_left"
+    event_name = "user_left"
 
 
 class GameroomDeletedEvent(Event):
@@ -156,18 +180,17 @@ class GameroomDeletedEvent(Event):
         gameroom: The deleted gameroom.
     """
 
-    __slots__ = "_gameroom"
+    __slots__ = "_data"
 
     def __init__(self, gameroom: Gameroom, remaining_users: tuple[User, ...]):
-        self._gameroom: GameroomDto = GameroomDto.create(gameroom)
-        super().__init__(recipents=Recipents([u.id for u in remaining_users]))
+        (serialized_gameroom,) = serialize_gamerooms((gameroom,))
+        self._data: dict = {"gameroom": serialized_gameroom}
+        super().__init__(recipents=tuple(u.id for u in remaining_users))
 
     def serialize(self) -> dict:
-        return {"gameroom": self._gameroom.serialize()}
+        return self._data
 
-    @property
-    def event_name(self) -> str:
-        return "gameroom_deleted"
+    event_name = "gameroom_deleted"
 
 
 class BoardChangedEvent(Event):
@@ -200,14 +223,13 @@ class BoardChangedEvent(Event):
     def __init__(self, game: Game):
         self._board = game.game_state.board.as_list()
         self._new_tiles = game.new_tiles()
-        super().__init__(recipents=AllPlayers(game))
+        super().__init__(recipents=all_players(game))
 
-    @property
-    def event_name(self) -> str:
-        return "board_changed"
+    event_name = "board_changed"
 
     def serialize(self) -> dict:
-        board = [_sorted_tileset(tileset) for tileset in self._board]
+        order = _TILE_ORDER.__getitem__
+        board = [sorted(tileset, key=order) for tileset in self._board]
         return {"board": board, "new_tiles": self._new_tiles}
 
 
@@ -253,18 +275,16 @@ class GameStartedEvent(Event):
         game: The started game.
     """
 
-    __slots__ = "_game"
+    __slots__ = "_data"
 
     def __init__(self, game: Game, player: Player):
-        self._game: GameDto = GameDto.for_player(game, player)
-        super().__init__(recipents=SingleRecipent(player.user_id))
+        self._data: dict = {"game": serialize_game_for_player(game, player)}
+        super().__init__(recipents=single_recipent(player.user_id))
 
-    @property
-    def event_name(self) -> str:
-        return "game_started"
+    event_name = "game_started"
 
     def serialize(self) -> dict:
-        return {"game": self._game.serialize()}
+        return self._data
 
 
 class PileCountChangedEvent(Event):
@@ -293,11 +313,9 @@ class PileCountChangedEvent(Event):
 
     def __init__(self, game: Game):
         self._pile_count = len(game.game_state.pile)
-        super().__init__(recipents=AllPlayers(game))
+        super().__init__(recipents=all_players(game))
 
-    @property
-    def event_name(self) -> str:
-        return "pile_count_changed"
+    event_name = "pile_count_changed"
 
     def serialize(self) -> dict:
         return {"pile_count": self._pile_count}
@@ -327,20 +345,20 @@ class PlayerLeftEvent(Event):
         player: The player that left the game.
     """
 
-    __slots__ = "_player"
+    __slots__ = "_data"
 
     def __init__(self, player: Player, game: Game):
-        self._player = PlayerDto(
-            user_id=player.user_id, name=player.name, tiles_count=0, has_turn=False
-        )
-        super().__init__(recipents=AllPlayers(game))
+        self._data: dict = {
+            "player": PlayerDto(
+                user_id=player.user_id, name=player.name, tiles_count=0, has_turn=False
+            ).serialize()
+        }
+        super().__init__(recipents=all_players(game))
 
-    @property
-    def event_name(self) -> str:
-        return "player_left"
+    event_name = "player_left"
 
     def serialize(self) -> dict:
-        return {"player": self._player.serialize()}
+        return self._data
 
 
 class PlayerWonEvent(Event):
@@ -370,20 +388,20 @@ class PlayerWonEvent(Event):
         winner: The player that won the game.
     """
 
-    __slots__ = "_winner"
+    __slots__ = "_data"
 
     def __init__(self, winner: Player, game: Game):
-        self._winner = PlayerDto(
-            user_id=winner.user_id, name=winner.name, tiles_count=0, has_turn=False
-        )
-        super().__init__(recipents=AllPlayers(game))
+        self._data: dict = {
+            "winner": PlayerDto(
+                user_id=winner.user_id, name=winner.name, tiles_count=0, has_turn=False
+            ).serialize()
+        }
+        super().__init__(recipents=all_players(game))
 
-    @property
-    def event_name(self) -> str:
-        return "player_won"
+    event_name = "player_won"
 
     def serialize(self) -> dict:
-        return {"winner": self._winner.serialize()}
+        return self._data
 
 
 class PlayersChangedEvent(Event):
@@ -421,18 +439,16 @@ class PlayersChangedEvent(Event):
         players: The updated list of players.
     """
 
-    __slots__ = "_players"
+    __slots__ = "_data"
 
     def __init__(self, game: Game):
-        self._players = create_players(game)
-        super().__init__(recipents=AllPlayers(game))
+        self._data: dict = {"players": serialize_players(game)}
+        super().__init__(recipents=all_players(game))
 
-    @property
-    def event_name(self) -> str:
-        return "players_changed"
+    event_name = "players_changed"
 
     def serialize(self) -> dict:
-        return {"players": [player.serialize() for player in self._players]}
+        return self._data
 
 
 class RackChangedEvent(Event):
@@ -460,11 +476,9 @@ class RackChangedEvent(Event):
 
     def __init__(self, game: Game, user: User):
         self._rack = game.player_for_user_id(user.id).rack.as_list()
-        super().__init__(recipents=SingleRecipent(user.id))
+        super().__init__(recipents=single_recipent(user.id))
 
-    @property
-    def event_name(self) -> str:
-        return "rack_changed"
+    event_name = "rack_changed"
 
     def serialize(self) -> dict:
         return {"rack": _sorted_tileset(self._rack)}
@@ -493,11 +507,9 @@ class TileDrawnEvent(Event):
 
     def __init__(self, tile: int, user: User):
         self._tile = tile
-        super().__init__(recipents=SingleRecipent(user.id))
+        super().__init__(recipents=single_recipent(user.id))
 
-    @property
-    def event_name(self) -> str:
-        return "tile_drawn"
+    event_name = "tile_drawn"
 
     def serialize(self) -> dict:
         return {"tile": self._tile}
@@ -520,14 +532,12 @@ class TurnEndedEvent(Event):
         ```
     """
 
-    __slots__ = ("_recipents",)
+    __slots__ = ()
 
     def __init__(self, user: User):
-        super().__init__(recipents=SingleRecipent(user.id))
+        super().__init__(recipents=single_recipent(user.id))
 
-    @property
-    def event_name(self) -> str:
-        return "turn_ended"
+    event_name = "turn_ended"
 
 
 class TurnStartedEvent(Event):
@@ -546,36 +556,24 @@ class TurnStartedEvent(Event):
         ```
     """
 
-    __slots__ = ("_recipents",)
+    __slots__ = ()
 
     def __init__(self, game: Game):
-        super().__init__(recipents=SingleRecipent(game.current_player().user_id))
+        super().__init__(recipents=single_recipent(game.current_player().user_id))
 
-    @property
-    def event_name(self) -> str:
-        return "turn_started"
+    event_name = "turn_started"
 
 
-class _TileNode(NamedTuple):
-    id: int
-    order: int
+_DECK_SIZE = 52
+_TILES_COUNT = 106
+_TILE_ORDER: tuple[int, ...] = tuple(
+    tile if tile < _DECK_SIZE or tile in JOKERS else tile - _DECK_SIZE
+    for tile in range(_TILES_COUNT)
+)
 
 
 def _sorted_tileset(tileset: list[int]) -> list[int]:
-    deck_size = 52
-    jokers = {104, 105}
-    return [
-        node.id
-        for node in sorted(
-            [
-                _TileNode(id=tile, order=tile)
-                if (tile < deck_size or tile in jokers)
-                else _TileNode(id=tile, order=tile - deck_size)
-                for tile in tileset
-            ],
-            key=lambda node: node.order,
-        )
-    ]
+    return sorted(tileset, key=_TILE_ORDER.__getitem__)
 
 
 __pdoc__["Event.serialize"] = False
@@ -1,12 +1,12 @@
 import asyncio
-import json
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, NamedTuple
 from uuid import UUID
 
-from attrs import frozen
 from marshmallow_generic import EXCLUDE, GenericSchema, fields
-from more_itertools import first
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 
+from ..common.encoding import json_dumps
 from ..common.logger import Logger
 from ..messages.server import MessagesDelegate
 from ..models.user import UserToken
@@ -14,6 +14,16 @@ from ..services.users import UsersService
 from .api_client import EventsApiClient
 from .connection import Connection, ConnectionDelegate, TransportClosedError
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # no cov
+    from json import loads as _json_loads
+
+
+DISCONNECT_BATCH_SIZE = 32
+DISCONNECT_BATCH_DELAY = 0.02
+DISCONNECT_MAX_WORKERS = 4
+
 
 class EventsServer(ConnectionDelegate, MessagesDelegate):
     """The server that delivers events to connected users in real-time.
@@ -42,57 +52,90 @@ class EventsServer(ConnectionDelegate, MessagesDelegate):
         """
         self._all_connections: set[Connection] = set()
         self._user_id_connection_map: dict[UUID, Connection] = {}
+        self._connection_id_user_id_map: dict[int, UUID] = {}
+        self._log_ids: dict[UUID, tuple[str, str]] = {}
+        self._pending_disconnects: list[tuple[UUID, int]] = []
+        self._flush_disconnects_handle: asyncio.TimerHandle | None = None
+        self._disconnects_in_flight: int = 0
+        self._disconnects_executor = ThreadPoolExecutor(
+            max_workers=DISCONNECT_MAX_WORKERS, thread_name_prefix="tuicub-disconnect"
+        )
         self._loop: asyncio.AbstractEventLoop = loop
         self._users_service: UsersService = users_service
-        self._session_factory: sessionmaker = session_factory
+        self._session: Session = session_factory()
         self._api_client: EventsApiClient = api_client
         self._logger: Logger = logger
 
     async def listen(self, host: str, port: int) -> None:
         """Start the server on a host and port.
 
+        The thread pool sending disconnect notifications is shut down when
+        the server stops.
+
         Args:
             host (str): The host to bind to.
             port (int): The port to bind to.
         """
-        server = await self._loop.create_server(self.add_protocol, host=host, port=port)
-        async with server:
-            print(f"Starting tuicub events server on {host}:{port}")
-            await server.serve_forever()
-
-    def connection_on_data(self, connection: Connection, data: str) -> None:
+        try:
+            server = await self._loop.create_server(
+                self.add_protocol, host=host, port=port
+            )
+            async with server:
+                print(f"Starting tuicub events server on {host}:{port}")
+                await server.serve_forever()
+        finally:
+            self._disconnects_executor.shutdown(wait=False)
+
+    def connection_on_data_batch(
+        self, connection: Connection, messages: list[str]
+    ) -> None:
         """The `ConnectionDelegate` callback called when a connection receives new data.
 
-        If the data is a valid connection request, the connection is linked to the
-        sending user.
+        All messages are handled within a single database session. Every valid
+        connection request links the connection to the sending user.
+
+        The server handles all data on the loop's thread, so one session is reused
+        for every batch. Closing it after each batch returns its connection to
+        the engine's pool and clears its identity map.
 
         Args:
             connection (Connection): The connection sending the data.
-            data (str): The sent data.
+            messages (list[str]): The received messages.
         """
-        with self._session_factory() as session:
-            try:
-                connect_request = ConnectRequestSchema().loads(data, unknown=EXCLUDE)
-                self._logger.log(
-                    "events_connect_request",
-                    token=str(connect_request.token),
-                    connection_id=str(connection.id),
-                )
-
-                user_token: UserToken = self._users_service.get_user_token(
-                    session=session, token=connect_request.token
-                )
-                self._logger.log(
-                    "events_user_connect",
-                    user_id=str(connect_request.token),
-                    connection_id=str(connection.id),
-                )
-
-                self._user_id_connection_map[user_token.user_id] = connection
-            except Exception as err:
-                self._logger.log_error(
-                    "events_error", err=err, connection_id=str(connection.id)
-                )
+        with self._session as session:
+            for data in messages:
+                self._handle_connect_request(session, connection=connection, data=data)
+
+    def _handle_connect_request(
+        self, session: Session, connection: Connection, data: str
+    ) -> None:
+        try:
+            connect_request = _CONNECT_REQUEST_SCHEMA.loads(data)
+            self._logger.log(
+                "events_connect_request",
+                token=str(connect_request.token),
+                connection_id=str(connection.id),
+            )
+
+            user_token: UserToken = self._users_service.get_user_token(
+                session=session, token=connect_request.token
+            )
+            self._logger.log(
+                "events_user_connect",
+                user_id=str(connect_request.token),
+                connection_id=str(connection.id),
+            )
+
+            self._user_id_connection_map[user_token.user_id] = connection
+            self._connection_id_user_id_map[connection.id] = user_token.user_id
+            self._log_ids[user_token.user_id] = (
+                str(user_token.user_id),
+                str(connection.id),
+            )
+        except Exception as err:
+            self._logger.log_error(
+                "events_error", err=err, connection_id=str(connection.id)
+            )
 
     def connection_connected(self, connection: Connection) -> None:
         """The `ConnectionDelegate` callback called when a connection is estabilished."""
@@ -103,62 +146,108 @@ class EventsServer(ConnectionDelegate, MessagesDelegate):
         """The `ConnectionDelegate` callback called when a connection is lost.
 
         If the connection has been linked to a user, the api server is notified about
-        the disconnected user.
+        the disconnected user. Disconnects are coalesced for a short interval, or until
+        a full batch is collected, and sent in a single request from a dedicated thread
+        pool, so the blocking request does not stall the event loop.
+
+        At most `DISCONNECT_MAX_WORKERS` requests are in flight at once. While all of
+        them are busy, new disconnects keep accumulating and are sent together as soon
+        as one of the requests completes. Disconnects are never dropped, because
+        the api server would then keep the user in their gameroom. A waiting
+        disconnect holds only the user and connection ids, and every request times
+        out, so the backlog drains once the api server responds again.
         """
-        if user_id := self._user_id_for_connection(connection):
-            self._user_id_connection_map.pop(user_id, None)
-
-            try:
-                self._api_client.notify_user_disconnected(user_id=user_id)
-            except Exception as err:
-                self._logger.log_error(
-                    "events_error", err=err, connection_id=str(connection.id)
-                )
-            else:
-                self._logger.log(
-                    "events_user_disconnect",
-                    user_id=str(user_id),
-                    connection_id=str(connection.id),
+        user_id = self._connection_id_user_id_map.pop(connection.id, None)
+        if user_id and self._user_id_connection_map.get(user_id) is connection:
+            del self._user_id_connection_map[user_id]
+            del self._log_ids[user_id]
+            self._pending_disconnects.append((user_id, connection.id))
+
+            if len(self._pending_disconnects) >= DISCONNECT_BATCH_SIZE:
+                self._flush_disconnects()
+            elif not self._flush_disconnects_handle:
+                self._flush_disconnects_handle = self._loop.call_later(
+                    DISCONNECT_BATCH_DELAY, self._flush_disconnects
                 )
         else:
             self._logger.log("events_disconnect", connection_id=str(connection.id))
 
         self._all_connections.remove(connection)
 
-    async def on_event(self, event: dict, recipents: list[UUID]) -> None:
+    def connection_line_too_long(self, connection: Connection) -> None:
+        """The `ConnectionDelegate` callback called when a line exceeds the limit.
+
+        The connection is closed right after, which triggers the usual disconnect.
+        """
+        self._logger.log("events_line_too_long", connection_id=str(connection.id))
+
+    async def on_event(self, event: dict, recipents: tuple[UUID, ...]) -> None:
         """The `MessagesDelegate` callback called when a message with an event arrives.
 
         The event is sent to all connections that have been linked to users in the
-        `recipents` argument.
+        `recipents` argument. The event is encoded once and shared by all recipents.
+        Writes only buffer the data in the transport, so recipents are sent to in
+        turn, without creating a task or a coroutine for each of them.
         """
-        async with asyncio.TaskGroup() as group:
-            for user_id in recipents:
-                group.create_task(self._send(user_id=user_id, event=event))
+        data = json_dumps(event)
+        event_name = event.get("name", "NONE")
+        for user_id in recipents:
+            self._send(user_id=user_id, data=data, event_name=event_name)
 
-    async def _send(self, user_id: UUID, event: dict) -> None:
+    def _send(self, user_id: UUID, data: bytes, event_name: str) -> None:
         if connection := self._user_id_connection_map.get(user_id, None):
+            user_id_str, connection_id_str = self._log_ids[user_id]
             try:
-                await connection.write(json.dumps(event))
+                connection.write(data)
                 self._logger.log(
                     "events_sent",
-                    user_id=str(user_id),
-                    connection_id=str(connection.id),
-                    event_name=event.get("name", "NONE"),
+                    user_id=user_id_str,
+                    connection_id=connection_id_str,
+                    event_name=event_name,
                 )
             except TransportClosedError as err:
                 self._logger.log_error(
-                    "events_error", err=err, connection_id=str(connection.id)
+                    "events_error", err=err, connection_id=connection_id_str
                 )
 
-    def _user_id_for_connection(self, connection: Connection) -> UUID | None:
-        return first(
-            (
-                user_id
-                for user_id, conn in self._user_id_connection_map.items()
-                if conn.id == connection.id
-            ),
-            None,
-        )
+    def _flush_disconnects(self) -> None:
+        if self._flush_disconnects_handle:
+            self._flush_disconnects_handle.cancel()
+            self._flush_disconnects_handle = None
+
+        if (
+            not self._pending_disconnects
+            or self._disconnects_in_flight >= DISCONNECT_MAX_WORKERS
+        ):
+            return
+
+        batch, self._pending_disconnects = self._pending_disconnects, []
+        self._disconnects_in_flight += 1
+        self._loop.run_in_executor(
+            self._disconnects_executor, self._notify_users_disconnected, batch
+        ).add_done_callback(self._on_disconnects_notified)
+
+    def _on_disconnects_notified(self, _: Future | asyncio.Future) -> None:
+        self._disconnects_in_flight -= 1
+        self._flush_disconnects()
+
+    def _notify_users_disconnected(self, batch: list[tuple[UUID, int]]) -> None:
+        try:
+            self._api_client.notify_users_disconnected(
+                user_ids=[user_id for user_id, _ in batch]
+            )
+        except Exception as err:
+            for _, connection_id in batch:
+                self._logger.log_error(
+                    "events_error", err=err, connection_id=str(connection_id)
+                )
+        else:
+            for user_id, connection_id in batch:
+                self._logger.log(
+                    "events_user_disconnect",
+                    user_id=str(user_id),
+                    connection_id=str(connection_id),
+                )
 
     def add_protocol(self) -> asyncio.Protocol:
         """The factory for creating new protocols."""
@@ -169,8 +258,7 @@ class EventsServer(ConnectionDelegate, MessagesDelegate):
         return connection.protocol
 
 
-@frozen
-class ConnectRequest:
+class ConnectRequest(NamedTuple):
     """The model for a connect request.
 
     Attributes:
@@ -183,4 +271,20 @@ class ConnectRequest:
 class ConnectRequestSchema(GenericSchema[ConnectRequest]):
     """The schema of the connect request."""
 
+    class Meta:
+        unknown = EXCLUDE
+
     token = fields.Str(required=True, allow_none=False)
+
+    def loads(self, json_data: str, *args: Any, **kwargs: Any) -> Any:
+        """Deserialize a connect request from JSON."""
+        try:
+            data = _json_loads(json_data)
+        except ValueError:
+            data = None
+        if isinstance(data, dict) and type(token := data.get("token")) is str:
+            return ConnectRequest(token=token)
+        return super().loads(json_data, *args, **kwargs)
+
+
+_CONNECT_REQUEST_SCHEMA = ConnectRequestSchema()
@@ -1,42 +1,60 @@
 import socket
 
-from .message import Message, MessageEnvelope, MessageEnvelopeSchema
+from ..common.encoding import json_dumps
+from .message import Message
 
 
 class MessagesClient:
-    """The client for delivering messages over a socket."""
+    """The client for delivering messages over a socket.
 
-    def __init__(self, host: str, port: int, token: str, schema: MessageEnvelopeSchema):
+    Every message is sent as one line of JSON, in an envelope object with
+    the authentication `token`, and the `message` holding its `recipents`
+    and `event`. The part of the envelope holding the token is the same for every
+    message, so it is encoded once.
+    """
+
+    def __init__(self, host: str, port: int, token: str):
         """Initialize new client.
 
         Args:
             host (str): The host to connect to.
             port (int): The port to connect to.
             token (str): The authentication token to include in a message.
-            schema (MessageEnvelopeSchema): The schema for serializing messages.
         """
         self._socket: socket.socket | None = None
         self._token: str = token
+        self._envelope_prefix: bytes = b'{"token":%s,"message":' % json_dumps(token)
         self._host: str = host
         self._port: int = port
-        self._schema: MessageEnvelopeSchema = schema
 
     def send(self, *messages: Message) -> None:
         """Send messages.
 
-        The messages are serialized and authenticated using a token.
+        The messages are serialized and authenticated using a token, and written to
+        the socket in a single call.
 
         Args:
             messages (Message): The messages to send.
         """
-        if self._socket:
-            for message in messages:
-                serialized = self._schema.dumps(
-                    MessageEnvelope(token=self._token, message=message)
-                )
-
-                self._socket.sendall(f"{serialized}\n".encode())
+        if self._socket and messages:
+            self._socket.sendall(
+                b"".join([self._encode(message) for message in messages])
+            )
 
     def connect(self) -> None:
-        """Connect to the host and port passed on initialization."""
+        """Connect to the host and port passed on initialization.
+
+        Nagle's algorithm is disabled, so messages are not held back waiting
+        for more data.
+        """
         self._socket = socket.create_connection((self._host, self._port))
+        self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def _encode(self, message: Message) -> bytes:
+        body = json_dumps(
+            {
+                "recipents": message.recipents,
+                "event": message.event,
+            }
+        )
+        return self._envelope_prefix + body + b"}\n"
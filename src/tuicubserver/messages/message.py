@@ -1,25 +1,28 @@
 from __future__ import annotations
 
 import uuid
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
-from attrs import frozen
-from marshmallow_generic import GenericSchema, fields
+from marshmallow import ValidationError
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # no cov
+    from json import loads as _json_loads
 
 if TYPE_CHECKING:
     from ..events.events import Event
 
 
-@frozen
-class Message:
+class Message(NamedTuple):
     """A message to the events server containing a serialized event and recipents.
 
     Attributes:
-        recipents (list[uuid.UUID]): The list of recipents of the event.
+        recipents (tuple[uuid.UUID, ...]): The recipents of the event.
         event (dict): The serialized event.
     """
 
-    recipents: list[uuid.UUID]
+    recipents: tuple[uuid.UUID, ...]
     event: dict
 
     @classmethod
@@ -32,12 +35,10 @@ class Message:
         Returns:
             The created message.
         """
-        payload = {"name": event.event_name, "data": event.serialize()}
-        return Message(recipents=list(event.recipents), event=payload)
+        return Message(recipents=event.recipents, event=event.payload())
 
 
-@frozen
-class MessageEnvelope:
+class MessageEnvelope(NamedTuple):
     """A wrapper object for a message that includes an authentication token.
 
     Attributes:
@@ -49,21 +50,43 @@ class MessageEnvelope:
     message: Message
 
 
-class MessageSchema(GenericSchema[Message]):
-    """The schema for serializing and deserializing messages."""
-
-    class Meta:
-        ordered = True
+def decode_envelope(data: bytes) -> MessageEnvelope:
+    """Decode a message envelope from a line of JSON.
 
-    recipents = fields.List(fields.UUID())
-    event = fields.Dict(required=True, allow_none=False)
+    The envelope is an object with a string `token`, and a `message` object.
+    The message holds an `event` object, and an optional `recipents` list
+    of UUID strings.
 
+    Args:
+        data (bytes): The encoded envelope.
 
-class MessageEnvelopeSchema(GenericSchema[MessageEnvelope]):
-    """The schema for serializing and deserializing message envelopes."""
+    Returns:
+        The decoded message envelope.
 
-    class Meta:
-        ordered = True
-
-    token = fields.Str(required=True, allow_none=False)
-    message = fields.Nested(MessageSchema)
+    Raises:
+        ValidationError: Raised when the data is not a valid message envelope.
+    """
+    envelope = _json_loads(data)
+    if not isinstance(envelope, dict):
+        raise ValidationError(message="envelope must be an object.")
+
+    token = envelope.get("token")
+    message = envelope.get("message")
+    if not isinstance(token, str):
+        raise ValidationError(message="token must be a string.")
+    if not isinstance(message, dict):
+        raise ValidationError(message="message must be an object.")
+
+    event = message.get("event")
+    raw_recipents = message.get("recipents", ())
+    if not isinstance(event, dict):
+        raise ValidationError(message="event must be an object.")
+    if not isinstance(raw_recipents, list | tuple):
+        raise ValidationError(message="recipents must be a list.")
+
+    try:
+        recipents = tuple(uuid.UUID(id) for id in raw_recipents)
+    except (TypeError, ValueError, AttributeError) as e:
+        raise ValidationError(message="recipents must be UUIDs.") from e
+
+    return MessageEnvelope(token=token, message=Message(recipents=recipents, event=event))
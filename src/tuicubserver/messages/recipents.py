@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypeAlias
 from uuid import UUID
 
 if TYPE_CHECKING:
@@ -9,67 +8,43 @@ if TYPE_CHECKING:
     from ..models.gameroom import Gameroom
     from ..models.user import User
 
+Recipents: TypeAlias = tuple[UUID, ...]
+"""Recipents of a message, as a tuple of user ids."""
 
-class Recipents(Sequence[UUID]):
-    """Recipents of a message."""
 
-    __slots__ = ("_recipents",)
+def all_users_but_sender(sender: User, gameroom: Gameroom) -> Recipents:
+    """Recipents are all users in a gameroom, except for the sender.
 
-    def __init__(self, recipents: Sequence[UUID]):
-        """Initialize new recipents.
+    Args:
+        sender (User): The sender of the message.
+        gameroom (Gameroom): The gameroom of the sender.
 
-        Args:
-            recipents (Sequence[UUID]): The sequence of recipents ids.
-        """
-        self._recipents: Sequence[UUID] = recipents
+    Returns:
+        The recipents.
+    """
+    sender_id = sender.id
+    return tuple(user.id for user in gameroom.users if user.id != sender_id)
 
-    def __getitem__(self, key, /):  # noqa: ANN001
-        return self._recipents[key]
 
-    def __len__(self) -> int:
-        return len(self._recipents)
+def single_recipent(user_id: UUID) -> Recipents:
+    """A single recipent.
 
+    Args:
+        user_id (UUID): The id of the recipent.
 
-class AllUsersButSender(Recipents):
-    """Recipents are all users in a gameroom, except for the sender."""
+    Returns:
+        The recipents.
+    """
+    return (user_id,)
 
-    __slots__ = ()
 
-    def __init__(self, sender: User, gameroom: Gameroom):
-        """Initialize new recipents.
+def all_players(game: Game) -> Recipents:
+    """Recipents are all players in a game.
 
-        Args:
-            sender (User): The sender of the message.
-            gameroom (Gameroom): The gameroom of the sende.r
-        """
-        super().__init__(
-            recipents=[user.id for user in gameroom.users if user.id != sender.id]
-        )
+    Args:
+        game (Game): The game to send the message to.
 
-
-class SingleRecipent(Recipents):
-    """A single recipent."""
-
-    __slots__ = ()
-
-    def __init__(self, user_id: UUID):
-        """Initialize new recipents.
-
-        Args:
-            user_id (UUID): The id of the sender.
-        """
-        super().__init__(recipents=[user_id])
-
-
-class AllPlayers(Recipents):
-    """Recipents are all players in a game."""
-
-    __slots__ = ()
-
-    def __init__(self, game: Game):
-        """Initialize new recipents.
-
-        Args:
-            game (Game): The game to send the message to.
-        """
-        super().__init__(recipents=[player.user_id for player in game.game_state.players])
+    Returns:
+        The recipents.
+    """
+    return tuple(player.user_id for player in game.game_state.players)
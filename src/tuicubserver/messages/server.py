@@ -5,18 +5,21 @@ from weakref import ReferenceType, ref
 
 from ..common.logger import Logger
 from ..services.auth import AuthService
-from .message import MessageEnvelopeSchema
+from .message import decode_envelope
+
+READ_CHUNK_SIZE = 2**18
+MAX_MESSAGE_SIZE = 2**20
 
 
 class MessagesDelegate(Protocol):
     """The delegate of the messages server."""
 
-    async def on_event(self, event: dict, recipents: list[UUID]) -> None:
+    async def on_event(self, event: dict, recipents: tuple[UUID, ...]) -> None:
         """Callback called whenever a valid message arrives.
 
         Args:
             event (dict): The event from the message.
-            recipents (list[UUID]): The recipents of the event.
+            recipents (tuple[UUID, ...]): The recipents of the event.
         """
 
 
@@ -51,11 +54,17 @@ class MessagesServer:
     async def listen(self, host: str, port: int) -> None:
         """Start the server on a host and port.
 
+        The stream readers are created with `MAX_MESSAGE_SIZE` as their limit, so
+        they keep buffering a burst of messages instead of pausing the transport,
+        and the burst is drained with a few large reads.
+
         Args:
             host (str): The host to bind to.
             port (int): The port to bind to.
         """
-        server = await asyncio.start_server(self.client_connected, host=host, port=port)
+        server = await asyncio.start_server(
+            self.client_connected, host=host, port=port, limit=MAX_MESSAGE_SIZE
+        )
         async with server:
             print(f"Starting tuicub messages server on {host}:{port}")
             self._logger.log("messages_server_start")
@@ -66,29 +75,76 @@ class MessagesServer:
     ) -> None:
         """The callback called when a client connects.
 
-        The reading stream is read line by line. Each line is deserialized to
+        The reading stream is read in chunks and split into lines, so all messages
+        sent together are handled after a single read. Each line is deserialized to
         a message envelope, and if the envelope has a valid authentication token,
         the event from the message is passed to the delegate along its recipents.
 
+        Events are dispatched inline, in the order they were read. The delegate only
+        buffers writes to its connections, so dispatching never waits on I/O and
+        holds up the next read only for the time it takes to encode the event.
+
+        The weakly referenced delegate is resolved once per read, for all lines in it.
+        A line longer than `MAX_MESSAGE_SIZE` is discarded, along with the rest of
+        it up to the next newline. The incomplete line is kept in a buffer that
+        grows in place, so it is not copied on every read.
+
         Args:
             reader (asyncio.StreamReader): The reading stream.
             writer (asyncio.StreamWriter): The writing stream.
         """
         self._logger.log("messages_server_connect")
 
-        async for data in reader:
-            raw_message = data.decode().strip()
-            try:
-                envelope = MessageEnvelopeSchema().loads(raw_message)
-
-                self._auth_service.authorize_message(secret=envelope.token)
-
-                if self._delegate and (delegate := self._delegate()):
-                    await delegate.on_event(
-                        event=envelope.message.event, recipents=envelope.message.recipents
-                    )
-            except Exception as err:
-                self._logger.log_error("messages_error", err=err)
+        pending = bytearray()
+        discarding = False
+        while chunk := await reader.read(READ_CHUNK_SIZE):
+            start = 0
+            if discarding:
+                start = chunk.find(b"\n") + 1
+                if not start:
+                    continue
+                discarding = False
+
+            end = chunk.rfind(b"\n", start)
+            if end < 0:
+                pending += chunk[start:] if start else chunk
+            else:
+                pending += chunk[start:end]
+                lines = pending.split(b"\n")
+                pending = bytearray(chunk[end + 1 :])
+                delegate = self._current_delegate()
+                for data in lines:
+                    await self._handle_message(data, delegate)
+
+            if len(pending) > MAX_MESSAGE_SIZE:
+                self._logger.log_error(
+                    "messages_error", err=ValueError("Message exceeds the size limit.")
+                )
+                pending.clear()
+                discarding = True
+
+        if pending:
+            await self._handle_message(pending, self._current_delegate())
+
+    def _current_delegate(self) -> MessagesDelegate | None:
+        return self._delegate() if self._delegate else None
+
+    async def _handle_message(
+        self, data: bytes, delegate: MessagesDelegate | None
+    ) -> None:
+        try:
+            envelope = decode_envelope(data)
+
+            if not self._auth_service.is_message_authorized(secret=envelope.token):
+                self._logger.log("messages_unauthorized")
+                return
+
+            if delegate:
+                await delegate.on_event(
+                    event=envelope.message.event, recipents=envelope.message.recipents
+                )
+        except Exception as err:
+            self._logger.log_error("messages_error", err=err)
 
     def set_delegate(self, delegate: MessagesDelegate) -> None:
         """Sets the delegate as a weak reference."""
@@ -164,26 +164,27 @@ class MessagesService:
         sends `board_changed` to all players, and `turn_started` to the player after
         the disconnected player in the turn order.
 
+        All events are sent together in a single call to the client.
+
         Args:
             sender (User): The disconnected user.
             result (GameDisconnectResult): The result of the disconnection.
         """
-        self._client.send(
-            Message.from_event(PlayerLeftEvent(result.player, result.game)),
-            Message.from_event(PlayersChangedEvent(result.game)),
-        )
+        game = result.game
+        messages = [
+            Message.from_event(PlayerLeftEvent(result.player, game)),
+            Message.from_event(PlayersChangedEvent(game)),
+        ]
 
-        if result.game.winner:
-            self._client.send(
-                Message.from_event(PlayerWonEvent(result.game.winner, result.game))
-            )
+        if game.winner:
+            messages.append(Message.from_event(PlayerWonEvent(game.winner, game)))
         else:
-            self._client.send(Message.from_event(PileCountChangedEvent(result.game)))
+            messages.append(Message.from_event(PileCountChangedEvent(game)))
             if result.turn:
-                self._client.send(
-                    Message.from_event(BoardChangedEvent(result.game)),
-                    Message.from_event(TurnStartedEvent(result.game)),
-                )
+                messages.append(Message.from_event(BoardChangedEvent(game)))
+                messages.append(Message.from_event(TurnStartedEvent(game)))
+
+        self._client.send(*messages)
 
     def disconnected_gameroom(self, sender: User, result: DisconnectResult) -> None:
         """Send events after a user has been disconnected.
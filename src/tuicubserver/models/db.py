@@ -36,16 +36,6 @@ class DbUserToken(DbBase):
     user_id: Mapped[UUID] = mapped_column(Uuid)
     """The id of the user that the authentication token belongs to."""
 
-    def __eq__(self, other: object) -> bool:
-        if not isinstance(other, DbUserToken):
-            return NotImplemented
-
-        return (
-            self.id == other.id
-            and self.token == other.token
-            and self.user_id == other.user_id
-        )
-
 
 class DbUser(DbBase):
     """The database model for a user."""
@@ -61,15 +51,6 @@ class DbUser(DbBase):
     )
     """The optional id of the gameroom that the user is currently in."""
 
-    def __eq__(self, other: object) -> bool:
-        if not isinstance(other, DbUser):
-            return NotImplemented
-        return (
-            self.id == other.id
-            and self.name == other.name
-            and self.current_gameroom_id == other.current_gameroom_id
-        )
-
 
 class DbGameroom(DbBase):
     """The database model for a gameroom."""
@@ -97,19 +78,6 @@ class DbGameroom(DbBase):
     )
     """An optional game started in this gameroom."""
 
-    def __eq__(self, other: object) -> bool:
-        if not isinstance(other, DbGameroom):
-            return NotImplemented
-        return (
-            self.id == other.id
-            and self.name == other.name
-            and self.owner_id == other.owner_id
-            and self.status == other.status
-            and self.created_at == other.created_at
-            and self.users == other.users
-            and self.game == other.game
-        )
-
 
 class DbPlayer(DbBase):
     """The database model for a player."""
@@ -129,17 +97,6 @@ class DbPlayer(DbBase):
     game_state_id: Mapped[UUID] = mapped_column(Uuid, ForeignKey("game_state.id"))
     """The id of the game state that this players belongs to."""
 
-    def __eq__(self, other: object) -> bool:
-        if not isinstance(other, DbPlayer):
-            return NotImplemented
-        return (
-            self.id == other.id
-            and self.name == other.name
-            and self.rack == other.rack
-            and self.user_id == other.user_id
-            and self.game_state_id == other.game_state_id
-        )
-
 
 class DbMove(DbBase):
     """The database model for a tiles move."""
@@ -159,17 +116,6 @@ class DbMove(DbBase):
     turn_id: Mapped[UUID] = mapped_column(Uuid, ForeignKey("turn.id"))
     """The id of the turn that this move belongs to."""
 
-    def __eq__(self, other: object) -> bool:
-        if not isinstance(other, DbMove):
-            return NotImplemented
-        return (
-            self.id == other.id
-            and self.revision == other.revision
-            and self.board == other.board
-            and self.rack == other.rack
-            and self.turn_id == other.turn_id
-        )
-
 
 class DbTurn(DbBase):
     """The database model for a turn."""
@@ -196,19 +142,6 @@ class DbTurn(DbBase):
     moves: Mapped[list[DbMove]] = relationship(cascade="all, delete-orphan")
     """Moves made this turn."""
 
-    def __eq__(self, other: object) -> bool:
-        if not isinstance(other, DbTurn):
-            return NotImplemented
-        return (
-            self.id == other.id
-            and self.revision == other.revision
-            and self.starting_board == other.starting_board
-            and self.starting_rack == other.starting_rack
-            and self.player_id == other.player_id
-            and self.game_id == other.game_id
-            and self.moves == other.moves
-        )
-
 
 class DbGameState(DbBase):
     """The database model for a game state."""
@@ -229,17 +162,6 @@ class DbGameState(DbBase):
     players: Mapped[list[DbPlayer]] = relationship(cascade="all, delete-orphan")
     """The players participating in this game."""
 
-    def __eq__(self, other: object) -> bool:
-        if not isinstance(other, DbGameState):
-            return NotImplemented
-        return (
-            self.id == other.id
-            and self.pile == other.pile
-            and self.board == other.board
-            and self.game_id == other.game_id
-            and self.players == other.players
-        )
-
 
 class DbGame(DbBase):
     """The database model for a game."""
@@ -275,17 +197,3 @@ class DbGame(DbBase):
         primaryjoin=winner_id == DbPlayer.id, post_update=True
     )
     """The optional player that won the game."""
-
-    def __eq__(self, other: object) -> bool:
-        if not isinstance(other, DbGame):
-            return NotImplemented
-        return (
-            self.id == other.id
-            and self.turn_order == other.turn_order
-            and self.made_meld == other.made_meld
-            and self.gameroom_id == other.gameroom_id
-            and self.winner_id == other.winner_id
-            and self.game_state == other.game_state
-            and self.turn == other.turn
-            and self.winner == other.winner
-        )
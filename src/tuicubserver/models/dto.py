@@ -1,12 +1,11 @@
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
-from datetime import datetime
-from functools import cmp_to_key
+from collections.abc import Callable, Iterable
+from datetime import UTC, datetime
+from typing import Any
 from uuid import UUID
 
 from attrs import frozen
-from marshmallow import Schema, fields
 
 from .game import Game, Player
 from .gameroom import Gameroom
@@ -14,12 +13,23 @@ from .status import GameroomStatus
 from .user import User
 
 
-class BaseDto(ABC):
-    """Base class for all dtos."""
+class BaseDto:
+    """Base class for all dtos.
 
-    @abstractmethod
-    def serialize(self) -> dict:
-        """Returns the dictionary representation of the dto."""
+    A plain slotted class rather than an `ABC`, so dtos created for every response
+    and event skip the `ABCMeta` machinery and carry no instance `__dict__`.
+
+    Every subclass must define `serialize`, returning the dictionary representation
+    of the dto. This is checked when the subclass is created.
+    """
+
+    __slots__ = ()
+
+    def __init_subclass__(cls, abstract: bool = False, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if not abstract and not hasattr(cls, "serialize"):
+            msg = f"{cls.__name__} must define: serialize."
+            raise TypeError(msg)
 
 
 @frozen
@@ -35,7 +45,7 @@ class UserDto(BaseDto):
         return UserDto(id=user.id, name=user.name)
 
     def serialize(self) -> dict:
-        return UserSchema().dump(self)
+        return _serialize_user(self.id, self.name)
 
 
 @frozen
@@ -48,7 +58,12 @@ class PlayerDto(BaseDto):
     has_turn: bool
 
     def serialize(self) -> dict:
-        return PlayerSchema().dump(self)
+        return _serialize_player(
+            name=self.name,
+            user_id=self.user_id,
+            tiles_count=self.tiles_count,
+            has_turn=self.has_turn,
+        )
 
 
 @frozen
@@ -65,32 +80,27 @@ class GameStateDto(BaseDto):
     def create(cls, game: Game, user: User) -> GameStateDto:
         """Returns a game state dto for the user."""
         game_state = game.game_state
-        player: Player | None = next(
-            (player for player in game_state.players if player.user_id == user.id), None
-        )
-
-        return GameStateDto(
-            id=game_state.id,
-            players=create_players(game),
-            board=game_state.board.as_list(),
-            pile_count=len(game_state.pile),
-            rack=[] if not player else player.rack.as_list(),
-        )
+        rack: list[int] = []
+        for player in game_state.players:
+            if player.user_id == user.id:
+                rack = player.rack.as_list()
+                break
 
-    @classmethod
-    def for_player(cls, game: Game, player: Player) -> GameStateDto:
-        """Returns a game state dto for the player."""
-        game_state = game.game_state
         return GameStateDto(
             id=game_state.id,
-            players=create_players(game),
+            players=_create_players(game),
             board=game_state.board.as_list(),
             pile_count=len(game_state.pile),
-            rack=player.rack.as_list(),
+            rack=rack,
         )
 
     def serialize(self) -> dict:
-        return GameStateSchema().dump(self)
+        return _serialize_game_state(
+            players=[player.serialize() for player in self.players],
+            board=self.board,
+            pile_count=self.pile_count,
+            rack=self.rack,
+        )
 
 
 @frozen
@@ -121,27 +131,13 @@ class GameDto(BaseDto):
             winner=winner,
         )
 
-    @classmethod
-    def for_player(cls, game: Game, player: Player) -> GameDto:
-        """Returns a game dto for the player."""
-        winner: PlayerDto | None = None
-        if game.winner:
-            winner = PlayerDto(
-                user_id=game.winner.user_id,
-                name=game.winner.name,
-                tiles_count=len(game.winner.rack),
-                has_turn=game.turn.player_id == game.winner.id,
-            )
-
-        return GameDto(
-            id=game.id,
-            game_state=GameStateDto.for_player(game, player),
-            gameroom_id=game.gameroom_id,
-            winner=winner,
-        )
-
     def serialize(self) -> dict:
-        return GameSchema().dump(self)
+        return _serialize_game(
+            id=self.id,
+            gameroom_id=self.gameroom_id,
+            game_state=self.game_state.serialize(),
+            winner=self.winner.serialize() if self.winner else None,
+        )
 
 
 @frozen
@@ -170,85 +166,181 @@ class GameroomDto(BaseDto):
         )
 
     def serialize(self) -> dict:
-        return GameroomSchema().dump(self)
+        return _serialize_gameroom(
+            id=self.id,
+            name=self.name,
+            owner_id=self.owner_id,
+            status=self.status,
+            created_at=self.created_at,
+            users=[user.serialize() for user in self.users],
+            game_id=self.game_id,
+        )
 
 
-def create_players(game: Game) -> list[PlayerDto]:
-    """Create a list of player dtos from a game.
+def serialize_gamerooms(gamerooms: Iterable[Gameroom]) -> list[dict]:
+    """Serialize gamerooms in a single pass.
 
-    The players are sorted by the turn order.
+    Produces the same dictionaries as `GameroomDto.serialize`, using the same
+    field mapping, but reads the gamerooms directly instead of creating
+    an intermediate dto for every gameroom and user.
 
     Args:
-        game (Game): The game to create players from.
+        gamerooms (Iterable[Gameroom]): The gamerooms to serialize.
 
     Returns:
-        The sorted list of player dtos.
+        The list of serialized gamerooms.
     """
-    turn_order: tuple[UUID, ...] = game.turn_order
-    players: list[PlayerDto] = [
-        PlayerDto(
-            user_id=player.user_id,
-            name=player.name,
-            tiles_count=len(player.rack),
-            has_turn=game.turn.player_id == player.id,
+    return [
+        _serialize_gameroom(
+            id=gameroom.id,
+            name=gameroom.name,
+            owner_id=gameroom.owner_id,
+            status=gameroom.status,
+            created_at=gameroom.created_at,
+            users=[_serialize_user(user.id, user.name) for user in gameroom.users],
+            game_id=None if not gameroom.game else gameroom.game.id,
         )
-        for player in game.game_state.players
+        for gameroom in gamerooms
     ]
 
-    def order(lhs: PlayerDto, rhs: PlayerDto) -> int:
-        lhs_index = turn_order.index(lhs.user_id)
-        rhs_index = turn_order.index(rhs.user_id)
-        if lhs_index == rhs_index:
-            return 0
-        elif lhs_index < rhs_index:
-            return -1
-        else:
-            return 1
-
-    return sorted(players, key=cmp_to_key(order))
-
-
-class UserSchema(Schema):
-    """The schema for a user."""
-
-    id = fields.UUID()
-    name = fields.Str()
-
 
-class GameroomSchema(Schema):
-    """The schema for a gameroom."""
+def serialize_game_for_player(game: Game, player: Player) -> dict:
+    """Serialize a game for the player in a single pass.
 
-    id = fields.UUID()
-    name = fields.Str()
-    owner_id = fields.UUID()
-    status = fields.Enum(GameroomStatus, by_value=True)
-    created_at = fields.DateTime(format="timestamp_ms")
-    users = fields.List(fields.Nested(UserSchema))
-    game_id = fields.UUID(allow_none=True, required=False)
+    Uses the same field mapping as `GameDto.serialize`, but reads the game directly
+    instead of creating the nested game state and player dtos.
 
+    Args:
+        game (Game): The game to serialize.
+        player (Player): The player to serialize the game for.
 
-class PlayerSchema(Schema):
-    """The schema for a player."""
+    Returns:
+        The serialized game.
+    """
+    game_state = game.game_state
+    winner = game.winner
+
+    return _serialize_game(
+        id=game.id,
+        gameroom_id=game.gameroom_id,
+        game_state=_serialize_game_state(
+            players=serialize_players(game),
+            board=game_state.board.as_list(),
+            pile_count=len(game_state.pile),
+            rack=player.rack.as_list(),
+        ),
+        winner=_serialize_game_player(winner, game.turn.player_id) if winner else None,
+    )
 
-    name = fields.Str()
-    user_id = fields.UUID(required=False, allow_none=True)
-    tiles_count = fields.Int()
-    has_turn = fields.Bool()
 
+def serialize_players(game: Game) -> list[dict]:
+    """Serialize the players of a game, sorted by the turn order.
 
-class GameStateSchema(Schema):
-    """The schema for a game state."""
+    Uses the same field mapping as `PlayerDto.serialize`, without creating a dto
+    for every player.
 
-    players = fields.List(fields.Nested(PlayerSchema))
-    board = fields.List(fields.List(fields.Int))
-    pile_count = fields.Int()
-    rack = fields.List(fields.Int)
+    Args:
+        game (Game): The game to serialize players of.
 
+    Returns:
+        The sorted list of serialized players.
+    """
+    turn_player_id = game.turn.player_id
+    players = sorted(game.game_state.players, key=_turn_order_key(game))
+    return [_serialize_game_player(player, turn_player_id) for player in players]
 
-class GameSchema(Schema):
-    """The schema for a game."""
 
-    id = fields.UUID()
-    gameroom_id = fields.UUID(required=False, allow_none=True)
-    game_state = fields.Nested(GameStateSchema)
-    winner = fields.Nested(PlayerSchema, allow_none=True)
+def _create_players(game: Game) -> list[PlayerDto]:
+    turn_player_id = game.turn.player_id
+    players: list[PlayerDto] = [
+        PlayerDto(
+            user_id=player.user_id,
+            name=player.name,
+            tiles_count=len(player.rack),
+            has_turn=turn_player_id == player.id,
+        )
+        for player in game.game_state.players
+    ]
+    players.sort(key=_turn_order_key(game))
+    return players
+
+
+def _turn_order_key(game: Game) -> Callable[[Player | PlayerDto], int]:
+    order = {user_id: index for index, user_id in enumerate(game.turn_order)}
+    return lambda player: order[player.user_id]
+
+
+def _serialize_game_player(player: Player, turn_player_id: UUID) -> dict:
+    return _serialize_player(
+        name=player.name,
+        user_id=player.user_id,
+        tiles_count=len(player.rack),
+        has_turn=turn_player_id == player.id,
+    )
+
+
+def _serialize_player(
+    name: str, user_id: UUID | None, tiles_count: int, has_turn: bool
+) -> dict:
+    return {
+        "name": name,
+        "user_id": _optional_str(user_id),
+        "tiles_count": tiles_count,
+        "has_turn": has_turn,
+    }
+
+
+def _serialize_game(
+    id: UUID, gameroom_id: UUID, game_state: dict, winner: dict | None
+) -> dict:
+    return {
+        "id": str(id),
+        "gameroom_id": _optional_str(gameroom_id),
+        "game_state": game_state,
+        "winner": winner,
+    }
+
+
+def _serialize_game_state(
+    players: list[dict], board: list[list[int]], pile_count: int, rack: list[int]
+) -> dict:
+    return {
+        "players": players,
+        "board": board,
+        "pile_count": pile_count,
+        "rack": rack,
+    }
+
+
+def _serialize_user(id: UUID, name: str) -> dict:
+    return {"id": str(id), "name": name}
+
+
+def _serialize_gameroom(
+    id: UUID,
+    name: str,
+    owner_id: UUID,
+    status: GameroomStatus,
+    created_at: datetime,
+    users: list[dict],
+    game_id: UUID | None,
+) -> dict:
+    return {
+        "id": str(id),
+        "name": name,
+        "owner_id": str(owner_id),
+        "status": status.value,
+        "created_at": _timestamp_ms(created_at),
+        "users": users,
+        "game_id": _optional_str(game_id),
+    }
+
+
+def _optional_str(value: UUID | None) -> str | None:
+    return None if value is None else str(value)
+
+
+def _timestamp_ms(value: datetime) -> float:
+    if value.tzinfo is None or value.tzinfo.utcoffset(value) is None:
+        value = value.replace(tzinfo=UTC)
+    return value.timestamp() * 1000
@@ -2,19 +2,19 @@ from __future__ import annotations
 
 import json
 import uuid
-from collections.abc import Callable, Sequence
+from bisect import insort
+from collections.abc import Callable
 from typing import TYPE_CHECKING
 from uuid import UUID
 
 from attrs import evolve, field, frozen
-from more_itertools import first, flatten, last
 
 from ..common.errors import BadRequestError, ForbiddenError
 
 if TYPE_CHECKING:
     from ..services.rng import RngService
 
-JOKERS = {104, 105}
+JOKERS: frozenset[int] = frozenset((104, 105))
 MAX_TILE_VALUE = 13
 
 
@@ -49,11 +49,11 @@ class Tileset:
 
     def contains_jokers(self) -> bool:
         """Returns true if this set contains one or two jokers."""
-        return any(tile in JOKERS for tile in self.tiles)
+        return not JOKERS.isdisjoint(self.tiles)
 
     def filter_jokers(self) -> tuple[int, ...]:
         """Returns tuple of tile ids without the jokers."""
-        return tuple(tile for tile in self.tiles if tile not in JOKERS)
+        return tuple([tile for tile in self.tiles if tile not in JOKERS])
 
     def jokers_count(self) -> int:
         """Returns the number of jokers in this set."""
@@ -61,7 +61,9 @@ class Tileset:
 
     def with_new_tile(self, tile: int) -> Tileset:
         """Return a copy of the tile set with the added new tile."""
-        return Tileset.create([*self.tiles, tile])
+        tiles = list(self.tiles)
+        insort(tiles, tile)
+        return Tileset(tiles=tuple(tiles))
 
     def __len__(self) -> int:
         return len(self.tiles)
@@ -88,32 +90,40 @@ class Pile:
         """
         self._tiles: list[int] = tiles
 
-    def draw(self, pick: Callable[[Sequence[int]], int]) -> int:
+    def as_list(self) -> list[int]:
+        """Returns a copy of the list of tile ids on this pile."""
+        return list(self._tiles)
+
+    def draw(self, pick_index: Callable[[int], int]) -> int:
         """Draw a tile.
 
+        The drawn tile is swapped with the last tile on the pile and popped, so the
+        remaining tiles are not shifted.
+
         Args:
-            pick (Callable[[Sequence[int]], int]): The function that randomly
-                selects an item from a list.
+            pick_index (Callable[[int], int]): The function that randomly selects
+                an index of a list of the given size.
 
         Returns:
             The id of the drawn tile.
         """
-        tile = pick(self._tiles)
-        self._tiles.remove(tile)
-        return tile
+        tiles = self._tiles
+        index = pick_index(len(tiles))
+        tiles[index], tiles[-1] = tiles[-1], tiles[index]
+        return tiles.pop()
 
-    def draw_rack(self, pick: Callable[[Sequence[int]], int]) -> Tileset:
+    def draw_rack(self, pick_index: Callable[[int], int]) -> Tileset:
         """Draw a rack consisting of 14 random tiles.
 
         Args:
-            pick (Callable[[Sequence[int]], int]): The function that randomly
-                selects an item from a list.
+            pick_index (Callable[[int], int]): The function that randomly selects
+                an index of a list of the given size.
 
         Returns:
             The drawn rack.
         """
         rack_size = 14
-        return Tileset(tiles=tuple(self.draw(pick) for _ in range(rack_size)))
+        return Tileset.create([self.draw(pick_index) for _ in range(rack_size)])
 
     def return_rack(
         self, rack: Tileset, shuffle: Callable[[list[int]], list[int]]
@@ -130,7 +140,7 @@ class Pile:
         if not isinstance(other, Pile):
             return NotImplemented  # no cov
 
-        return self.tiles == other.tiles
+        return self._tiles == other._tiles
 
     def __hash__(self) -> int:
         return hash(self.tiles)
@@ -163,7 +173,7 @@ class Board:
 
     def all_tiles(self) -> list[int]:
         """Return a flattened list of all tile ids present on the board."""
-        return list(flatten([tileset.tiles for tileset in self.tilesets]))
+        return [tile for tileset in self.tilesets for tile in tileset.tiles]
 
     def serialize(self) -> list[str]:
         """Return a list of serialized tile sets on the board."""
@@ -171,7 +181,7 @@ class Board:
 
     def as_list(self) -> list[list[int]]:
         """Return a list of of lists of tile ids on the board."""
-        return [tileset.as_list() for tileset in self.tilesets]
+        return [list(tileset.tiles) for tileset in self.tilesets]
 
 
 @frozen
@@ -285,10 +295,8 @@ class Turn:
         if self.revision == 1:
             return None
 
-        move: Move | None = next(
-            (move for move in self.moves if move.revision == self.revision - 1), None
-        )
-        if not move:
+        move = self._move_for_revision(self.revision - 1)
+        if move is None:
             raise NoMoveToUndoError(revision=self.revision)
         return move
 
@@ -301,13 +309,17 @@ class Turn:
         Raises:
             NoMoveToRedoError: Raised when there are no next moves.
         """
-        move: Move | None = next(
-            (move for move in self.moves if move.revision == self.revision + 1), None
-        )
-        if not move:
+        move = self._move_for_revision(self.revision + 1)
+        if move is None:
             raise NoMoveToRedoError(revision=self.revision)
         return move
 
+    def _move_for_revision(self, revision: int) -> Move | None:
+        for move in self.moves:
+            if move.revision == revision:
+                return move
+        return None
+
     def with_revision(self, revision: int) -> Turn:
         """Return a copy of this turn with a new revision.
 
@@ -368,8 +380,9 @@ class GameState:
         Raises:
             PlayerNotFoundError: Raised when a player with the id is not in the game.
         """
-        if player := next((player for player in self.players if player.id == id), None):
-            return player
+        for player in self.players:
+            if player.id == id:
+                return player
         raise PlayerNotFoundError(player_id=id)
 
     def with_updated_player(self, player: Player) -> GameState:
@@ -384,16 +397,13 @@ class GameState:
         Raises:
             PlayerNotFoundError: Raised when the player is not in this game.
         """
-        player_ids = [p.id for p in self.players]
-        if player.id not in player_ids:
-            raise PlayerNotFoundError(player_id=player.id)
-
-        player_index = player_ids.index(player.id)
-
-        players = list(self.players)
-        players[player_index] = player
-
-        return evolve(self, players=tuple(players))
+        players = self.players
+        for index, existing in enumerate(players):
+            if existing.id == player.id:
+                return evolve(
+                    self, players=(*players[:index], player, *players[index + 1 :])
+                )
+        raise PlayerNotFoundError(player_id=player.id)
 
     def with_board(self, board: Board) -> GameState:
         """Return a copy of this game state with a new board.
@@ -432,9 +442,12 @@ class Game:
 
     def new_tiles(self) -> list[int]:
         """Return all new tile ids that have been played this turn."""
+        board_tiles = set().union(
+            *(tileset.tiles for tileset in self.game_state.board.tilesets)
+        )
         return list(
-            set(self.game_state.board.all_tiles()).difference(
-                self.turn.starting_board.all_tiles()
+            board_tiles.difference(
+                *(tileset.tiles for tileset in self.turn.starting_board.tilesets)
             )
         )
 
@@ -454,11 +467,14 @@ class Game:
         Raises:
             UserNotInGameError: Raised when the user of the player is not in the game.
         """
-        if last(self.turn_order) == player.user_id:
-            return self.player_for_user_id(user_id=first(self.turn_order))
-        else:
-            index = self.turn_order.index(player.user_id)
-            return self.player_for_user_id(user_id=self.turn_order[index + 1])
+        turn_order = self.turn_order
+        try:
+            index = turn_order.index(player.user_id)
+        except ValueError:
+            raise UserNotInGameError(
+                user_id=player.user_id, players=self.game_state.players
+            ) from None
+        return self.player_for_user_id(user_id=turn_order[(index + 1) % len(turn_order)])
 
     def player_for_user_id(self, user_id: UUID) -> Player:
         """Return a player for the given user id.
@@ -472,14 +488,10 @@ class Game:
         Raises:
             UserNotInGameError: Raised when the user is not in the game.
         """
-        try:
-            return next(
-                player for player in self.game_state.players if player.user_id == user_id
-            )
-        except Exception as e:
-            raise UserNotInGameError(
-                user_id=user_id, players=self.game_state.players
-            ) from e
+        for player in self.game_state.players:
+            if player.user_id == user_id:
+                return player
+        raise UserNotInGameError(user_id=user_id, players=self.game_state.players)
 
     def ensure_has_turn(self, player: Player) -> None:
         """Verify that it is the player's turn.
@@ -656,7 +668,7 @@ class Game:
         game_state = evolve(self.game_state, players=players)
 
         if len(players) == 1:
-            return evolve(self, game_state=game_state, winner=first(players)), None
+            return evolve(self, game_state=game_state, winner=players[0]), None
 
         self.game_state.pile.return_rack(rack=player.rack, shuffle=rng.shuffle)
         turn_order = tuple(uid for uid in self.turn_order if uid != player.user_id)
@@ -682,13 +694,8 @@ class Game:
 
 
 class UserNotInGameError(ForbiddenError):
-    @property
-    def message(self) -> str:
-        return "You are not in this game."
-
-    @property
-    def error_name(self) -> str:
-        return "user_not_in_game"
+    message = "You are not in this game."
+    error_name = "user_not_in_game"
 
     def __init__(self, user_id: UUID, players: tuple[Player, ...]):
         super().__init__(
@@ -700,13 +707,8 @@ class UserNotInGameError(ForbiddenError):
 
 
 class NotUserTurnError(ForbiddenError):
-    @property
-    def message(self) -> str:
-        return "Please wait for your turn."
-
-    @property
-    def error_name(self) -> str:
-        return "not_user_turn"
+    message = "Please wait for your turn."
+    error_name = "not_user_turn"
 
     def __init__(self, player_id: UUID, current_player_id: UUID):
         super().__init__(
@@ -718,75 +720,45 @@ class NotUserTurnError(ForbiddenError):
 
 
 class NoMoveToUndoError(BadRequestError):
-    @property
-    def message(self) -> str:
-        return "No moves to undo."
-
-    @property
-    def error_name(self) -> str:
-        return "no_move_to_undo"
+    message = "No moves to undo."
+    error_name = "no_move_to_undo"
 
     def __init__(self, revision: int):
         super().__init__(info={"revision": revision})
 
 
 class NoMoveToRedoError(BadRequestError):
-    @property
-    def message(self) -> str:
-        return "No moves to redo."
-
-    @property
-    def error_name(self) -> str:
-        return "no_move_to_redo"
+    message = "No moves to redo."
+    error_name = "no_move_to_redo"
 
     def __init__(self, revision: int):
         super().__init__(info={"revision": revision})
 
 
 class NoMovesPerformedError(BadRequestError):
-    @property
-    def message(self) -> str:
-        return "You can't end a turn without playing any tiles."
-
-    @property
-    def error_name(self) -> str:
-        return "no_moves_performed"
+    message = "You can't end a turn without playing any tiles."
+    error_name = "no_moves_performed"
 
     def __init__(self, revision: int):
         super().__init__(info={"revision": revision})
 
 
 class MovesPerformedError(BadRequestError):
-    @property
-    def message(self) -> str:
-        return "You can't draw a tile after performing a move."
-
-    @property
-    def error_name(self) -> str:
-        return "moves_performed"
+    message = "You can't draw a tile after performing a move."
+    error_name = "moves_performed"
 
     def __init__(self, revision: int):
         super().__init__(info={"revision": revision})
 
 
 class PlayerNotFoundError(BadRequestError):
-    @property
-    def message(self) -> str:
-        return "Player not found."
-
-    @property
-    def error_name(self) -> str:
-        return "player_not_found"
+    message = "Player not found."
+    error_name = "player_not_found"
 
     def __init__(self, player_id: UUID):
         super().__init__(info={"player_id": str(player_id)})
 
 
 class GameEndedError(BadRequestError):
-    @property
-    def message(self) -> str:
-        return "Game has already ended."
-
-    @property
-    def error_name(self) -> str:
-        return "game_ended"
+    message = "Game has already ended."
+    error_name = "game_ended"
@@ -165,39 +165,24 @@ class Gameroom:
 
 
 class GameAlreadyStartedError(BadRequestError):
-    @property
-    def message(self) -> str:
-        return "A game has already started in this gameroom."
-
-    @property
-    def error_name(self) -> str:
-        return "game_already_started"
+    message = "A game has already started in this gameroom."
+    error_name = "game_already_started"
 
     def __init__(self, status: GameroomStatus):
         super().__init__(info={"gameroom_status": status.value})
 
 
 class GameroomFullError(BadRequestError):
-    @property
-    def message(self) -> str:
-        return "Gameroom is full."
-
-    @property
-    def error_name(self) -> str:
-        return "gameroom_full"
+    message = "Gameroom is full."
+    error_name = "gameroom_full"
 
     def __init__(self, users: tuple[User, ...]):
         super().__init__(info={"users": [str(user.id) for user in users]})
 
 
 class UserNotInGameroomError(ForbiddenError):
-    @property
-    def message(self) -> str:
-        return "You are not in this gameroom."
-
-    @property
-    def error_name(self) -> str:
-        return "user_not_in_gameroom"
+    message = "You are not in this gameroom."
+    error_name = "user_not_in_gameroom"
 
     def __init__(self, user_id: uuid.UUID, user_ids: set[uuid.UUID]):
         super().__init__(
@@ -206,23 +191,13 @@ class UserNotInGameroomError(ForbiddenError):
 
 
 class NotGameroomOwnerError(ForbiddenError):
-    @property
-    def message(self) -> str:
-        return "Only the gameroom's owner can perform this action."
-
-    @property
-    def error_name(self) -> str:
-        return "not_gameroom_owner"
+    message = "Only the gameroom's owner can perform this action."
+    error_name = "not_gameroom_owner"
 
     def __init__(self, user_id: uuid.UUID, owner_id: uuid.UUID):
         super().__init__(info={"user_id": str(user_id), "owner_id": str(owner_id)})
 
 
 class LeavingOwnGameroomError(BadRequestError):
-    @property
-    def message(self) -> str:
-        return "Can't leave your own gameroom. Delete it instead."
-
-    @property
-    def error_name(self) -> str:
-        return "leaving_own_gameroom"
+    message = "Can't leave your own gameroom. Delete it instead."
+    error_name = "leaving_own_gameroom"
@@ -144,7 +144,7 @@ class Mapper:
                 for player in game_state.players
             ],
             board=game_state.board.serialize(),
-            pile=list(game_state.pile.tiles),
+            pile=game_state.pile.as_list(),
         )
 
     def to_db_player(self, player: Player, game_state_id: UUID) -> DbPlayer:
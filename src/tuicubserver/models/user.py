@@ -47,13 +47,8 @@ class UserToken:
 
 
 class AlreadyInGameroomError(BadRequestError):
-    @property
-    def message(self) -> str:
-        return "You are already in a gameroom."
-
-    @property
-    def error_name(self) -> str:
-        return "already_in_gameroom"
+    message = "You are already in a gameroom."
+    error_name = "already_in_gameroom"
 
     def __init__(self, gameroom_id: uuid.UUID):
         super().__init__(info={"gameroom_id": str(gameroom_id)})
@@ -1,9 +1,11 @@
+from collections.abc import Iterable
 from uuid import UUID
 
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from ..common.errors import NotFoundError, UnauthorizedError
+from ..common.utils import as_uuid
 from ..models.db import DbUser, DbUserToken
 from ..models.user import User, UserToken
 from .base import BaseRepository
@@ -31,6 +33,26 @@ class UsersRepository(BaseRepository):
             session=session, id=id, db_type=DbUser, mapper=self._mapper.to_domain_user
         )
 
+    def get_users_by_ids(self, session: Session, ids: Iterable[str | UUID]) -> list[User]:
+        """Get users for a collection of ids in a single query.
+
+        Ids without a matching user are skipped.
+
+        Args:
+            session (Session): The current database session.
+            ids (Iterable[str | UUID]): The ids of the users.
+
+        Returns:
+            The users with the given ids.
+        """
+        users = session.scalars(
+            select(DbUser)
+            .where(DbUser.id.in_([as_uuid(id) for id in ids]))
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        ).all()
+        return [self._mapper.to_domain_user(user) for user in users]
+
     def get_user_by_token(self, session: Session, token: str) -> User:
         """Get a user for a token value.
 
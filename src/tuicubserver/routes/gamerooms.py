@@ -12,6 +12,7 @@ def attach_gamerooms_routes(
     app: Flask,
     controller: GameroomsController,
     with_context: Callable[[Callable[..., Any]], Callable[..., Any]],
+    with_read_only_context: Callable[[Callable[..., Any]], Callable[..., Any]],
     with_base_context: Callable[[Callable[..., Any]], Callable[..., Any]],
 ) -> None:
     """Registers routes for the gamerooms resource."""
@@ -22,7 +23,7 @@ def attach_gamerooms_routes(
         return controller.create_gameroom(context=context), 201
 
     @app.get("/gamerooms")
-    @with_context
+    @with_read_only_context
     def get_gamerooms(context: Context) -> ResponseReturnValue:
         """get_gamerooms.
 
@@ -58,3 +59,8 @@ def attach_gamerooms_routes(
     @with_base_context
     def disconnect(context: BaseContext) -> ResponseReturnValue:
         return controller.disconnect(context=context)
+
+    @app.post("/gamerooms/disconnect_batch")
+    @with_base_context
+    def disconnect_batch(context: BaseContext) -> ResponseReturnValue:
+        return controller.disconnect_batch(context=context)
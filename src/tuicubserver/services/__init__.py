@@ -7,7 +7,6 @@ from typing import TYPE_CHECKING
 from theine import Cache
 
 from ..messages.client import MessagesClient
-from ..messages.message import MessageEnvelopeSchema
 from ..messages.service import MessagesService
 from ..repositories import Repositories
 from .auth import AuthService
@@ -76,19 +75,20 @@ class Services:
                 host=config.messages_host,
                 port=config.messages_port,
                 token=config.messages_secret,
-                schema=MessageEnvelopeSchema(),
             )
         )
         self._users: UsersService = UsersService(
-            auth_service=self._auth, users_repository=repositories.users
+            auth_service=self._auth,
+            users_repository=repositories.users,
+            tokens_cache=Cache("tlfu", 10000),
         )
 
 
 def get_valid_tilesets(
     valid_tilesets_path: str,
-) -> Callable[[], frozenset[tuple[int, ...]]]:
-    def wrapped() -> frozenset[tuple[int, ...]]:
+) -> Callable[[], frozenset[bytes]]:
+    def wrapped() -> frozenset[bytes]:
         with open(valid_tilesets_path) as fp:
-            return frozenset(tuple(tileset) for tileset in json.load(fp))
+            return frozenset(bytes(tileset) for tileset in json.load(fp))
 
     return wrapped
@@ -1,3 +1,5 @@
+import hmac
+
 from sqlalchemy.orm import Session
 from werkzeug.datastructures import Headers
 
@@ -10,7 +12,12 @@ from ..repositories.users import UsersRepository
 class AuthService:
     """The service for authorizing users."""
 
-    __slots__ = ("_users_repository", "_events_secret", "_messages_secret")
+    __slots__ = (
+        "_users_repository",
+        "_events_secret",
+        "_messages_secret",
+        "_events_authorization",
+    )
 
     def __init__(
         self, users_repository: UsersRepository, events_secret: str, messages_secret: str
@@ -25,6 +32,7 @@ class AuthService:
         self._users_repository: UsersRepository = users_repository
         self._events_secret: str = events_secret
         self._messages_secret: str = messages_secret
+        self._events_authorization: str | None = None
 
     def authorize(self, session: Session, headers: Headers) -> User:
         """Authorize a request.
@@ -51,7 +59,8 @@ class AuthService:
         """Authorize a request made by the events server.
 
         Verifies the token passed in the `Authorization` header against the
-        preconfigured secret.
+        preconfigured secret. The last accepted header value is remembered, so
+        repeated requests with the same header skip parsing the token.
 
         Args:
             headers (Headers): The headers of the request.
@@ -60,23 +69,29 @@ class AuthService:
             UnauthorizedError: Raised when the authorization header is missing,
                 the token is invaild, or the token does not match the secret.
         """
+        authorization = headers.get("Authorization")
+        if authorization is not None and authorization == self._events_authorization:
+            return
+
         token = parse_token(headers)
         if not token or token != self._events_secret:
             raise UnauthorizedError()
 
-    def authorize_message(self, secret: str) -> None:
-        """Authorize an incoming message.
+        self._events_authorization = authorization
+
+    def is_message_authorized(self, secret: str) -> bool:
+        """Check whether an incoming message is authorized.
 
-        Verifies the token from the message envelope against the preconfigured secret.
+        Verifies the token from the message envelope against the preconfigured secret,
+        without raising an error for the messages that are not.
 
         Args:
             secret (str): The secret from the message envelope.
 
-        Raises:
-            UnauthorizedError: Raised when the secret is incorrect.
+        Returns:
+            True if the secret is correct.
         """
-        if secret != self._messages_secret:
-            raise UnauthorizedError()
+        return hmac.compare_digest(secret.encode(), self._messages_secret.encode())
 
     def generate_token(self) -> str:
         """Generate a new token.
@@ -2,8 +2,6 @@ from __future__ import annotations
 
 import uuid
 
-from more_itertools import all_unique, flatten
-
 from ..common.errors import BadRequestError
 from ..models.game import Board, Game, GameState, Pile, Player, Tileset, Turn
 from ..models.gameroom import Gameroom
@@ -160,7 +158,7 @@ class GameToolkit:
         current_tilesets = frozenset(frozenset(ts.tiles) for ts in current.tilesets)
         new_tilesets = current_tilesets.difference(previous_tilesets)
 
-        new_tilesets_tiles = frozenset(flatten(new_tilesets))
+        new_tilesets_tiles = frozenset().union(*new_tilesets)
         rack_set = frozenset(rack.tiles)
 
         if not rack_set.issuperset(new_tilesets_tiles):
@@ -181,7 +179,7 @@ class GameToolkit:
                         id=uuid.uuid4(),
                         name=user.name,
                         user_id=user.id,
-                        rack=pile.draw_rack(self._rng_service.pick),
+                        rack=pile.draw_rack(self._rng_service.pick_index),
                     )
                     for user in users
                 ]
@@ -207,11 +205,12 @@ def _ensure_all_new_tiles_from_rack(
 
 
 def _ensure_no_duplicate_tiles(previous: Board, current: Board, rack: Tileset) -> None:
-    if not all_unique(current.all_tiles()):
+    tiles = current.all_tiles()
+    if len(set(tiles)) != len(tiles):
         raise DuplicateTilesError(rack=rack, current=previous, candidate=current)
 
 
-class MoveError(BadRequestError):
+class MoveError(BadRequestError, abstract=True):
     """The base error class for all moves related errors."""
 
     def __init__(self, rack: Tileset, current: Board, candidate: Board):
@@ -225,73 +224,38 @@ class MoveError(BadRequestError):
 
 
 class NotEnoughPlayersError(BadRequestError):
-    @property
-    def message(self) -> str:
-        return "At least two users are needed to start the game."
-
-    @property
-    def error_name(self) -> str:
-        return "not_enough_players"
+    message = "At least two users are needed to start the game."
+    error_name = "not_enough_players"
 
 
 class NoNewTilesError(MoveError):
-    @property
-    def message(self) -> str:
-        return "There are no new tiles on the board."
-
-    @property
-    def error_name(self) -> str:
-        return "no_new_tiles"
+    message = "There are no new tiles on the board."
+    error_name = "no_new_tiles"
 
 
 class DuplicateTilesError(MoveError):
-    @property
-    def message(self) -> str:
-        return "Board contains duplicate tiles."
-
-    @property
-    def error_name(self) -> str:
-        return "duplicate_tiles"
+    message = "Board contains duplicate tiles."
+    error_name = "duplicate_tiles"
 
 
 class MissingBoardTilesError(MoveError):
-    @property
-    def message(self) -> str:
-        return "The new board is missing tiles from the current one."
-
-    @property
-    def error_name(self) -> str:
-        return "missing_board_tiles"
+    message = "The new board is missing tiles from the current one."
+    error_name = "missing_board_tiles"
 
 
 class NewTilesNotFromRackError(MoveError):
-    @property
-    def message(self) -> str:
-        return "Not all played tiles are from your rack."
-
-    @property
-    def error_name(self) -> str:
-        return "new_tiles_not_from_rack"
+    message = "Not all played tiles are from your rack."
+    error_name = "new_tiles_not_from_rack"
 
 
 class InvalidTilesetsError(MoveError):
-    @property
-    def message(self) -> str:
-        return "The are invalid tiles sets on the board."
-
-    @property
-    def error_name(self) -> str:
-        return "invalid_tilesets"
+    message = "The are invalid tiles sets on the board."
+    error_name = "invalid_tilesets"
 
 
 class InvalidMeldError(MoveError):
-    @property
-    def message(self) -> str:
-        return "The attempted meld is invalid."
-
-    @property
-    def error_name(self) -> str:
-        return "invalid_meld"
+    message = "The attempted meld is invalid."
+    error_name = "invalid_meld"
 
 
 TILE_IDS = list(range(106))
@@ -177,7 +177,7 @@ class GamesService:
         game, player = self._ensure_game_player(context, game_id)
         game.turn.ensure_has_no_moves()
 
-        tile = game.game_state.pile.draw(self._rng_service.pick)
+        tile = game.game_state.pile.draw(self._rng_service.pick_index)
         game = game.with_drawn_tile(tile, player)
         game = game.with_next_turn(current_player=player)
 
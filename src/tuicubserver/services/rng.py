@@ -1,6 +1,5 @@
 import random
 import time
-from collections.abc import Sequence
 from typing import TypeVar
 
 _T = TypeVar("_T")
@@ -19,21 +18,21 @@ class RngService:
         """
         random.seed(seed if seed is not None else time.time())
 
-    def pick(self, seq: Sequence[_T]) -> _T:
-        """Pick a random value from the sequence.
+    def pick_index(self, size: int) -> int:
+        """Pick a random index of a sequence of the given size.
 
         Args:
-            seq (Sequence[_T]): The sequence to pick from.
+            size (int): The size of the sequence.
 
         Returns:
-            The picked value.
+            The picked index.
 
         Raises:
-            SequenceEmptyError: Raised when the sequence is empty.
+            SequenceEmptyError: Raised when the size is zero.
         """
-        if not seq:
+        if size <= 0:
             raise SequenceEmptyError()
-        return random.choice(seq)
+        return random.randrange(size)
 
     def shuffle(self, seq: list[_T]) -> list[_T]:
         """Shuffle a sequence.
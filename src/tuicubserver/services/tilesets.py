@@ -1,4 +1,4 @@
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 
 from theine import Cache
 
@@ -10,24 +10,23 @@ class TilesetsService:
 
     def __init__(
         self,
-        valid_tilesets: Callable[[], frozenset[tuple[int, ...]]],
+        valid_tilesets: Callable[[], frozenset[bytes]],
         validity_cache: Cache,
         values_cache: Cache,
     ):
         """Initialize new service.
 
         Args:
-            valid_tilesets (Callable[[], frozenset[tuple[int, ...]]]): The getter function
-                returning a set of all possible valid tile sets without jokers.
+            valid_tilesets (Callable[[], frozenset[bytes]]): The getter function
+                returning a set of all possible valid tile sets without jokers, each
+                packed as the bytes of its sorted tile ids.
             validity_cache (Cache): The cache for valid tile sets.
             values_cache (Cache): The cache for tile sets values.
         """
         self._validity_cache: Cache = validity_cache
         self._values_cache: Cache = values_cache
-        self._valid_tilesets: frozenset[tuple[int, ...]] = frozenset()
-        self._valid_tilesets_getter: Callable[
-            [], frozenset[tuple[int, ...]]
-        ] = valid_tilesets
+        self._valid_tilesets: frozenset[bytes] = frozenset()
+        self._valid_tilesets_getter: Callable[[], frozenset[bytes]] = valid_tilesets
 
     def is_valid(self, tileset: Tileset) -> bool:
         """Check if a tile set is valid.
@@ -42,12 +41,13 @@ class TilesetsService:
         Returns:
             True if the tile set is valid, false otherwise.
         """
-        cached: bool | None = self._validity_cache.get(hash(tileset))
+        key = hash(tileset)
+        cached: bool | None = self._validity_cache.get(key)
         if cached is not None:
             return cached
 
         result = self._is_valid(tileset)
-        self._validity_cache.set(hash(tileset), result)
+        self._validity_cache.set(key, result)
 
         return result
 
@@ -60,7 +60,8 @@ class TilesetsService:
         Returns:
             The sum of all tiles numbers in the tile set.
         """
-        cached: int | None = self._values_cache.get(hash(tileset))
+        key = hash(tileset)
+        cached: int | None = self._values_cache.get(key)
         if cached is not None:
             return cached
 
@@ -68,7 +69,7 @@ class TilesetsService:
             return 0
 
         result = self._value_of(tileset)
-        self._values_cache.set(hash(tileset), result)
+        self._values_cache.set(key, result)
 
         return result
 
@@ -101,13 +102,13 @@ class TilesetsService:
                     return True
             return False
 
-        return tuple(sorted(tileset.tiles)) in self._get_valid_tilesets()
+        return bytes(sorted(tileset.tiles)) in self._get_valid_tilesets()
 
-    def _get_valid_tilesets(self) -> frozenset[tuple[int, ...]]:
+    def _get_valid_tilesets(self) -> frozenset[bytes]:
         if not self._valid_tilesets:
             self._valid_tilesets = self._valid_tilesets_getter()
         return self._valid_tilesets
 
 
-def tileset_value(tileset: tuple[int, ...]) -> int:
+def tileset_value(tileset: Iterable[int]) -> int:
     return sum(tile % 13 + 1 for tile in tileset)
@@ -1,6 +1,7 @@
 import uuid
 
 from sqlalchemy.orm import Session
+from theine import Cache
 
 from ..common.context import BaseContext
 from ..models.user import User, UserToken
@@ -11,17 +12,24 @@ from ..services.auth import AuthService
 class UsersService:
     """The service for querying and manipulating users and tokens."""
 
-    __slots__ = ("_auth_service", "_users_repository")
+    __slots__ = ("_auth_service", "_users_repository", "_tokens_cache")
 
-    def __init__(self, auth_service: AuthService, users_repository: UsersRepository):
+    def __init__(
+        self,
+        auth_service: AuthService,
+        users_repository: UsersRepository,
+        tokens_cache: Cache,
+    ):
         """Initialize new service.
 
         Args:
             auth_service (AuthService): The authentication service.
             users_repository (UsersRepository): The users repository.
+            tokens_cache (Cache): The cache for authentication tokens by token value.
         """
         self._auth_service: AuthService = auth_service
         self._users_repository: UsersRepository = users_repository
+        self._tokens_cache: Cache = tokens_cache
 
     def create_user(self, context: BaseContext, name: str) -> tuple[User, UserToken]:
         """Create a new user.
@@ -54,6 +62,8 @@ class UsersService:
     def get_user_token(self, session: Session, token: str) -> UserToken:
         """Get user's authentication token by token value.
 
+        Authentication tokens never change once created, so found tokens are cached.
+
         Args:
             session (Session): The database session of the request.
             token (str): The token value.
@@ -65,9 +75,16 @@ class UsersService:
             UnauthorizedError: Raised when no user authentication token is found
                 for the given token value.
         """
-        return self._users_repository.get_user_token_by_token(
+        cached: UserToken | None = self._tokens_cache.get(token)
+        if cached is not None:
+            return cached
+
+        user_token = self._users_repository.get_user_token_by_token(
             session=session, token=token
         )
+        self._tokens_cache.set(token, user_token)
+
+        return user_token
 
     def get_user_by_id(self, session: Session, user_id: uuid.UUID) -> User:
         """Get user for the given id.
@@ -83,3 +100,15 @@ class UsersService:
             NotFoundError: Raised when no user is found with the given id.
         """
         return self._users_repository.get_user_by_id(session=session, id=user_id)
+
+    def get_users_by_ids(self, session: Session, user_ids: list[uuid.UUID]) -> list[User]:
+        """Get users for the given ids.
+
+        Args:
+            session (Session): The database session of the request.
+            user_ids (list[uuid.UUID]): The ids of the users.
+
+        Returns:
+            The users having the given ids. Ids without a user are skipped.
+        """
+        return self._users_repository.get_users_by_ids(session=session, ids=user_ids)
@@ -7,6 +7,7 @@ from sqlalchemy.exc import OperationalError
 from .common import Common
 from .common.context import BaseContext, Context
 from .common.errors import ErrorHandler, TuicubError
+from .common.json_provider import create_json_provider
 from .common.utils import is_host_valid
 from .controllers import Controllers
 from .events.api_client import EventsApiClient
@@ -18,6 +19,11 @@ from .routes.games import attach_games_routes
 from .routes.users import attach_users_routes
 from .services import Services
 
+try:
+    import uvloop
+except ImportError:  # no cov
+    uvloop = None  # type: ignore[assignment]
+
 
 @click.group()
 def cli() -> None:
@@ -94,6 +100,8 @@ def events(
     api_url: str,
 ) -> None:
     """Start the events and messages server."""
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     loop = asyncio.get_event_loop()
     common = Common()
     services = Services(repositories=Repositories(), config=common.config)
@@ -123,6 +131,7 @@ def events(
 
 def create_app() -> Flask:
     app = Flask(__name__)
+    app.json = create_json_provider(app)
 
     common = Common()
     services = Services(repositories=Repositories(), config=common.config)
@@ -134,11 +143,18 @@ def create_app() -> Flask:
     context_decorator = Context.decorator(
         services=services, session_factory=common.db.session_factory, logger=common.logger
     )
+    read_only_context_decorator = Context.decorator(
+        services=services,
+        session_factory=common.db.session_factory,
+        logger=common.logger,
+        read_only=True,
+    )
 
     attach_gamerooms_routes(
         app,
         controller=controllers.gamerooms,
         with_context=context_decorator,
+        with_read_only_context=read_only_context_decorator,
         with_base_context=base_context_decorator,
     )
     attach_games_routes(app, controller=controllers.games, with_context=context_decorator)
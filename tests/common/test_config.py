@@ -3,20 +3,22 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from src.tuicubserver.common.config import Config
+from src.tuicubserver.common.config import Config, _Defaults, _load_cached
 
 
 @pytest.fixture()
-def mock_open() -> Mock:
-    context_manager = Mock()
-    context_manager.__enter__ = Mock()
-    context_manager.__exit__ = Mock()
-    return context_manager
+def stat_result() -> Mock:
+    return Mock(st_mtime_ns=42)
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache() -> None:
+    _load_cached.cache_clear()
 
 
 class TestLoad:
     def test_when_tuicubserv_conf_env_variable_is_exisitng_file__loads_config_from_it(
-        self, mock_open
+        self, stat_result
     ) -> None:
         config_dict = {
             "db": {"url": "sqlite://db"},
@@ -33,43 +35,76 @@ class TestLoad:
             events_secret="baa5a0964d3320fbc0c6a922140453c8513ea24ab8fd0577034804a967248096",  # sha256 of 'baz' # noqa: E501
         )
 
-        with patch.dict("os.environ", {"TUICUBSERV_CONF": "foo"}, clear=True), patch(
-            "builtins.open", return_value=mock_open
-        ) as mocked_open, patch("tomllib.load", return_value=config_dict), patch.object(
-            Path, "exists", return_value=True
+        with patch.dict(
+            "os.environ", {"TUICUBSERV_CONF": "foo"}, clear=True
+        ), patch.object(
+            Path, "read_bytes", autospec=True, return_value=b""
+        ) as mocked_read_bytes, patch(
+            "src.tuicubserver.common.config._toml_loads", return_value=config_dict
+        ), patch(
+            "os.stat", return_value=stat_result
         ):
             result = Config.load()
 
-            mocked_open.assert_called_once_with(Path("foo"), "rb")
+            mocked_read_bytes.assert_called_once_with(Path("foo"))
             assert result == expected
 
     def test_when_no_tuicubserv_conf_env_variable__falls_back_to_default_config_path(
-        self, mock_open
+        self, stat_result
     ) -> None:
-        with patch.dict("os.environ", {}, clear=True), patch(
-            "builtins.open", return_value=mock_open
-        ) as mocked_open, patch("tomllib.load", return_value={}), patch.object(
-            Path, "exists", return_value=True
+        with patch.dict("os.environ", {}, clear=True), patch.object(
+            Path, "read_bytes", autospec=True, return_value=b""
+        ) as mocked_read_bytes, patch(
+            "src.tuicubserver.common.config._toml_loads", return_value={}
+        ), patch(
+            "os.stat", return_value=stat_result
         ):
             Config.load()
 
-            mocked_open.assert_called_once_with(Path("config.toml"), "rb")
+            mocked_read_bytes.assert_called_once_with(Path("config.toml"))
 
     def test_when_no_tuicubserv_conf_env_variable__fallback_does_not_exists__returns_default_config(  # noqa: E501
         self,
     ) -> None:
         expected = Config(
-            db_url=Config.Defaults.db_url,
-            logfile_path=Config.Defaults.logfile_path,
-            messages_host=Config.Defaults.messages_host,
-            messages_port=Config.Defaults.messages_port,
+            db_url=_Defaults.db_url,
+            logfile_path=_Defaults.logfile_path,
+            messages_host=_Defaults.messages_host,
+            messages_port=_Defaults.messages_port,
             messages_secret="057ba03d6c44104863dc7361fe4578965d1887360f90a0895882e58a6248fc86",  # sha256 of 'changeme' # noqa: E501
             events_secret="057ba03d6c44104863dc7361fe4578965d1887360f90a0895882e58a6248fc86",  # sha256 of 'changeme' # noqa: E501
         )
 
-        with patch.object(Path, "exists", return_value=False), patch.dict(
+        with patch("os.stat", side_effect=FileNotFoundError), patch.dict(
             "os.environ", {}, clear=True
         ):
             result = Config.load()
 
             assert result == expected
+
+    def test_when_file_is_not_modified__parses_file_once(self, stat_result) -> None:
+        with patch.dict("os.environ", {}, clear=True), patch.object(
+            Path, "read_bytes", autospec=True, return_value=b""
+        ) as mocked_read_bytes, patch(
+            "src.tuicubserver.common.config._toml_loads", return_value={}
+        ), patch(
+            "os.stat", return_value=stat_result
+        ):
+            first = Config.load()
+            second = Config.load()
+
+            mocked_read_bytes.assert_called_once()
+            assert first is second
+
+    def test_when_file_is_modified__parses_file_again(self, stat_result) -> None:
+        with patch.dict("os.environ", {}, clear=True), patch.object(
+            Path, "read_bytes", autospec=True, return_value=b""
+        ) as mocked_read_bytes, patch(
+            "src.tuicubserver.common.config._toml_loads", return_value={}
+        ), patch(
+            "os.stat", side_effect=[stat_result, Mock(st_mtime_ns=43)]
+        ):
+            Config.load()
+            Config.load()
+
+            assert mocked_read_bytes.call_count == 2
@@ -23,7 +23,12 @@ class TestSessionFactory:
             _ = sut.session_factory
 
             mocked_create_engine.assert_called_once_with(
-                "foo", echo=False, isolation_level="REPEATABLE READ"
+                "foo",
+                echo=False,
+                isolation_level="REPEATABLE READ",
+                pool_size=20,
+                max_overflow=0,
+                pool_recycle=1800,
             )
 
     def test_connect_to_database__creates_engine_with_repeatable_read_isolation(
@@ -40,7 +45,12 @@ class TestSessionFactory:
             _ = sut.session_factory
 
             mocked_create_engine.assert_called_once_with(
-                "foo", echo=False, isolation_level="REPEATABLE READ"
+                "foo",
+                echo=False,
+                isolation_level="REPEATABLE READ",
+                pool_size=20,
+                max_overflow=0,
+                pool_recycle=1800,
             )
 
     def test_connect_to_database__creates_models(
@@ -56,7 +66,7 @@ class TestSessionFactory:
 
             mocked_create_all.assert_called_once_with(engine)
 
-    def test_connect_to_database__creates_sessionmaker_with_expire_on_commit_autoflush(
+    def test_connect_to_database__creates_sessionmaker_without_expire_on_commit(
         self,
     ) -> None:
         sut = Database(connstr="foo")
@@ -68,5 +78,5 @@ class TestSessionFactory:
             _ = sut.session_factory
 
             mocked_sessionmaker.assert_called_once_with(
-                engine, expire_on_commit=True, autoflush=True
+                engine, expire_on_commit=False, autoflush=True
             )
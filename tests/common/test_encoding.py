@@ -0,0 +1,20 @@
+import uuid
+
+from src.tuicubserver.common.encoding import json_dumps
+
+
+class TestJsonDumps:
+    def test_returns_compact_json_bytes(self) -> None:
+        expected = b'{"foo":[1,2],"bar":null}'
+
+        result = json_dumps({"foo": [1, 2], "bar": None})
+
+        assert result == expected
+
+    def test_encodes_uuids_as_strings(self) -> None:
+        id = uuid.UUID("d9bc7a2b-5a46-4c6a-9b0e-d4f4c7f2b6a1")
+        expected = b'["d9bc7a2b-5a46-4c6a-9b0e-d4f4c7f2b6a1"]'
+
+        result = json_dumps([id])
+
+        assert result == expected
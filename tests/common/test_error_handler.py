@@ -1,7 +1,14 @@
+import json
+
 import pytest
 from sqlalchemy.exc import OperationalError
 
-from src.tuicubserver.common.errors import ErrorHandler, ErrorResponse, TuicubError
+from src.tuicubserver.common.errors import (
+    ErrorHandler,
+    ErrorResponse,
+    TuicubError,
+    UnauthorizedError,
+)
 
 
 class MockError(TuicubError):
@@ -46,6 +53,22 @@ class TestHandleTuicubError:
         assert isinstance(result, ErrorResponse)
 
 
+class TestErrorResponse:
+    def test_constant_message__has_json_body(self) -> None:
+        expected = json.dumps({"message": UnauthorizedError.message}).encode()
+
+        result = ErrorResponse(message=UnauthorizedError.message, code=401)
+
+        assert result.get_data() == expected
+
+    def test_dynamic_message__has_json_body(self) -> None:
+        expected = json.dumps({"message": "Invalid input: foo"}).encode()
+
+        result = ErrorResponse(message="Invalid input: foo", code=400)
+
+        assert result.get_data() == expected
+
+
 class TestHandleSqlalchemyError:
     def test_logs_error(self, sut, logger) -> None:
         error = OperationalError(statement=None, params=None, orig=ValueError())
@@ -1,3 +1,5 @@
+import pytest
+
 from src.tuicubserver.common.errors import (
     BadRequestError,
     ForbiddenError,
@@ -48,3 +50,9 @@ class TestErrors:
         result = sut.code
 
         assert result == expected
+
+    def test_subclass_without_message__raises_type_error(self) -> None:
+        with pytest.raises(TypeError):
+
+            class IncompleteError(BadRequestError):
+                error_name = "incomplete"
@@ -0,0 +1,66 @@
+import uuid
+
+import pytest
+from flask.json.provider import DefaultJSONProvider
+
+from src.tuicubserver.common.json_provider import OrjsonProvider, create_json_provider
+
+
+@pytest.fixture()
+def sut(app) -> OrjsonProvider:
+    return OrjsonProvider(app)
+
+
+class TestDumps:
+    def test_returns_json_string(self, sut):
+        expected = '{"a":1,"b":[1,2]}'
+
+        result = sut.dumps({"b": [1, 2], "a": 1})
+
+        assert result == expected
+
+    def test_encodes_uuid_as_string(self, sut):
+        id = uuid.uuid4()
+        expected = f'"{id}"'
+
+        result = sut.dumps(id)
+
+        assert result == expected
+
+
+class TestLoads:
+    def test_returns_decoded_json(self, sut):
+        expected = {"foo": [1, 2]}
+
+        result = sut.loads(b'{"foo": [1, 2]}')
+
+        assert result == expected
+
+
+class TestResponse:
+    def test_returns_json_response_with_serialized_data(self, sut, app):
+        app.debug = False
+        expected = b'{"foo":"bar"}\n'
+
+        with app.app_context():
+            result = sut.response({"foo": "bar"})
+
+        assert result.get_data() == expected
+        assert result.mimetype == "application/json"
+
+    def test_when_debug__returns_indented_json(self, sut, app):
+        app.debug = True
+        expected = b'{\n  "foo": "bar"\n}\n'
+
+        with app.app_context():
+            result = sut.response({"foo": "bar"})
+
+        assert result.get_data() == expected
+
+
+class TestCreateJsonProvider:
+    def test_returns_orjson_provider(self, app):
+        result = create_json_provider(app)
+
+        assert isinstance(result, OrjsonProvider)
+        assert isinstance(result, DefaultJSONProvider)
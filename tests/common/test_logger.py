@@ -15,8 +15,9 @@ def logfile_path() -> Path:
 
 
 @pytest.fixture()
-def sut(logfile_path) -> Logger:
-    return Logger(logfile_path=logfile_path)
+def sut(logfile_path, mock_log) -> Logger:
+    with patch("structlog.get_logger", return_value=mock_log):
+        return Logger(logfile_path=logfile_path)
 
 
 @pytest.fixture()
@@ -54,13 +55,23 @@ class TestConfigure:
 
             mocked_configure.assert_called_once()
 
+    def test_caches_logger_from_configured_structlog(self, sut) -> None:
+        configured_log = create_autospec(structlog.types.FilteringBoundLogger)
+
+        with patch("builtins.open"), patch("structlog.configure"), patch(
+            "structlog.get_logger", return_value=configured_log
+        ):
+            sut.configure()
+        sut.log("foo", bar="baz")
+
+        configured_log.info.assert_called_once_with("foo", bar="baz")
+
 
 class TestLog:
     def test_logs_info_with_event_and_passed_kwargs(self, sut, mock_log) -> None:
-        with patch("structlog.get_logger", return_value=mock_log):
-            sut.log("foo", bar="baz", foobar=42)
+        sut.log("foo", bar="baz", foobar=42)
 
-            mock_log.info.assert_called_once_with("foo", bar="baz", foobar=42)
+        mock_log.info.assert_called_once_with("foo", bar="baz", foobar=42)
 
 
 class TestLogError:
@@ -69,10 +80,9 @@ class TestLogError:
     ) -> None:
         err = create_autospec(Exception)
 
-        with patch("structlog.get_logger", return_value=mock_log):
-            sut.log_error("foo", err=err, bar="baz")
+        sut.log_error("foo", err=err, bar="baz")
 
-            mock_log.exception.assert_called_once_with("foo", exc_info=err, bar="baz")
+        mock_log.exception.assert_called_once_with("foo", exc_info=err, bar="baz")
 
 
 class TestLogResponse:
@@ -83,10 +93,9 @@ class TestLogResponse:
         response.status_code = 42
         sender = create_autospec(Flask)
 
-        with patch("structlog.get_logger", return_value=mock_log):
-            sut.log_response(sender=sender, response=response)
+        sut.log_response(sender=sender, response=response)
 
-            mock_log.info.assert_called_once_with("request", code=42)
+        mock_log.info.assert_called_once_with("request", code=42)
 
 
 class TestBindContextVars:
@@ -1,6 +1,10 @@
+import uuid
+
+import pytest
 from werkzeug.datastructures import Headers
 
-from src.tuicubserver.common.utils import is_host_valid, parse_token
+from src.tuicubserver.common.errors import InvalidIdentifierError
+from src.tuicubserver.common.utils import as_uuid, is_host_valid, parse_token
 
 
 class TestParseToken:
@@ -32,6 +36,44 @@ class TestParseToken:
 
         assert result == expected
 
+    def test_when_authorization_header_name_is_lowercase__returns_value_after_bearer(
+        self,
+    ) -> None:
+        headers = Headers((("Host", "localhost"), ("authorization", "Bearer letmein")))
+        expected = "letmein"
+
+        result = parse_token(headers)
+
+        assert result == expected
+
+    def test_when_authorization_header_has_surrounding_whitespace__returns_token(
+        self,
+    ) -> None:
+        headers = Headers((("Authorization", "  bearer   letmein  "),))
+        expected = "letmein"
+
+        result = parse_token(headers)
+
+        assert result == expected
+
+    def test_when_authorization_header_has_more_than_two_parts__returns_empty_string(
+        self,
+    ) -> None:
+        headers = Headers((("Authorization", "Bearer let me in"),))
+        expected = ""
+
+        result = parse_token(headers)
+
+        assert result == expected
+
+    def test_when_token_has_disallowed_characters__returns_empty_string(self) -> None:
+        headers = Headers((("Host", "localhost"), ("Authorization", "Bearer let;me")))
+        expected = ""
+
+        result = parse_token(headers)
+
+        assert result == expected
+
 
 class TestIsHostValid:
     def test_when_host_is_valid_ipv4__returns_true(self) -> None:
@@ -95,3 +137,50 @@ class TestIsHostValid:
         result = is_host_valid(host)
 
         assert result == expected
+
+    def test_when_host_has_non_ascii_characters__returns_false(self) -> None:
+        expected = False
+
+        result = is_host_valid("api.tuicüb.com")
+
+        assert result == expected
+
+    def test_when_host_is_empty__returns_false(self) -> None:
+        expected = False
+
+        result = is_host_valid("")
+
+        assert result == expected
+
+
+class TestAsUuid:
+    def test_when_id_is_uuid__returns_it(self) -> None:
+        expected = uuid.uuid4()
+
+        result = as_uuid(expected)
+
+        assert result is expected
+
+    def test_when_id_is_valid_string__returns_uuid(self) -> None:
+        expected = uuid.uuid4()
+
+        result = as_uuid(str(expected))
+
+        assert result == expected
+
+    def test_when_id_is_valid_hex__returns_uuid(self) -> None:
+        expected = uuid.uuid4()
+
+        result = as_uuid(expected.hex)
+
+        assert result == expected
+
+    def test_when_id_has_invalid_length__raises_invalid_identifier_error(self) -> None:
+        with pytest.raises(InvalidIdentifierError):
+            as_uuid("1234")
+
+    def test_when_id_has_invalid_characters__raises_invalid_identifier_error(
+        self,
+    ) -> None:
+        with pytest.raises(InvalidIdentifierError):
+            as_uuid("z" * 32)
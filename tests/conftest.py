@@ -78,6 +78,15 @@ def with_context(
     return Context.decorator(services, session_factory, logger)
 
 
+@pytest.fixture()
+def with_read_only_context(
+    services, session_factory, logger
+) -> Callable[
+    [Callable[[Context, P.args, P.kwargs], T]], Callable[[P.args, P.kwargs], T]
+]:
+    return Context.decorator(services, session_factory, logger, read_only=True)
+
+
 @pytest.fixture()
 def gameroom_id() -> UUID:
     return uuid4()
@@ -177,6 +186,11 @@ def rng_service() -> RngService:
 
     service.pick = Mock(side_effect=pick)
 
+    def pick_index(size):
+        return size - 1
+
+    service.pick_index = Mock(side_effect=pick_index)
+
     def shuffle(seq):
         return seq
 
@@ -0,0 +1,45 @@
+import pytest
+from marshmallow import Schema, fields
+
+from src.tuicubserver.common.errors import ValidationError
+from src.tuicubserver.controllers.base import BaseBodySchema
+
+
+class NestedSchema(Schema):
+    value = fields.Integer(required=True)
+
+
+class MockBodySchema(BaseBodySchema):
+    name = fields.String(required=True)
+    nested = fields.Nested(NestedSchema, required=True)
+
+
+class TestBaseBodySchema:
+    def test_handle_error__unwraps_nested_messages(self) -> None:
+        sut = MockBodySchema()
+        expected = "Invalid input: Not a valid integer."
+
+        with pytest.raises(ValidationError) as excinfo:
+            sut.load({"name": "foo", "nested": {"value": "bar"}})
+
+        assert excinfo.value.message == expected
+
+    def test_handle_error__merges_all_messages(self) -> None:
+        sut = MockBodySchema()
+        expected = {
+            "Invalid input: Not a valid string. Not a valid integer.",
+            "Invalid input: Not a valid integer. Not a valid string.",
+        }
+
+        with pytest.raises(ValidationError) as excinfo:
+            sut.load({"name": 42, "nested": {"value": "bar"}})
+
+        assert excinfo.value.message in expected
+
+    def test_excludes_unknown_fields(self) -> None:
+        sut = MockBodySchema()
+        expected = {"name": "foo", "nested": {"value": 1}}
+
+        result = sut.load({"name": "foo", "nested": {"value": 1}, "extra": True})
+
+        assert result == expected
@@ -202,6 +202,24 @@ class TestDisconnect:
             auth_service.authorize_events_server.assert_called_once()
             gamerooms_service.disconnect.assert_not_called()
 
+    def test_when_user_not_in_gameroom__does_not_disconnect_from_gameroom(
+        self,
+        sut,
+        app,
+        base_context,
+        user_no_gameroom,
+        user_id,
+        gamerooms_service,
+        users_service,
+    ):
+        users_service.get_user_by_id = Mock(return_value=user_no_gameroom)
+
+        with app.test_request_context(json={"user_id": str(user_id)}):
+            result = sut.disconnect(context=base_context)
+
+            gamerooms_service.disconnect.assert_not_called()
+            assert result == SUCCESS_RESPONSE
+
     def test_when_result_has_no_gameroom__does_not_send_disconnected_gameroom_message(
         self, sut, app, base_context, user_id, gamerooms_service, messages_service
     ):
@@ -309,3 +327,55 @@ class TestDisconnect:
         with app.test_request_context(json={"user_id": "foo"}):
             with pytest.raises(ValidationError, match="Not a valid UUID"):
                 sut.disconnect(context=base_context)
+
+
+class TestDisconnectBatch:
+    def test_when_authorization_fails__does_not_disconnect(
+        self, sut, app, base_context, user_id, auth_service, gamerooms_service
+    ):
+        auth_service.authorize_events_server = Mock(side_effect=UnauthorizedError)
+
+        with app.test_request_context(json={"user_ids": [str(user_id)]}):
+            with pytest.raises(UnauthorizedError):
+                sut.disconnect_batch(context=base_context)
+
+            gamerooms_service.disconnect.assert_not_called()
+
+    def test_queries_users_by_ids_from_body(
+        self, sut, app, base_context, user_id, users_service, gamerooms_service
+    ):
+        users_service.get_users_by_ids = Mock(return_value=[])
+
+        with app.test_request_context(json={"user_ids": [str(user_id)]}):
+            sut.disconnect_batch(context=base_context)
+
+            users_service.get_users_by_ids.assert_called_once_with(
+                session=base_context.session, user_ids=[user_id]
+            )
+
+    def test_disconnects_every_user_in_gameroom(
+        self,
+        sut,
+        app,
+        base_context,
+        user,
+        user_no_gameroom,
+        users_service,
+        gamerooms_service,
+    ):
+        users_service.get_users_by_ids = Mock(return_value=[user, user_no_gameroom])
+        gamerooms_service.disconnect = Mock(return_value=DisconnectResult())
+
+        with app.test_request_context(json={"user_ids": [str(user.id)]}):
+            result = sut.disconnect_batch(context=base_context)
+
+            gamerooms_service.disconnect.assert_called_once()
+            assert gamerooms_service.disconnect.call_args.kwargs["context"].user == user
+            assert result == SUCCESS_RESPONSE
+
+    def test_when_user_ids_not_in_body__raises_validation_error(
+        self, sut, app, base_context
+    ) -> None:
+        with app.test_request_context(json={}):
+            with pytest.raises(ValidationError, match="list of 'user_ids' is required"):
+                sut.disconnect_batch(context=base_context)
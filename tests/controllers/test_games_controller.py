@@ -3,7 +3,7 @@ from unittest.mock import Mock, PropertyMock, create_autospec
 import pytest
 
 from src.tuicubserver.common.errors import ValidationError
-from src.tuicubserver.controllers.games import GamesController
+from src.tuicubserver.controllers.games import GamesController, MoveTilesBodySchema
 from src.tuicubserver.models.dto import GameStateDto
 from src.tuicubserver.models.game import Game
 
@@ -203,3 +203,27 @@ class TestDraw:
         messages_service.tile_drawn.assert_called_once_with(
             sender=context.user, tile=tile, game=game
         )
+
+
+class TestMoveTilesBodySchema:
+    def test_when_board_valid__returns_board(self):
+        expected = {"board": [[1, 2, 3], [105, 0]]}
+
+        result = MoveTilesBodySchema().load({"board": [[1, 2, 3], [105, 0]]})
+
+        assert result == expected
+
+    def test_when_board_has_numeric_strings__returns_board_with_integers(self):
+        expected = {"board": [[1, 2, 3]]}
+
+        result = MoveTilesBodySchema().load({"board": [["1", 2, 3]]})
+
+        assert result == expected
+
+    def test_when_board_has_boolean__raises_validation_error(self):
+        with pytest.raises(ValidationError):
+            MoveTilesBodySchema().load({"board": [[True, 2, 3]]})
+
+    def test_when_board_has_negative_tile__raises_validation_error(self):
+        with pytest.raises(ValidationError):
+            MoveTilesBodySchema().load({"board": [[-1, 2, 3]]})
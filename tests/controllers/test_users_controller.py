@@ -41,7 +41,22 @@ class TestCreateUser:
             with pytest.raises(ValidationError, match="Name cannot be empty"):
                 sut.create_user(context=base_context)
 
+    def test_when_name_null__raises_validation_error(self, sut, app, base_context):
+        with app.test_request_context(json={"name": None}):
+            with pytest.raises(ValidationError, match="Name cannot be null"):
+                sut.create_user(context=base_context)
+
+    def test_when_name_not_string__raises_validation_error(self, sut, app, base_context):
+        with app.test_request_context(json={"name": 42}):
+            with pytest.raises(ValidationError, match="Not a valid string"):
+                sut.create_user(context=base_context)
+
     def test_when_name_missing__raises_validation_error(self, sut, app, base_context):
         with app.test_request_context(json={}):
             with pytest.raises(ValidationError, match="name is required"):
                 sut.create_user(context=base_context)
+
+    def test_when_body_not_json__raises_validation_error(self, sut, app, base_context):
+        with app.test_request_context(data="{name", content_type="text/plain"):
+            with pytest.raises(ValidationError, match="name is required"):
+                sut.create_user(context=base_context)
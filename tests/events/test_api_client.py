@@ -1,9 +1,11 @@
+import json
 from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
+import requests
 
-from src.tuicubserver.events.api_client import EventsApiClient
+from src.tuicubserver.events.api_client import REQUEST_TIMEOUT, EventsApiClient
 
 
 @pytest.fixture()
@@ -21,14 +23,35 @@ def sut(api_url, token) -> EventsApiClient:
     return EventsApiClient(api_url=api_url, token=token)
 
 
-class TestNotifyUserDisconnected:
+class TestNotifyUsersDisconnected:
     def test_sends_correct_request(self, sut, api_url, token) -> None:
-        with patch("requests.post") as mocked_post:
-            user_id = uuid4()
-            sut.notify_user_disconnected(user_id)
+        with patch("requests.Session.post") as mocked_post:
+            user_ids = [uuid4(), uuid4()]
+            sut.notify_users_disconnected(user_ids)
 
             mocked_post.assert_called_with(
-                f"{api_url}/gamerooms/disconnect",
-                json={"user_id": str(user_id)},
-                headers={"Authorization": f"Bearer {token}"},
+                f"{api_url}/gamerooms/disconnect_batch",
+                data=json.dumps(
+                    {"user_ids": [str(user_id) for user_id in user_ids]}
+                ).encode(),
+                headers={
+                    "Authorization": f"Bearer {token}",
+                    "Content-Type": "application/json",
+                },
+                timeout=REQUEST_TIMEOUT,
             )
+
+
+class TestSession:
+    def test_clients_share_session(self, api_url, token) -> None:
+        with patch.object(requests.Session, "post", autospec=True) as mocked_post:
+            EventsApiClient(api_url=api_url, token=token).notify_users_disconnected(
+                [uuid4()]
+            )
+            EventsApiClient(api_url=api_url, token=token).notify_users_disconnected(
+                [uuid4()]
+            )
+
+            session_1 = mocked_post.call_args_list[0].args[0]
+            session_2 = mocked_post.call_args_list[1].args[0]
+            assert session_1 is session_2
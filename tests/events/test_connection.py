@@ -1,6 +1,5 @@
 import asyncio
-import uuid
-from unittest.mock import Mock, create_autospec, patch
+from unittest.mock import Mock, create_autospec
 
 import pytest
 
@@ -35,11 +34,29 @@ class TestRead:
         self, sut, delegate
     ):
         sut.set_delegate(delegate)
-        expected = "foo"
+        expected = ["foo", "bar"]
 
-        sut.protocol.data_received(data=b"foo")
+        sut.protocol.data_received(data=b"foo\nbar\n")
 
-        delegate.connection_on_data.assert_called_once_with(connection=sut, data=expected)
+        delegate.connection_on_data_batch.assert_called_once_with(sut, expected)
+
+
+class TestLineTooLong:
+    def test_calls_line_too_long_on_delegate(self, sut, delegate):
+        sut.set_delegate(delegate)
+
+        sut.on_line_too_long()
+
+        delegate.connection_line_too_long.assert_called_once_with(sut)
+
+    def test_when_protocol_connected__closes_transport(self, sut, delegate):
+        transport = create_autospec(asyncio.Transport)
+        sut.set_delegate(delegate)
+
+        sut.protocol.connection_made(transport=transport)
+        sut.on_line_too_long()
+
+        transport.close.assert_called_once()
 
 
 class TestConnectionLost:
@@ -52,14 +69,28 @@ class TestConnectionLost:
 
         delegate.connection_disconnected.assert_called_once_with(sut)
 
+    def test_when_protocol_disconnects__releases_delegate_callbacks(self, sut, delegate):
+        sut.set_delegate(delegate)
+
+        sut.protocol.connection_lost(None)
+        sut.on_data(["foo"])
+
+        delegate.connection_on_data_batch.assert_not_called()
+
 
 class TestId:
-    def test_returns_uuid_generated_during_init(self):
-        expected = uuid.uuid4()
+    def test_returns_unique_id_generated_during_init(self):
+        sut_1 = Connection()
+        sut_2 = Connection()
+
+        assert sut_1.id != sut_2.id
+
+
+class TestHash:
+    def test_returns_id(self):
+        sut = Connection()
 
-        with patch("uuid.uuid4", return_value=expected):
-            sut = Connection()
-            assert sut.id == expected
+        assert hash(sut) == sut.id
 
 
 @pytest.mark.asyncio()
@@ -70,12 +101,12 @@ class TestWrite:
         transport = create_autospec(asyncio.Transport)
         transport.is_closing = Mock(return_value=False)
         sut.set_delegate(delegate)
-        expected = b"foo\n"
+        expected = (b"foo", b"\n")
 
         sut.protocol.connection_made(transport=transport)
-        await sut.write("foo")
+        sut.write(b"foo")
 
-        transport.write.assert_called_once_with(expected)
+        transport.writelines.assert_called_once_with(expected)
 
     async def test_when_protocol_connected__transport_closing__raises_transport_closed_error(  # noqa: E501
         self, sut, delegate
@@ -86,4 +117,4 @@ class TestWrite:
 
         sut.protocol.connection_made(transport=transport)
         with pytest.raises(TransportClosedError):
-            await sut.write("foo")
+            sut.write(b"foo")
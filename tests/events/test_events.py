@@ -0,0 +1,86 @@
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.tuicubserver.events.events import (
+    BoardChangedEvent,
+    Event,
+    RackChangedEvent,
+    UserJoinedEvent,
+)
+
+
+class TestEvent:
+    def test_subclass_without_event_name__raises_type_error(self) -> None:
+        with pytest.raises(TypeError):
+
+            class IncompleteEvent(Event):
+                pass
+
+    def test_abstract_subclass_without_event_name__is_allowed(self) -> None:
+        class AbstractEvent(Event, abstract=True):
+            pass
+
+        assert not hasattr(AbstractEvent, "event_name")
+
+    def test_event_name_is_class_attribute(self) -> None:
+        expected = "user_joined"
+
+        result = UserJoinedEvent.event_name
+
+        assert result == expected
+
+
+class TestPayload:
+    def test_returns_name_and_serialized_data(self, user, gameroom) -> None:
+        sut = UserJoinedEvent(user=user, gameroom=gameroom)
+        expected = {
+            "name": "user_joined",
+            "data": {"user": {"id": str(user.id), "name": user.name}},
+        }
+
+        result = sut.payload()
+
+        assert result == expected
+
+    def test_serializes_once(self, user, gameroom) -> None:
+        sut = UserJoinedEvent(user=user, gameroom=gameroom)
+
+        with patch.object(
+            UserJoinedEvent, "serialize", autospec=True, return_value={}
+        ) as serialize:
+            sut.payload()
+            sut.payload()
+
+        serialize.assert_called_once()
+
+
+class TestRackChangedEvent:
+    def test_serialize__returns_rack_sorted_by_number_with_jokers_last(self) -> None:
+        game = Mock()
+        game.player_for_user_id.return_value.rack.as_list.return_value = [
+            105,
+            60,
+            3,
+            104,
+            8,
+            51,
+        ]
+        expected = {"rack": [3, 60, 8, 51, 104, 105]}
+
+        result = RackChangedEvent(game=game, user=Mock()).serialize()
+
+        assert result == expected
+
+
+class TestBoardChangedEvent:
+    def test_serialize__returns_every_tileset_sorted_by_number(self) -> None:
+        game = Mock()
+        game.game_state.board.as_list.return_value = [[66, 12, 13], [7, 59, 33, 85]]
+        game.game_state.players = ()
+        game.new_tiles.return_value = [13]
+        expected = {"board": [[12, 13, 66], [7, 59, 33, 85]], "new_tiles": [13]}
+
+        result = BoardChangedEvent(game=game).serialize()
+
+        assert result == expected
@@ -1,8 +1,11 @@
 import asyncio
-from unittest.mock import AsyncMock, Mock, call, create_autospec
-from uuid import uuid4
+from collections.abc import Callable
+from concurrent.futures import Future
+from unittest.mock import AsyncMock, Mock, call, create_autospec, patch
+from uuid import UUID, uuid4
 
 import pytest
+from marshmallow import ValidationError
 from requests.exceptions import ConnectionError
 
 from src.tuicubserver.events.api_client import EventsApiClient
@@ -11,7 +14,13 @@ from src.tuicubserver.events.connection import (
     TransportClosedError,
     TuicubProtocol,
 )
-from src.tuicubserver.events.server import EventsServer
+from src.tuicubserver.events.server import (
+    DISCONNECT_BATCH_SIZE,
+    DISCONNECT_MAX_WORKERS,
+    ConnectRequest,
+    ConnectRequestSchema,
+    EventsServer,
+)
 from src.tuicubserver.models.user import UserToken
 
 
@@ -48,15 +57,27 @@ class TestListen:
 
         server.serve_forever.assert_awaited_once_with()
 
+    async def test_when_stopped__shuts_down_disconnects_executor(self, sut, loop):
+        server = create_autospec(asyncio.AbstractServer)
+        server.serve_forever.side_effect = asyncio.CancelledError
+        loop.create_server = AsyncMock(return_value=server)
+
+        with patch(
+            "concurrent.futures.ThreadPoolExecutor.shutdown"
+        ) as mocked_shutdown, pytest.raises(asyncio.CancelledError):
+            await sut.listen(host="localhost", port=8888)
+
+        mocked_shutdown.assert_called_once_with(wait=False)
+
 
-class TestConnectionOnData:
+class TestConnectionOnDataBatch:
     def test_when_data_is_valid_connect_request__queries_service_for_user_token(
         self, sut, users_service, session
     ):
         connection = create_autospec(Connection)
         expected = "foo"
 
-        sut.connection_on_data(connection, data='{"token": "foo"}')
+        sut.connection_on_data_batch(connection, messages=['{"token": "foo"}'])
 
         users_service.get_user_token.assert_called_once_with(
             session=session, token=expected
@@ -65,36 +86,165 @@ class TestConnectionOnData:
     def test_when_data_is_invalid_connect_request__logs_error(self, sut, logger):
         connection = create_autospec(Connection)
 
-        sut.connection_on_data(connection, data="foo")
+        sut.connection_on_data_batch(connection, messages=["foo"])
 
         logger.log_error.assert_called_once()
 
+    def test_handles_all_messages_in_single_session(
+        self, sut, users_service, session_factory, session
+    ):
+        connection = create_autospec(Connection)
 
-class TestConnectionDisconnected:
-    def test_when_connection_sent_connect_request__notifies_api_user_disconnected(
-        self, sut, users_service, api_client
+        sut.connection_on_data_batch(
+            connection, messages=['{"token": "foo"}', '{"token": "bar"}']
+        )
+
+        session_factory.assert_called_once()
+        assert users_service.get_user_token.call_args_list == [
+            call(session=session, token="foo"),
+            call(session=session, token="bar"),
+        ]
+
+    def test_reuses_session_across_batches(
+        self, sut, users_service, session_factory, session
     ):
         connection = create_autospec(Connection)
-        user_token = UserToken(id=uuid4(), user_id=uuid4(), token="foo")
-        users_service.get_user_token = Mock(return_value=user_token)
 
-        sut.connection_connected(connection)
-        sut.connection_on_data(connection, data='{"token": "foo"}')
-        sut.connection_disconnected(connection)
+        sut.connection_on_data_batch(connection, messages=['{"token": "foo"}'])
+        sut.connection_on_data_batch(connection, messages=['{"token": "bar"}'])
 
-        api_client.notify_user_disconnected.assert_called_once_with(user_token.user_id)
+        session_factory.assert_called_once()
+        assert users_service.get_user_token.call_args_list == [
+            call(session=session, token="foo"),
+            call(session=session, token="bar"),
+        ]
 
-    def test_when_connection_sent_connect_request__api_client_raises__logs_error(
-        self, sut, users_service, api_client, logger
+    def test_when_one_message_is_invalid__handles_the_rest(
+        self, sut, users_service, logger
     ):
         connection = create_autospec(Connection)
-        user_token = UserToken(id=uuid4(), user_id=uuid4(), token="foo")
-        users_service.get_user_token = Mock(return_value=user_token)
-        api_client.notify_user_disconnected = Mock(side_effect=ConnectionError)
 
-        sut.connection_connected(connection)
-        sut.connection_on_data(connection, data='{"token": "foo"}')
+        sut.connection_on_data_batch(connection, messages=["foo", '{"token": "bar"}'])
+
+        logger.log_error.assert_called_once()
+        users_service.get_user_token.assert_called_once()
+
+
+class TestConnectionDisconnected:
+    @pytest.fixture(autouse=True)
+    def _run_executor_inline(self, loop) -> None:
+        def run_inline(_, func, *args) -> Future:
+            future: Future = Future()
+            future.set_result(func(*args))
+            return future
+
+        loop.run_in_executor = Mock(side_effect=run_inline)
+
+    @pytest.fixture()
+    def connect_user(self, sut, users_service) -> Callable[[], tuple[Connection, UUID]]:
+        def factory() -> tuple[Connection, UUID]:
+            connection = create_autospec(Connection)
+            connection.id = uuid4()
+            user_token = UserToken(id=uuid4(), user_id=uuid4(), token="foo")
+            users_service.get_user_token = Mock(return_value=user_token)
+
+            sut.connection_connected(connection)
+            sut.connection_on_data_batch(connection, messages=['{"token": "foo"}'])
+            return connection, user_token.user_id
+
+        return factory
+
+    def test_when_connection_sent_connect_request__schedules_flush(
+        self, sut, connect_user, loop, api_client
+    ):
+        connection, _ = connect_user()
+
+        sut.connection_disconnected(connection)
+
+        loop.call_later.assert_called_once()
+        api_client.notify_users_disconnected.assert_not_called()
+
+    def test_when_flushed__notifies_api_users_disconnected_in_executor(
+        self, sut, connect_user, loop, api_client
+    ):
+        connection, user_id = connect_user()
+
         sut.connection_disconnected(connection)
+        _, flush = loop.call_later.call_args.args
+        flush()
+
+        loop.run_in_executor.assert_called_once()
+        api_client.notify_users_disconnected.assert_called_once_with(user_ids=[user_id])
+
+    def test_when_multiple_users_disconnect__notifies_api_once_with_all_users(
+        self, sut, connect_user, loop, api_client
+    ):
+        connection_1, user_id_1 = connect_user()
+        connection_2, user_id_2 = connect_user()
+
+        sut.connection_disconnected(connection_1)
+        sut.connection_disconnected(connection_2)
+        _, flush = loop.call_later.call_args.args
+        flush()
+
+        loop.call_later.assert_called_once()
+        api_client.notify_users_disconnected.assert_called_once_with(
+            user_ids=[user_id_1, user_id_2]
+        )
+
+    def test_when_batch_is_full__notifies_api_without_waiting(
+        self, sut, connect_user, loop, api_client
+    ):
+        connections = [connect_user() for _ in range(DISCONNECT_BATCH_SIZE)]
+
+        for connection, _ in connections:
+            sut.connection_disconnected(connection)
+
+        loop.call_later.return_value.cancel.assert_called_once()
+        api_client.notify_users_disconnected.assert_called_once_with(
+            user_ids=[user_id for _, user_id in connections]
+        )
+
+    def test_when_all_workers_busy__sends_pending_disconnects_after_one_completes(
+        self, sut, connect_user, loop
+    ):
+        futures = [Future() for _ in range(DISCONNECT_MAX_WORKERS)]
+        loop.run_in_executor = Mock(side_effect=[*futures, Future()])
+
+        for _ in range(DISCONNECT_MAX_WORKERS + 1):
+            connection, _ = connect_user()
+            sut.connection_disconnected(connection)
+            _, flush = loop.call_later.call_args.args
+            flush()
+
+        assert loop.run_in_executor.call_count == DISCONNECT_MAX_WORKERS
+
+        futures[0].set_result(None)
+
+        assert loop.run_in_executor.call_count == DISCONNECT_MAX_WORKERS + 1
+
+    def test_when_user_reconnected_on_new_connection__does_not_notify_api(
+        self, sut, connect_user, loop
+    ):
+        old_connection, user_id = connect_user()
+        new_connection = create_autospec(Connection)
+        new_connection.id = uuid4()
+        sut.connection_connected(new_connection)
+        sut.connection_on_data_batch(new_connection, messages=['{"token": "foo"}'])
+
+        sut.connection_disconnected(old_connection)
+
+        loop.call_later.assert_not_called()
+
+    def test_when_api_client_raises__logs_error(
+        self, sut, connect_user, loop, api_client, logger
+    ):
+        connection, _ = connect_user()
+        api_client.notify_users_disconnected = Mock(side_effect=ConnectionError)
+
+        sut.connection_disconnected(connection)
+        _, flush = loop.call_later.call_args.args
+        flush()
 
         logger.log_error.assert_called_once()
 
@@ -113,6 +263,17 @@ class TestConnectionDisconnected:
         logger.log.assert_has_calls(expected_calls)
 
 
+class TestConnectionLineTooLong:
+    def test_logs_events_line_too_long(self, sut, logger):
+        connection = create_autospec(Connection)
+
+        sut.connection_line_too_long(connection)
+
+        logger.log.assert_called_once_with(
+            "events_line_too_long", connection_id=str(connection.id)
+        )
+
+
 @pytest.mark.asyncio()
 class TestOnEvent:
     async def test_when_conn_sent_request__user_id_in_recipents__writes_json_event(  # noqa: E501
@@ -123,10 +284,50 @@ class TestOnEvent:
         users_service.get_user_token = Mock(return_value=user_token)
 
         sut.connection_connected(connection)
-        sut.connection_on_data(connection, data='{"token": "foo"}')
+        sut.connection_on_data_batch(connection, messages=['{"token": "foo"}'])
         await sut.on_event({"foo": "bar"}, recipents=[user_token.user_id])
 
-        connection.write.assert_awaited_once_with('{"foo": "bar"}')
+        connection.write.assert_called_once_with(b'{"foo":"bar"}')
+
+    async def test_when_many_recipents__writes_event_encoded_once_to_all(
+        self, sut, users_service
+    ):
+        connections = [create_autospec(Connection) for _ in range(3)]
+        user_tokens = [
+            UserToken(id=uuid4(), user_id=uuid4(), token="foo") for _ in connections
+        ]
+        users_service.get_user_token = Mock(side_effect=user_tokens)
+
+        for connection in connections:
+            sut.connection_connected(connection)
+            sut.connection_on_data_batch(connection, messages=['{"token": "foo"}'])
+        await sut.on_event(
+            {"foo": "bar"}, recipents=tuple(t.user_id for t in user_tokens)
+        )
+
+        (data,) = connections[0].write.call_args.args
+        assert data == b'{"foo":"bar"}'
+        for connection in connections[1:]:
+            connection.write.assert_called_once()
+            assert connection.write.call_args.args[0] is data
+
+    async def test_when_conn_sent_request__user_id_in_recipents__logs_events_sent(
+        self, sut, users_service, logger
+    ):
+        connection = create_autospec(Connection)
+        user_token = UserToken(id=uuid4(), user_id=uuid4(), token="foo")
+        users_service.get_user_token = Mock(return_value=user_token)
+
+        sut.connection_connected(connection)
+        sut.connection_on_data_batch(connection, messages=['{"token": "foo"}'])
+        await sut.on_event({"name": "foo"}, recipents=[user_token.user_id])
+
+        logger.log.assert_called_with(
+            "events_sent",
+            user_id=str(user_token.user_id),
+            connection_id=str(connection.id),
+            event_name="foo",
+        )
 
     async def test_when_conn_sent_request__user_id_in_recipents__conn_transport_closed__logs_error(  # noqa: E501
         self, sut, users_service, logger
@@ -138,7 +339,7 @@ class TestOnEvent:
         users_service.get_user_token = Mock(return_value=user_token)
 
         sut.connection_connected(connection)
-        sut.connection_on_data(connection, data='{"token": "foo"}')
+        sut.connection_on_data_batch(connection, messages=['{"token": "foo"}'])
         await sut.on_event({"foo": "bar"}, recipents=[user_token.user_id])
 
         logger.log_error.assert_called_with(
@@ -155,17 +356,17 @@ class TestOnEvent:
         users_service.get_user_token = Mock(side_effect=[user_token_1, user_token_2])
 
         sut.connection_connected(connection_1)
-        sut.connection_on_data(connection_1, data='{"token": "foo"}')
+        sut.connection_on_data_batch(connection_1, messages=['{"token": "foo"}'])
         sut.connection_connected(connection_2)
-        sut.connection_on_data(connection_2, data='{"token": "bar"}')
+        sut.connection_on_data_batch(connection_2, messages=['{"token": "bar"}'])
         sut.connection_disconnected(connection_2)
         await sut.on_event(
             {"foo": "bar"},
             recipents=[user_token_1.user_id, user_token_2.user_id],
         )
 
-        connection_1.write.assert_awaited_once_with('{"foo": "bar"}')
-        connection_2.write.assert_not_awaited()
+        connection_1.write.assert_called_once_with(b'{"foo":"bar"}')
+        connection_2.write.assert_not_called()
 
 
 class TestAddProtocol:
@@ -173,3 +374,15 @@ class TestAddProtocol:
         result = sut.add_protocol()
 
         assert isinstance(result, TuicubProtocol)
+
+
+class TestConnectRequestSchema:
+    def test_loads__returns_connect_request(self):
+        result = ConnectRequestSchema().loads('{"token": "foo", "bar": 1}')
+
+        assert result == ConnectRequest(token="foo")
+
+    @pytest.mark.parametrize("data", ["[]", "{}", '{"token": 1}'])
+    def test_loads__when_request_is_invalid__raises_validation_error(self, data):
+        with pytest.raises(ValidationError):
+            ConnectRequestSchema().loads(data)
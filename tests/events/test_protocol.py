@@ -1,40 +1,23 @@
 import asyncio
-from unittest.mock import Mock, call
-from weakref import WeakMethod
+from unittest.mock import create_autospec
 
 import pytest
 
-from src.tuicubserver.events.connection import TuicubProtocol
-
-
-class MockConnection:
-    def __init__(self):
-        self.on_data_mock = Mock()
-        self.on_connection_made_mock = Mock()
-        self.on_connection_lost_mock = Mock()
-
-    def on_data(self, data: str) -> None:
-        self.on_data_mock(data)
-
-    def on_connection_made(self, transport: asyncio.Transport) -> None:
-        self.on_connection_made_mock(transport)
-
-    def on_connection_lost(self) -> None:
-        self.on_connection_lost_mock()
+from src.tuicubserver.events.connection import (
+    MAX_LINE_LENGTH,
+    Connection,
+    TuicubProtocol,
+)
 
 
 @pytest.fixture()
-def connection() -> MockConnection:
-    return MockConnection()
+def connection() -> Connection:
+    return create_autospec(Connection)
 
 
 @pytest.fixture()
 def sut(connection) -> TuicubProtocol:
-    return TuicubProtocol(
-        on_connection_made=WeakMethod(connection.on_connection_made),
-        on_data=WeakMethod(connection.on_data),
-        on_connection_lost=WeakMethod(connection.on_connection_lost),
-    )
+    return TuicubProtocol(connection=connection)
 
 
 class TestConnectionMade:
@@ -43,40 +26,112 @@ class TestConnectionMade:
 
         sut.connection_made(transport=expected)
 
-        connection.on_connection_made_mock.assert_called_once_with(expected)
+        connection.on_connection_made.assert_called_once_with(expected)
 
 
 class TestDataReceived:
     def test_when_data_has_one_line__calls_on_data_callback_once_with_decoded_message(
         self, sut, connection
     ):
-        expected = "foo"
+        expected = ["foo"]
 
-        sut.data_received(data=b"foo")
+        sut.data_received(data=b"foo\n")
 
-        connection.on_data_mock.assert_called_once_with(expected)
+        connection.on_data.assert_called_once_with(expected)
 
-    def test_when_data_has_two_lines__calls_on_data_callback_twice_with_decoded_messages(
+    def test_when_data_has_two_lines__calls_on_data_callback_once_with_decoded_messages(
         self, sut, connection
     ):
-        expected = [call("foo"), call("bar")]
+        expected = ["foo", "bar"]
 
-        sut.data_received(data=b"foo\nbar")
+        sut.data_received(data=b"foo\nbar\n")
 
-        connection.on_data_mock.assert_has_calls(expected, any_order=False)
+        connection.on_data.assert_called_once_with(expected)
 
     def test_when_data_has_empty_lines__does_not_call_on_data_callback_for_empty_lines(
         self, sut, connection
     ):
-        expected = [call("foo"), call("bar")]
+        expected = ["foo", "bar"]
 
         sut.data_received(data=b"\n\nfoo\nbar\n")
 
-        connection.on_data_mock.assert_has_calls(expected, any_order=False)
+        connection.on_data.assert_called_once_with(expected)
+
+    def test_when_data_has_no_newline__does_not_call_on_data_callback(
+        self, sut, connection
+    ):
+        sut.data_received(data=b"foo")
+
+        connection.on_data.assert_not_called()
+
+    def test_when_message_is_split_across_chunks__calls_on_data_callback_once(
+        self, sut, connection
+    ):
+        expected = ['{"token": "foo"}']
+
+        sut.data_received(data=b'{"tok')
+        sut.data_received(data=b'en": "foo"}\n{"to')
+
+        connection.on_data.assert_called_once_with(expected)
+
+    def test_when_lines_end_with_carriage_return__strips_it(self, sut, connection):
+        expected = ["foo", "bar"]
+
+        sut.data_received(data=b"foo\r\nbar\r\n")
+
+        connection.on_data.assert_called_once_with(expected)
+
+    def test_when_data_has_only_empty_lines__does_not_call_on_data_callback(
+        self, sut, connection
+    ):
+        sut.data_received(data=b"\n\n")
+
+        connection.on_data.assert_not_called()
+
+    def test_when_pending_line_exceeds_max_length__calls_on_line_too_long_callback(
+        self, sut, connection
+    ):
+        sut.data_received(data=b"x" * MAX_LINE_LENGTH)
+        sut.data_received(data=b"x")
+
+        connection.on_line_too_long.assert_called_once()
+
+    def test_when_line_after_newline_exceeds_max_length__calls_on_line_too_long_callback(
+        self, sut, connection
+    ):
+        sut.data_received(data=b"foo\n" + b"x" * (MAX_LINE_LENGTH + 1))
+
+        connection.on_data.assert_called_once_with(["foo"])
+        connection.on_line_too_long.assert_called_once()
+
+    def test_when_pending_line_within_max_length__does_not_call_on_line_too_long_callback(  # noqa: E501
+        self, sut, connection
+    ):
+        sut.data_received(data=b"x" * MAX_LINE_LENGTH)
+
+        connection.on_line_too_long.assert_not_called()
 
 
 class TestConnectionLost:
     def test_calls_on_connection_loast_callback(self, sut, connection):
         sut.connection_lost(None)
 
-        connection.on_connection_lost_mock.assert_called_once()
+        connection.on_connection_lost.assert_called_once()
+
+    def test_releases_connection(self, sut):
+        sut.connection_lost(None)
+
+        assert sut.connection is None
+
+    def test_when_called_twice__calls_on_connection_lost_callback_once(
+        self, sut, connection
+    ):
+        sut.connection_lost(None)
+        sut.connection_lost(None)
+
+        connection.on_connection_lost.assert_called_once()
+
+
+class TestSlots:
+    def test_has_no_instance_dict(self, sut):
+        assert not hasattr(sut, "__dict__")
@@ -0,0 +1,61 @@
+import pytest
+from marshmallow import ValidationError
+
+from src.tuicubserver.events.events import UserJoinedEvent
+from src.tuicubserver.messages.message import (
+    Message,
+    MessageEnvelope,
+    decode_envelope,
+)
+
+
+class TestMessage:
+    def test_from_event__reuses_event_recipents(self, user, gameroom) -> None:
+        event = UserJoinedEvent(user=user, gameroom=gameroom)
+
+        result = Message.from_event(event)
+
+        assert result.recipents is event.recipents
+
+
+class TestDecodeEnvelope:
+    def test_returns_message_envelope(self, user_id) -> None:
+        data = (
+            b'{"token":"foo","message":{"recipents":["%s"],"event":{"a":1}}}\n'
+            % str(user_id).encode()
+        )
+        expected = MessageEnvelope(
+            token="foo", message=Message(recipents=(user_id,), event={"a": 1})
+        )
+
+        result = decode_envelope(data)
+
+        assert result == expected
+
+    def test_when_data_has_trailing_whitespace__returns_message_envelope(
+        self,
+    ) -> None:
+        result = decode_envelope(b'{"token":"foo","message":{"event":{}}} \r\n')
+
+        assert result.token == "foo"
+
+    def test_when_recipents_missing__returns_empty_recipents(self) -> None:
+        result = decode_envelope(b'{"token":"foo","message":{"event":{}}}')
+
+        assert result.message.recipents == ()
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            b"[]",
+            b'{"message":{"event":{}}}',
+            b'{"token":"foo"}',
+            b'{"token":"foo","message":{}}',
+            b'{"token":"foo","message":{"event":{},"recipents":"bar"}}',
+            b'{"token":"foo","message":{"event":{},"recipents":["bar"]}}',
+            b'{"token":"foo","message":{"event":{},"recipents":[1]}}',
+        ],
+    )
+    def test_when_envelope_is_invalid__raises_validation_error(self, data) -> None:
+        with pytest.raises(ValidationError):
+            decode_envelope(data)
@@ -1,26 +1,21 @@
-from socket import socket
-from unittest.mock import call, create_autospec, patch
+import socket
+from unittest.mock import create_autospec, patch
 from uuid import UUID
 
 import pytest
 
 from src.tuicubserver.messages.client import MessagesClient
-from src.tuicubserver.messages.message import (
-    Message,
-    MessageEnvelopeSchema,
-)
+from src.tuicubserver.messages.message import Message, decode_envelope
 
 
 @pytest.fixture()
-def sock() -> socket:
-    return create_autospec(socket)
+def sock() -> socket.socket:
+    return create_autospec(socket.socket)
 
 
 @pytest.fixture()
 def sut(sock) -> MessagesClient:
-    return MessagesClient(
-        host="localhost", port=8888, token="token", schema=MessageEnvelopeSchema()
-    )
+    return MessagesClient(host="localhost", port=8888, token="token")
 
 
 class TestSend:
@@ -30,9 +25,9 @@ class TestSend:
             user_id_2 = UUID("5d4c8ca4-a7d7-4da4-bb66-8717c92d350e")
             message = Message(recipents=[user_id_1, user_id_2], event={"foo": 42})
             expected = (
-                b'{"token": "token", "message": {"recipents": '
-                b'["d052cc24-dc55-4f19-b71f-f38f0deef258", '
-                b'"5d4c8ca4-a7d7-4da4-bb66-8717c92d350e"], "event": {"foo": 42}}}\n'
+                b'{"token":"token","message":{"recipents":'
+                b'["d052cc24-dc55-4f19-b71f-f38f0deef258",'
+                b'"5d4c8ca4-a7d7-4da4-bb66-8717c92d350e"],"event":{"foo":42}}}\n'
             )
 
             sut.connect()
@@ -40,25 +35,64 @@ class TestSend:
 
             sock.sendall.assert_called_once_with(expected)
 
-    def test_sends_all_passed_messages(self, sut, sock):
+    def test_sends_all_passed_messages_in_single_call(self, sut, sock):
         with patch("socket.create_connection", return_value=sock):
             user_id_1 = UUID("d052cc24-dc55-4f19-b71f-f38f0deef258")
             user_id_2 = UUID("5d4c8ca4-a7d7-4da4-bb66-8717c92d350e")
             message_1 = Message(recipents=[user_id_1, user_id_2], event={"foo": 42})
             message_2 = Message(recipents=[user_id_1, user_id_2], event={"bar": 13})
-            call_1 = call(
-                b'{"token": "token", "message": {"recipents": '
-                b'["d052cc24-dc55-4f19-b71f-f38f0deef258", '
-                b'"5d4c8ca4-a7d7-4da4-bb66-8717c92d350e"], "event": {"foo": 42}}}\n'
-            )
-            call_2 = call(
-                b'{"token": "token", "message": {"recipents": '
-                b'["d052cc24-dc55-4f19-b71f-f38f0deef258", '
-                b'"5d4c8ca4-a7d7-4da4-bb66-8717c92d350e"], "event": {"bar": 13}}}\n'
+            expected = (
+                b'{"token":"token","message":{"recipents":'
+                b'["d052cc24-dc55-4f19-b71f-f38f0deef258",'
+                b'"5d4c8ca4-a7d7-4da4-bb66-8717c92d350e"],"event":{"foo":42}}}\n'
+                b'{"token":"token","message":{"recipents":'
+                b'["d052cc24-dc55-4f19-b71f-f38f0deef258",'
+                b'"5d4c8ca4-a7d7-4da4-bb66-8717c92d350e"],"event":{"bar":13}}}\n'
             )
-            expected_calls = [call_1, call_2]
 
             sut.connect()
             sut.send(message_1, message_2)
 
-            sock.sendall.assert_has_calls(expected_calls)
+            sock.sendall.assert_called_once_with(expected)
+
+    def test_when_no_messages__does_not_send(self, sut, sock):
+        with patch("socket.create_connection", return_value=sock):
+            sut.connect()
+            sut.send()
+
+            sock.sendall.assert_not_called()
+
+
+class TestConnect:
+    def test_disables_nagle_algorithm(self, sut, sock):
+        with patch("socket.create_connection", return_value=sock):
+            sut.connect()
+
+            sock.setsockopt.assert_called_once_with(
+                socket.IPPROTO_TCP, socket.TCP_NODELAY, 1
+            )
+
+
+class TestEncoding:
+    def test_sent_envelope_is_decoded_by_decode_envelope(self, sut, sock):
+        with patch("socket.create_connection", return_value=sock):
+            user_id = UUID("d052cc24-dc55-4f19-b71f-f38f0deef258")
+            message = Message(recipents=(user_id,), event={"foo": [1, 2]})
+
+            sut.connect()
+            sut.send(message)
+
+            (data,) = sock.sendall.call_args.args
+            envelope = decode_envelope(data)
+            assert envelope.token == "token"
+            assert envelope.message == message
+
+    def test_token_is_escaped_in_envelope(self, sock):
+        sut = MessagesClient(host="localhost", port=8888, token='to"ken')
+        with patch("socket.create_connection", return_value=sock):
+            sut.connect()
+            sut.send(Message(recipents=(), event={}))
+
+            (data,) = sock.sendall.call_args.args
+            envelope = decode_envelope(data)
+            assert envelope.token == 'to"ken'
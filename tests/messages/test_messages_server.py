@@ -5,9 +5,13 @@ from weakref import ref
 
 import pytest
 
-from src.tuicubserver.common.errors import UnauthorizedError
-from src.tuicubserver.messages.server import MessagesDelegate, MessagesServer
-from tests.utils import AsyncIter, not_raises
+from src.tuicubserver.messages.server import (
+    MAX_MESSAGE_SIZE,
+    READ_CHUNK_SIZE,
+    MessagesDelegate,
+    MessagesServer,
+)
+from tests.utils import not_raises
 
 
 @pytest.fixture()
@@ -15,6 +19,14 @@ def sut(auth_service, logger) -> MessagesServer:
     return MessagesServer(auth_service=auth_service, logger=logger)
 
 
+def stream_reader(*chunks: bytes) -> asyncio.StreamReader:
+    reader = asyncio.StreamReader()
+    for chunk in chunks:
+        reader.feed_data(chunk)
+    reader.feed_eof()
+    return reader
+
+
 @pytest.mark.asyncio()
 class TestListen:
     async def test_creates_server_on_host_and_port(self, sut):
@@ -22,7 +34,10 @@ class TestListen:
             await sut.listen(host="localhost", port=12421)
 
             mocked_start_server.assert_awaited_once_with(
-                sut.client_connected, host="localhost", port=12421
+                sut.client_connected,
+                host="localhost",
+                port=12421,
+                limit=MAX_MESSAGE_SIZE,
             )
 
     async def test_starts_serving_forever(self, sut, loop):
@@ -62,23 +77,25 @@ class TestClientConnected:
             b'"5d4c8ca4-a7d7-4da4-bb66-8717c92d350e"], "event": {"bar": 42}}}'
         )
         expected_calls = [
-            call(event={"bar": 13}, recipents=[user_id_1, user_id_2]),
-            call(event={"bar": 42}, recipents=[user_id_1, user_id_2]),
+            call(event={"bar": 13}, recipents=(user_id_1, user_id_2)),
+            call(event={"bar": 42}, recipents=(user_id_1, user_id_2)),
         ]
 
         sut.set_delegate(delegate)
-        await sut.client_connected(AsyncIter([message_1, message_2]), writer=Mock())
+        await sut.client_connected(
+            stream_reader(message_1 + b"\n" + message_2 + b"\n"), writer=Mock()
+        )
 
         delegate.on_event.assert_has_calls(expected_calls)
 
     async def test_when_message_is_invalid__does_not_raise(self, sut):
         with not_raises(Exception):
-            await sut.client_connected(AsyncIter([b"foo"]), writer=Mock())
+            await sut.client_connected(stream_reader(b"foo\n"), writer=Mock())
 
     async def test_when_read_message_has_invalid_token__does_not_call_delegate(
         self, sut, auth_service
     ):
-        auth_service.authorize_message = Mock(side_effect=UnauthorizedError)
+        auth_service.is_message_authorized = Mock(return_value=False)
         delegate = create_autospec(MessagesDelegate)
 
         message = (
@@ -88,7 +105,64 @@ class TestClientConnected:
         )
 
         sut.set_delegate(delegate)
-        await sut.client_connected(AsyncIter([message]), writer=Mock())
+        await sut.client_connected(stream_reader(message), writer=Mock())
+
+        delegate.on_event.assert_not_called()
+        auth_service.is_message_authorized.assert_called_once_with(secret="foo")
+
+    async def test_when_message_is_split_across_reads__calls_delegate_once(self, sut):
+        delegate = create_autospec(MessagesDelegate)
+        message = b'{"token": "foo", "message": {"event": {"bar": 13}}}\n'
+
+        sut.set_delegate(delegate)
+        await sut.client_connected(
+            stream_reader(message[:10], message[10:]), writer=Mock()
+        )
+
+        delegate.on_event.assert_called_once_with(event={"bar": 13}, recipents=())
+
+    async def test_when_message_exceeds_size_limit__logs_error(self, sut, logger):
+        delegate = create_autospec(MessagesDelegate)
+
+        sut.set_delegate(delegate)
+        await sut.client_connected(
+            stream_reader(b"a" * (MAX_MESSAGE_SIZE + 1)), writer=Mock()
+        )
 
         delegate.on_event.assert_not_called()
-        auth_service.authorize_message.assert_called_once_with(secret="foo")
+        logger.log_error.assert_called_once()
+
+    async def test_when_message_exceeds_size_limit__discards_rest_of_line__dispatches_next_line(  # noqa: E501
+        self, sut
+    ):
+        delegate = create_autospec(MessagesDelegate)
+        oversized = b"x" * (MAX_MESSAGE_SIZE + READ_CHUNK_SIZE)
+        smuggled = b'{"token": "foo", "message": {"event": {"smuggled": 1}}}\n'
+        valid = b'{"token": "foo", "message": {"event": {"bar": 13}}}\n'
+
+        sut.set_delegate(delegate)
+        await sut.client_connected(
+            stream_reader(oversized + smuggled + valid), writer=Mock()
+        )
+
+        delegate.on_event.assert_called_once_with(event={"bar": 13}, recipents=())
+
+    async def test_when_read_message_has_invalid_token__logs_unauthorized(
+        self, sut, auth_service, logger
+    ):
+        auth_service.is_message_authorized = Mock(return_value=False)
+        message = b'{"token": "foo", "message": {"event": {"bar": 13}}}'
+
+        await sut.client_connected(stream_reader(message), writer=Mock())
+
+        logger.log.assert_called_with("messages_unauthorized")
+        logger.log_error.assert_not_called()
+
+    async def test_when_delegate_not_set__handles_message_without_error(
+        self, sut, logger
+    ):
+        message = b'{"token": "foo", "message": {"event": {"bar": 13}}}\n'
+
+        await sut.client_connected(stream_reader(message), writer=Mock())
+
+        logger.log_error.assert_not_called()
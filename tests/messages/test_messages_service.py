@@ -225,53 +225,45 @@ class TestDisconnectedGame:
         self, sut, messages_client, game, user_1, player_1
     ) -> None:
         result = GameDisconnectResult(game=game, player=player_1, turn=None)
-        expected_calls = [
-            call(
-                Message.from_event(PlayerLeftEvent(result.player, result.game)),
-                Message.from_event(PlayersChangedEvent(result.game)),
-            ),
-            call(Message.from_event(PileCountChangedEvent(result.game))),
+        expected = [
+            Message.from_event(PlayerLeftEvent(result.player, result.game)),
+            Message.from_event(PlayersChangedEvent(result.game)),
+            Message.from_event(PileCountChangedEvent(result.game)),
         ]
 
         sut.disconnected_game(sender=user_1, result=result)
 
-        messages_client.send.assert_has_calls(expected_calls)
+        messages_client.send.assert_called_once_with(*expected)
 
     def test_when_game_has_no_winner__has_new_turn__sends_correct_messages(
         self, sut, messages_client, game, user_1, player_1, turn
     ) -> None:
         result = GameDisconnectResult(game=game, player=player_1, turn=turn)
-        expected_calls = [
-            call(
-                Message.from_event(PlayerLeftEvent(result.player, result.game)),
-                Message.from_event(PlayersChangedEvent(result.game)),
-            ),
-            call(Message.from_event(PileCountChangedEvent(result.game))),
-            call(
-                Message.from_event(BoardChangedEvent(result.game)),
-                Message.from_event(TurnStartedEvent(result.game)),
-            ),
+        expected = [
+            Message.from_event(PlayerLeftEvent(result.player, result.game)),
+            Message.from_event(PlayersChangedEvent(result.game)),
+            Message.from_event(PileCountChangedEvent(result.game)),
+            Message.from_event(BoardChangedEvent(result.game)),
+            Message.from_event(TurnStartedEvent(result.game)),
         ]
 
         sut.disconnected_game(sender=user_1, result=result)
 
-        messages_client.send.assert_has_calls(expected_calls)
+        messages_client.send.assert_called_once_with(*expected)
 
     def test_when_game_has_winner__sends_correct_messages(
         self, sut, messages_client, won_game, player_1, user_1
     ) -> None:
         result = GameDisconnectResult(game=won_game, player=player_1, turn=None)
-        expected_calls = [
-            call(
-                Message.from_event(PlayerLeftEvent(result.player, result.game)),
-                Message.from_event(PlayersChangedEvent(result.game)),
-            ),
-            call(Message.from_event(PlayerWonEvent(player_1, won_game))),
+        expected = [
+            Message.from_event(PlayerLeftEvent(result.player, result.game)),
+            Message.from_event(PlayersChangedEvent(result.game)),
+            Message.from_event(PlayerWonEvent(player_1, won_game)),
         ]
 
         sut.disconnected_game(sender=user_1, result=result)
 
-        messages_client.send.assert_has_calls(expected_calls)
+        messages_client.send.assert_called_once_with(*expected)
 
 
 class TestDisconnectedGameroom:
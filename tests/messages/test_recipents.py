@@ -0,0 +1,42 @@
+from uuid import uuid4
+
+from attrs import evolve
+
+from src.tuicubserver.messages.recipents import (
+    all_players,
+    all_users_but_sender,
+    single_recipent,
+)
+from src.tuicubserver.models.user import User
+
+
+class TestAllUsersButSender:
+    def test_returns_ids_of_all_users_except_sender(self, user, gameroom) -> None:
+        other = User(id=uuid4(), name="Bob", current_gameroom_id=gameroom.id)
+        gameroom = evolve(gameroom, users=(user, other))
+        expected = (other.id,)
+
+        result = all_users_but_sender(sender=user, gameroom=gameroom)
+
+        assert result == expected
+
+
+class TestSingleRecipent:
+    def test_returns_tuple_with_user_id(self, user_id) -> None:
+        expected = (user_id,)
+
+        result = single_recipent(user_id)
+
+        assert result == expected
+
+
+class TestAllPlayers:
+    def test_returns_user_ids_of_all_players(self, game, player_1, player_2) -> None:
+        game = evolve(
+            game, game_state=evolve(game.game_state, players=(player_1, player_2))
+        )
+        expected = (player_1.user_id, player_2.user_id)
+
+        result = all_players(game)
+
+        assert result == expected
@@ -1,9 +1,73 @@
+from datetime import datetime
 from unittest.mock import create_autospec
 
+import pytest
 from attrs import evolve
 
-from src.tuicubserver.models.dto import GameDto, PlayerDto, create_players
-from src.tuicubserver.models.game import Game, GameState, Player, Tileset, Turn
+from src.tuicubserver.models.dto import (
+    BaseDto,
+    GameDto,
+    GameroomDto,
+    GameStateDto,
+    PlayerDto,
+    UserDto,
+    serialize_game_for_player,
+    serialize_gamerooms,
+    serialize_players,
+)
+from src.tuicubserver.models.game import (
+    Board,
+    Game,
+    GameState,
+    Player,
+    Tileset,
+    Turn,
+)
+from src.tuicubserver.models.user import User
+from src.tuicubserver.models.status import GameroomStatus
+
+
+@pytest.fixture()
+def players(
+    user_id_1, user_id_2, user_id_3, player_id_1, player_id_2, player_id_3
+) -> tuple[Player, ...]:
+    return (
+        Player(id=player_id_1, user_id=user_id_1, name="foo", rack=Tileset()),
+        Player(id=player_id_3, user_id=user_id_3, name="baz", rack=Tileset()),
+        Player(
+            id=player_id_2,
+            user_id=user_id_2,
+            name="bar",
+            rack=Tileset.create(tiles=[1, 2]),
+        ),
+    )
+
+
+@pytest.fixture()
+def ordered_game(
+    players, user_id_1, user_id_2, user_id_3, player_id_1, player_id_2
+) -> Game:
+    game = create_autospec(Game)
+    game.id = player_id_1
+    game.gameroom_id = user_id_1
+    game.winner = None
+    game.turn_order = (user_id_1, user_id_2, user_id_3)
+    game.game_state = create_autospec(GameState)
+    game.game_state.players = players
+    game.game_state.board = Board.create(tilesets=[[3, 4, 5]])
+    game.game_state.pile = (6, 7, 8, 9)
+    game.turn = create_autospec(Turn)
+    game.turn.player_id = player_id_2
+    return game
+
+
+@pytest.fixture()
+def expected_players(user_id_1, user_id_2, user_id_3) -> list[dict]:
+    return [
+        {"name": "foo", "user_id": str(user_id_1), "tiles_count": 0, "has_turn": False},
+        {"name": "bar", "user_id": str(user_id_2), "tiles_count": 2, "has_turn": True},
+        {"name": "baz", "user_id": str(user_id_3), "tiles_count": 0, "has_turn": False},
+    ]
 
 
 class TestGameDto:
@@ -22,45 +86,146 @@ class TestGameDto:
 
         assert result.winner == expected
 
-    def test_for_player__when_game_has_winner__creates_winner_dto(
-        self, game, player_1, user_1
-    ) -> None:
-        game = evolve(game, winner=player_1)
-        expected = PlayerDto(
-            user_id=game.winner.user_id,
-            name=game.winner.name,
-            tiles_count=len(game.winner.rack),
-            has_turn=game.turn.player_id == game.winner.id,
+    def test_serialize__returns_nested_dictionaries(self, user_id_1, player_id_1) -> None:
+        winner = PlayerDto(user_id=user_id_1, name="foo", tiles_count=0, has_turn=True)
+        sut = GameDto(
+            id=player_id_1,
+            game_state=GameStateDto(
+                id=player_id_1, players=[winner], board=[[1, 2, 3]], pile_count=4, rack=[]
+            ),
+            gameroom_id=user_id_1,
+            winner=winner,
         )
+        expected_player = {
+            "name": "foo",
+            "user_id": str(user_id_1),
+            "tiles_count": 0,
+            "has_turn": True,
+        }
+        expected = {
+            "id": str(player_id_1),
+            "gameroom_id": str(user_id_1),
+            "game_state": {
+                "players": [expected_player],
+                "board": [[1, 2, 3]],
+                "pile_count": 4,
+                "rack": [],
+            },
+            "winner": expected_player,
+        }
 
-        result = GameDto.for_player(game, player_1)
+        result = sut.serialize()
 
-        assert result.winner == expected
+        assert result == expected
 
 
-class TestCreatePlayers:
-    def test_returns_players_ordered_by_turn_order(
-        self, user_id_1, user_id_2, user_id_3, player_id_1, player_id_2, player_id_3
-    ):
-        player_1 = Player(id=player_id_1, user_id=user_id_1, name="foo", rack=Tileset())
-        player_2 = Player(id=player_id_1, user_id=user_id_1, name="foo", rack=Tileset())
-        player_3 = Player(id=player_id_2, user_id=user_id_2, name="bar", rack=Tileset())
-        player_4 = Player(id=player_id_3, user_id=user_id_3, name="baz", rack=Tileset())
-
-        game = create_autospec(Game)
-        game.turn_order = (user_id_1, user_id_2, user_id_3)
-        game.game_state = create_autospec(GameState)
-        game.game_state.players = (player_1, player_2, player_4, player_3)
-        game.turn = create_autospec(Turn)
-        game.turn.player_id = player_id_2
+class TestGameroomDto:
+    def test_serialize__returns_dictionary(self, user_id_1, user_id_2) -> None:
+        sut = GameroomDto(
+            id=user_id_1,
+            name="foo",
+            owner_id=user_id_2,
+            created_at=datetime(2023, 10, 16, 18, 25, 19),
+            status=GameroomStatus.STARTING,
+            users=[UserDto(id=user_id_2, name="bar")],
+            game_id=None,
+        )
+        expected = {
+            "id": str(user_id_1),
+            "name": "foo",
+            "owner_id": str(user_id_2),
+            "status": "STARTING",
+            "created_at": 1697480719000.0,
+            "users": [{"id": str(user_id_2), "name": "bar"}],
+            "game_id": None,
+        }
+
+        result = sut.serialize()
 
+        assert result == expected
+
+
+class TestSerializeGamerooms:
+    def test_returns_same_dictionaries_as_gameroom_dto(self, gameroom, game) -> None:
+        gamerooms = [gameroom, evolve(gameroom, game=game)]
+        expected = [GameroomDto.create(gameroom).serialize() for gameroom in gamerooms]
+
+        result = serialize_gamerooms(gamerooms)
+
+        assert result == expected
+
+
+class TestGameStateDto:
+    def test_create__returns_players_ordered_by_turn_order(
+        self, ordered_game, user_id_1, user_id_2, user_id_3
+    ):
+        user = create_autospec(User)
+        user.id = user_id_2
         expected = [
             PlayerDto(user_id=user_id_1, name="foo", tiles_count=0, has_turn=False),
-            PlayerDto(user_id=user_id_1, name="foo", tiles_count=0, has_turn=False),
-            PlayerDto(user_id=user_id_2, name="bar", tiles_count=0, has_turn=True),
+            PlayerDto(user_id=user_id_2, name="bar", tiles_count=2, has_turn=True),
             PlayerDto(user_id=user_id_3, name="baz", tiles_count=0, has_turn=False),
         ]
 
-        result = create_players(game)
+        result = GameStateDto.create(ordered_game, user)
+
+        assert result.players == expected
+        assert result.rack == [1, 2]
+
+
+class TestSerializeGameForPlayer:
+    def test_returns_dictionary(
+        self, ordered_game, players, expected_players, player_id_1, user_id_1
+    ) -> None:
+        expected = {
+            "id": str(player_id_1),
+            "gameroom_id": str(user_id_1),
+            "game_state": {
+                "players": expected_players,
+                "board": [[3, 4, 5]],
+                "pile_count": 4,
+                "rack": [1, 2],
+            },
+            "winner": None,
+        }
+
+        result = serialize_game_for_player(ordered_game, players[2])
 
         assert result == expected
+
+    def test_when_game_has_winner__returns_serialized_winner(
+        self, ordered_game, players, expected_players
+    ) -> None:
+        ordered_game.winner = players[2]
+
+        result = serialize_game_for_player(ordered_game, players[0])
+
+        assert result["winner"] == expected_players[1]
+
+
+class TestSerializePlayers:
+    def test_returns_players_ordered_by_turn_order(
+        self, ordered_game, expected_players
+    ) -> None:
+        result = serialize_players(ordered_game)
+
+        assert result == expected_players
+
+
+class TestBaseDto:
+    def test_subclass_without_serialize__raises_type_error(self) -> None:
+        with pytest.raises(TypeError):
+
+            class IncompleteDto(BaseDto):
+                pass
+
+    def test_abstract_subclass_without_serialize__is_allowed(self) -> None:
+        class AbstractDto(BaseDto, abstract=True):
+            pass
+
+        assert not hasattr(AbstractDto, "serialize")
+
+    def test_dto_has_no_instance_dict(self, user_id_1) -> None:
+        sut = UserDto(id=user_id_1, name="foo")
+
+        assert not hasattr(sut, "__dict__")
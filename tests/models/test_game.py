@@ -164,6 +164,17 @@ class TestPlayerAfter:
 
         assert result == expected
 
+    def test_when_player_not_in_turn_order__raises_user_not_in_game_error(
+        self, make_sut, make_game_state, player_1, player_2, user_id_1
+    ) -> None:
+        sut = make_sut(
+            game_state=make_game_state(players=(player_1,)),
+            turn_order=(user_id_1,),
+        )
+
+        with pytest.raises(UserNotInGameError):
+            sut.player_after(player_2)
+
 
 class TestPlayerForUser:
     def test_when_user_in_game__returns_player(
@@ -1,6 +1,7 @@
 from uuid import UUID, uuid4
 
 import pytest
+from sqlalchemy import inspect
 
 from src.tuicubserver.models.db import (
     DbGame,
@@ -26,6 +27,24 @@ from src.tuicubserver.models.mapper import Mapper
 from src.tuicubserver.models.user import User, UserToken
 
 
+def db_values(model, visited=None):
+    if model is None:
+        return None
+    if isinstance(model, list):
+        return [db_values(value, visited) for value in model]
+
+    visited = visited or set()
+    if id(model) in visited:
+        return type(model).__name__, model.id
+    visited = visited | {id(model)}
+
+    mapper = inspect(model).mapper
+    values = {attr.key: getattr(model, attr.key) for attr in mapper.column_attrs}
+    for relationship in mapper.relationships:
+        values[relationship.key] = db_values(getattr(model, relationship.key), visited)
+    return values
+
+
 @pytest.fixture()
 def user_token_id() -> UUID:
     return uuid4()
@@ -307,45 +326,45 @@ class TestMapper:
     ) -> None:
         result = sut.to_db_player(player_1, game_state_id=game_state_id)
 
-        assert result == db_player_1
+        assert db_values(result) == db_values(db_player_1)
 
     def test_map_turn__returns_mapped_db_turn(self, sut, turn, db_turn) -> None:
         result = sut.to_db_turn(turn)
 
-        assert result == db_turn
+        assert db_values(result) == db_values(db_turn)
 
     def test_map_move__returns_mapped_db_move(self, sut, move_1, db_move_1) -> None:
         result = sut.to_db_move(move_1)
 
-        assert result == db_move_1
+        assert db_values(result) == db_values(db_move_1)
 
     def test_map_game_state__returns_mapped_db_game_state(
         self, sut, game_state, db_game_state
     ) -> None:
         result = sut.to_db_game_state(game_state)
 
-        assert result == db_game_state
+        assert db_values(result) == db_values(db_game_state)
 
     def test_map_game__returns_mapped_db_game(self, sut, game, db_game) -> None:
         result = sut.to_db_game(game)
 
-        assert result == db_game
+        assert db_values(result) == db_values(db_game)
 
     def test_map_gameroom__returns_mapped_db_gameroom(
         self, sut, gameroom, db_gameroom
     ) -> None:
         result = sut.to_db_gameroom(gameroom)
 
-        assert result == db_gameroom
+        assert db_values(result) == db_values(db_gameroom)
 
     def test_map_user__returns_mapped_db_user(self, sut, user_1, db_user_1) -> None:
         result = sut.to_db_user(user_1)
 
-        assert result == db_user_1
+        assert db_values(result) == db_values(db_user_1)
 
     def test_map_user_token__returns_mapped_db_user_token(
         self, sut, user_token, db_user_token
     ) -> None:
         result = sut.to_db_user_token(user_token)
 
-        assert result == db_user_token
+        assert db_values(result) == db_values(db_user_token)
@@ -4,35 +4,44 @@ from src.tuicubserver.models.game import Pile, Tileset
 class TestDraw:
     def test_returns_random_tile(self, rng_service) -> None:
         sut = Pile([1, 2, 3])
-        expected = 1  # rng_service.pick returns first element
+        expected = 3  # rng_service.pick_index returns the last index
 
-        result = sut.draw(rng_service.pick)
+        result = sut.draw(rng_service.pick_index)
 
         assert result == expected
 
     def test_removes_drawn_tile_from_pile(self, rng_service) -> None:
         sut = Pile([1, 2, 3])
-        expected = (2, 3)
+        expected = (1, 2)
 
-        sut.draw(rng_service.pick)
+        sut.draw(rng_service.pick_index)
 
         assert sut.tiles == expected
 
+    def test_moves_last_tile_in_place_of_drawn_tile(self) -> None:
+        sut = Pile([1, 2, 3, 4])
+        expected = (1, 4, 3)
+
+        result = sut.draw(lambda _: 1)
+
+        assert result == 2
+        assert sut.tiles == expected
+
 
 class TestDrawRack:
     def test_returns_random_rack(self, rng_service) -> None:
         sut = Pile([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15])
-        expected = Tileset.create([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14])
+        expected = Tileset.create([2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15])
 
-        result = sut.draw_rack(rng_service.pick)
+        result = sut.draw_rack(rng_service.pick_index)
 
         assert result == expected
 
     def test_removes_drawn_tiles_from_pile(self, rng_service) -> None:
         sut = Pile([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15])
-        expected = (15,)
+        expected = (1,)
 
-        sut.draw_rack(rng_service.pick)
+        sut.draw_rack(rng_service.pick_index)
 
         assert sut.tiles == expected
 
@@ -47,6 +56,25 @@ class TestReturnRack:
         assert sut.tiles == expected
 
 
+class TestAsList:
+    def test_returns_copy_of_tiles_list(self) -> None:
+        tiles = [1, 2, 3]
+        sut = Pile(tiles)
+
+        result = sut.as_list()
+
+        assert result == tiles
+        assert result is not tiles
+
+
+class TestEq:
+    def test_when_same_tiles__returns_true(self) -> None:
+        assert Pile([1, 2, 3]) == Pile([1, 2, 3])
+
+    def test_when_different_tiles__returns_false(self) -> None:
+        assert Pile([1, 2, 3]) != Pile([3, 2, 1])
+
+
 class TestHash:
     def test_returns_hash_of_tiles(self) -> None:
         sut = Pile([1, 2, 3])
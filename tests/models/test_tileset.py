@@ -101,6 +101,16 @@ class TestJokersCount:
         assert result == expected
 
 
+class TestWithNewTile:
+    def test_returns_tileset_with_tile_inserted_in_sorted_order(self) -> None:
+        sut = Tileset.create([1, 5, 9])
+        expected = (1, 5, 7, 9)
+
+        result = sut.with_new_tile(7)
+
+        assert result.tiles == expected
+
+
 class TestLen:
     def test_returns_length_of_tiles_list(self) -> None:
         sut = Tileset.create([1, 2, 3])
@@ -24,6 +24,20 @@ class TestGetUserById:
         assert result == expected
 
 
+class TestGetUsersByIds:
+    def test_returns_mapped_db_models(self, sut, session, mapper) -> None:
+        scalars = create_autospec(ScalarResult)
+        scalars.all = Mock(return_value=[Mock(), Mock()])
+        session.scalars = Mock(return_value=scalars)
+        expected = Mock()
+        mapper.to_domain_user = Mock(return_value=expected)
+
+        result = sut.get_users_by_ids(session=session, ids=[uuid4(), uuid4()])
+
+        assert result == [expected, expected]
+        session.scalars.assert_called_once()
+
+
 class TestGetUserByToken:
     def test_when_no_token_found__raises_unauthorized_error(self, sut, session) -> None:
         scalars = create_autospec(ScalarResult)
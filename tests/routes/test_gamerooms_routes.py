@@ -13,12 +13,15 @@ def gamerooms_controller() -> GameroomsController:
 
 
 @pytest.fixture()
-def sut(gamerooms_controller, with_base_context, with_context, app) -> Callable[[], None]:
+def sut(
+    gamerooms_controller, with_base_context, with_context, with_read_only_context, app
+) -> Callable[[], None]:
     def wrapped() -> None:
         attach_gamerooms_routes(
             app=app,
             controller=gamerooms_controller,
             with_context=with_context,
+            with_read_only_context=with_read_only_context,
             with_base_context=with_base_context,
         )
 
@@ -52,6 +55,16 @@ class TestGetGamerooms:
 
         gamerooms_controller.get_gamerooms.assert_called_once()
 
+    def test_rolls_back_session_instead_of_commit(
+        self, sut, gamerooms_controller, flask_client, session
+    ) -> None:
+        gamerooms_controller.get_gamerooms.return_value = []
+        sut()
+        flask_client.get("/gamerooms")
+
+        session.rollback.assert_called_once()
+        session.commit.assert_not_called()
+
     def test_authorizes_user(
         self, sut, gamerooms_controller, flask_client, auth_service
     ) -> None:
@@ -141,3 +154,13 @@ class TestPostGameroomsDisconnect:
         flask_client.post("/gamerooms/disconnect")
 
         gamerooms_controller.disconnect.assert_called_once()
+
+
+class TestPostGameroomsDisconnectBatch:
+    def test_calls_controller_disconnect_batch(
+        self, sut, gamerooms_controller, flask_client
+    ) -> None:
+        sut()
+        flask_client.post("/gamerooms/disconnect_batch")
+
+        gamerooms_controller.disconnect_batch.assert_called_once()
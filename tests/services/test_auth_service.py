@@ -1,5 +1,5 @@
 import string
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 from werkzeug.datastructures import Headers
@@ -92,19 +92,34 @@ class TestAuthorizeEventsServer:
                 headers=Headers((("Authorization", "Bearer letmein"),))
             )
 
-
-class TestAuthorizeMessage:
-    def test_when_secret_is_correct__does_not_raise(
-        self, sut, session, messages_secret
+    def test_when_accepted_header_is_repeated__does_not_parse_token_again(
+        self, sut, events_secret
     ) -> None:
-        with not_raises(UnauthorizedError):
-            sut.authorize_message(secret=messages_secret)
+        headers = Headers((("Authorization", f"Bearer {events_secret}"),))
+        sut.authorize_events_server(headers=headers)
+
+        with patch("src.tuicubserver.services.auth.parse_token") as mocked_parse_token:
+            sut.authorize_events_server(headers=headers)
 
-    def test_when_secret_is_incorrect__raises_unauthorized_error(
-        self, sut, session, messages_secret
+            mocked_parse_token.assert_not_called()
+
+    def test_when_rejected_header_is_repeated__raises_unauthorized_error(
+        self, sut
     ) -> None:
+        headers = Headers((("Authorization", "Bearer letmein"),))
         with pytest.raises(UnauthorizedError):
-            sut.authorize_message(secret="letmein")
+            sut.authorize_events_server(headers=headers)
+
+        with pytest.raises(UnauthorizedError):
+            sut.authorize_events_server(headers=headers)
+
+
+class TestIsMessageAuthorized:
+    def test_when_secret_is_correct__returns_true(self, sut, messages_secret) -> None:
+        assert sut.is_message_authorized(secret=messages_secret) is True
+
+    def test_when_secret_is_incorrect__returns_false(self, sut) -> None:
+        assert sut.is_message_authorized(secret="letmein") is False
 
 
 class TestGenerateToken:
@@ -191,12 +191,8 @@ class TestCreateGame:
     def test_created_game_has_players_with_drawn_racks(self, sut, gameroom) -> None:
         result = sut.create_game(gameroom)
 
-        assert result.game_state.players[0].rack == Tileset.create(
-            [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13]
-        )
-        assert result.game_state.players[1].rack == Tileset.create(
-            [14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27]
-        )
+        assert result.game_state.players[0].rack == Tileset.create(list(range(92, 106)))
+        assert result.game_state.players[1].rack == Tileset.create(list(range(78, 92)))
 
     def test_created_game_has_empty_list_of_made_meld_players(
         self, sut, gameroom
@@ -213,9 +209,7 @@ class TestCreateGame:
     def test_created_game_has_correct_turn(self, sut, gameroom) -> None:
         result = sut.create_game(gameroom)
 
-        assert result.turn.starting_rack == Tileset.create(
-            [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13]
-        )
+        assert result.turn.starting_rack == Tileset.create(list(range(92, 106)))
         assert result.turn.starting_board == Board()
         assert result.turn.revision == 0
 
@@ -10,22 +10,17 @@ def sut() -> RngService:
     return RngService()
 
 
-class TestPick:
-    def test_when_sequence_empty__raises_sequence_empty_error(self, sut) -> None:
+class TestPickIndex:
+    def test_when_size_is_zero__raises_sequence_empty_error(self, sut) -> None:
         with pytest.raises(SequenceEmptyError):
-            sut.pick([])
+            sut.pick_index(0)
 
-    def test_when_sequence_not_empty__picks_random_element(self, sut) -> None:
-        with patch("random.choice") as mocked_choice:
-            sut.pick([1, 2, 3])
-
-            mocked_choice.assert_called_once_with([1, 2, 3])
-
-    def test_when_sequence_not_empty__returns_result_of_random_choice(self, sut) -> None:
-        expected = 4
-        with patch("random.choice", return_value=expected):
-            result = sut.pick([1, 2, 3])
+    def test_when_size_is_positive__returns_result_of_random_randrange(self, sut) -> None:
+        expected = 2
+        with patch("random.randrange", return_value=expected) as mocked_randrange:
+            result = sut.pick_index(3)
 
+            mocked_randrange.assert_called_once_with(3)
             assert result == expected
 
 
@@ -47,7 +47,7 @@ class TestGetValidTilesets:
     def test_returns_valid_tilesets_getter(self, mock_open) -> None:
         fp = Mock()
         mock_open.__enter__.return_value = fp
-        expected = frozenset([(1, 2, 3), (4, 5, 6)])
+        expected = frozenset([bytes((1, 2, 3)), bytes((4, 5, 6))])
 
         with patch("builtins.open", return_value=mock_open) as mocked_open, patch(
             "json.load", return_value=[[1, 2, 3], [4, 5, 6]]
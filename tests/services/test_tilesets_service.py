@@ -23,9 +23,16 @@ def values_cache() -> Cache:
 
 
 @pytest.fixture()
-def valid_tilesets() -> Callable[[], frozenset[tuple[int, ...]]]:
+def valid_tilesets() -> Callable[[], frozenset[bytes]]:
     return lambda: frozenset(
-        ((1, 2, 3), (1, 2, 12), (1, 11, 12), (4, 5, 6), (1, 2, 3, 4, 5, 6))
+        bytes(tileset)
+        for tileset in (
+            (1, 2, 3),
+            (1, 2, 12),
+            (1, 11, 12),
+            (4, 5, 6),
+            (1, 2, 3, 4, 5, 6),
+        )
     )
 
 
@@ -1,14 +1,26 @@
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, create_autospec, patch
 
 import pytest
+from theine import Cache
 
 from src.tuicubserver.models.user import User, UserToken
 from src.tuicubserver.services.users import UsersService
 
 
 @pytest.fixture()
-def sut(users_repository, auth_service) -> UsersService:
-    return UsersService(auth_service=auth_service, users_repository=users_repository)
+def tokens_cache() -> Cache:
+    cache = create_autospec(Cache)
+    cache.get = Mock(return_value=None)
+    return cache
+
+
+@pytest.fixture()
+def sut(users_repository, auth_service, tokens_cache) -> UsersService:
+    return UsersService(
+        auth_service=auth_service,
+        users_repository=users_repository,
+        tokens_cache=tokens_cache,
+    )
 
 
 class TestCreateUser:
@@ -76,6 +88,27 @@ class TestGetUserToken:
             session=session, token=expected
         )
 
+    def test_when_token_cached__returns_cached_token_without_querying(
+        self, sut, session, users_repository, tokens_cache
+    ) -> None:
+        expected = Mock()
+        tokens_cache.get = Mock(return_value=expected)
+
+        result = sut.get_user_token(session, "foo")
+
+        assert result == expected
+        users_repository.get_user_token_by_token.assert_not_called()
+
+    def test_when_token_not_cached__caches_queried_token(
+        self, sut, session, users_repository, tokens_cache
+    ) -> None:
+        expected = Mock()
+        users_repository.get_user_token_by_token = Mock(return_value=expected)
+
+        sut.get_user_token(session, "foo")
+
+        tokens_cache.set.assert_called_once_with("foo", expected)
+
 
 class TestGetUserById:
     def test_returns_user_token(self, sut, session, users_repository) -> None:
@@ -96,3 +129,19 @@ class TestGetUserById:
         users_repository.get_user_by_id.assert_called_once_with(
             session=session, id=expected
         )
+
+
+class TestGetUsersByIds:
+    def test_queries_repository_with_passed_ids(
+        self, sut, session, users_repository
+    ) -> None:
+        expected = [Mock()]
+        users_repository.get_users_by_ids = Mock(return_value=expected)
+        user_ids = [Mock()]
+
+        result = sut.get_users_by_ids(session, user_ids)
+
+        users_repository.get_users_by_ids.assert_called_once_with(
+            session=session, ids=user_ids
+        )
+        assert result == expected
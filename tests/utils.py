@@ -3,15 +3,6 @@ from contextlib import contextmanager
 import pytest
 
 
-class AsyncIter:
-    def __init__(self, items):
-        self.items = items
-
-    async def __aiter__(self):
-        for item in self.items:
-            yield item
-
-
 @contextmanager
 def not_raises(exception):
     try: